@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark Apify run completion detection against the fake Apify API
+
+Compares the old fixed-interval status polling with the waitForFinish
+long-poll, reading each run's time-to-result from the recorded apify_metrics,
+and shows how soon streaming the dataset hands over the first item.
+
+Usage:
+    python scripts/dev/bench_apify_wait.py [--runs 3] [--run-seconds 1.5] [--poll-interval 10]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.instagram.apify_scraper import ApifyInstagramScraper
+from src.utils.apify_runs import apify_metrics, iter_run_items, wait_for_run
+from tests.fixtures.fake_apify_server import FakeApifyServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--run-seconds', type=float, default=1.5)
+    parser.add_argument('--poll-interval', type=float, default=10.0, help='Sleep between polls in the old loop')
+    args = parser.parse_args()
+
+    apify_metrics.reset()
+    with FakeApifyServer(run_seconds=args.run_seconds, items=[{'n': i} for i in range(20)]) as apify:
+        scraper = ApifyInstagramScraper('token')
+        scraper.base_url = apify.base_url
+
+        print(f"🧪 {args.runs} actor runs of {args.run_seconds:.1f}s each")
+        print("=" * 60)
+
+        modes = [
+            ('fixed_poll', {'wait_for_finish': 0, 'min_interval': args.poll_interval,
+                            'max_interval': args.poll_interval}),
+            ('long_poll', {})
+        ]
+        requests_by_mode = {}
+        for mode, options in modes:
+            before = apify.stats['status_requests']
+            for _ in range(args.runs):
+                run_id = apify.start_run('actor', {})['id']
+                wait_for_run(scraper.session, apify.base_url, run_id, metric=mode, **options)
+            requests_by_mode[mode] = apify.stats['status_requests'] - before
+
+        for _ in range(args.runs):
+            run_id = apify.start_run('actor', {})['id']
+            for _item in iter_run_items(scraper.session, apify.base_url, run_id, metric='streamed'):
+                pass
+
+    tools = apify_metrics.snapshot()['tools']
+    for mode, _ in modes:
+        latency = tools[mode]['latency_ms']
+        print(f"{mode:11s} time-to-result mean {latency['mean'] / 1000:6.2f}s, max {latency['max'] / 1000:6.2f}s, "
+              f"{requests_by_mode[mode] / args.runs:.1f} status requests/run")
+    dead_time = tools['fixed_poll']['latency_ms']['mean'] - tools['long_poll']['latency_ms']['mean']
+    print(f"📊 Dead time saved per run: {dead_time / 1000:.2f}s")
+    first_item = tools['streamed_first_item']['latency_ms']['mean']
+    print(f"📥 Streamed dataset: first item after {first_item / 1000:.2f}s instead of "
+          f"{tools['long_poll']['latency_ms']['mean'] / 1000:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Benchmark import scenarios against the fake AIWU endpoint
+
+Runs the WordPress side of an Instagram import (image upload, post creation,
+meta, featured image), the ImportEngine every import route uses, and a
+PostTracker sync against tests/fixtures/fake_aiwu_server.py, so client
+changes can be compared offline with realistic latency, jitter and error
+rates.
+
+Usage:
+    python scripts/dev/bench_import_scenarios.py [--posts 40] [--latency-ms 40] [--jitter-ms 10]
+                                                 [--error-rate 0.0] [--workers 4]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.instagram.import_engine import ImportEngine
+from src.integrations.wordpress.client import WordPressMCPClient
+from src.integrations.wordpress.concurrency import AIMDLimiter
+from src.utils import instagram_cdn
+from src.utils.import_pipeline import ImportPipeline, PipelineStage
+from src.utils.media_index import MediaIndex
+from src.utils.post_tracker import PostTracker
+from tests.fixtures.fake_aiwu_server import FakeAIWUServer, MEDIA_REST_PATH
+
+
+def sample_meta(i):
+    return {
+        'instagram_shortcode': f'BENCH{i:05d}',
+        'instagram_username': 'example_user',
+        'instagram_likes': i * 3,
+        'instagram_comments': i,
+        'import_method': 'bench'
+    }
+
+
+def upload_image(server, session, i):
+    """Download a fake CDN image and upload it through the REST media endpoint"""
+    image = session.get(server.image_url(f'post_{i}'), timeout=30).content
+    response = session.post(server.base_url + MEDIA_REST_PATH,
+                            files={'file': (f'instagram_{i}.jpg', image, 'image/jpeg')}, timeout=60)
+    return response.json()['id'] if response.status_code == 201 else None
+
+
+def import_legacy(server, client, i, session):
+    """One call per step: create, one wp_update_post_meta per key, featured image"""
+    media_id = upload_image(server, session, i)
+    result = client.call_mcp_function('wp_create_post', {
+        'post_title': f'Bench post {i}', 'post_content': 'Body', 'post_status': 'draft', 'post_type': 'post'
+    })
+    post_id = client.extract_post_id(result)
+    for key, value in sample_meta(i).items():
+        client.call_mcp_function('wp_update_post_meta', {'ID': post_id, 'key': key, 'value': value})
+    if media_id:
+        client.set_featured_image(post_id, media_id)
+
+
+def import_full(server, client, i, session):
+    """create_post_full: meta_input plus one batched follow-up"""
+    media_id = upload_image(server, session, i)
+    client.create_post_full(f'Bench post {i}', 'Body', meta=sample_meta(i), featured_media_id=media_id)
+
+
+def run_scenario(server, name, import_one, posts, workers=1, accept_batches=True):
+    server.accept_batches = accept_batches
+    server.reset_stats()
+    client = WordPressMCPClient(server.mcp_url, server.token, limiter=AIMDLimiter(initial_limit=workers,
+                                                                                 max_limit=max(workers, 1)))
+    session = requests.Session()
+
+    start = time.perf_counter()
+    failures = 0
+    if workers == 1:
+        for i in range(posts):
+            try:
+                import_one(server, client, i, session)
+            except Exception:
+                failures += 1
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(import_one, server, client, i, requests.Session()) for i in range(posts)]
+            failures = sum(1 for f in futures if f.exception() is not None)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:38s} {elapsed:7.2f}s  {posts / elapsed:6.1f} posts/s  "
+          f"{server.stats['http_requests']:5d} HTTP  {server.tool_call_count():5d} tool calls  "
+          f"{failures:3d} failed")
+    return client
+
+
+def run_pipelined(server, posts, workers):
+    """Same import as create_post_full, split into fetch/upload/create/finalize stages"""
+    server.reset_stats()
+    client = WordPressMCPClient(server.mcp_url, server.token, limiter=AIMDLimiter(initial_limit=workers,
+                                                                                 max_limit=max(workers, 1)))
+    sessions = threading.local()
+
+    def session():
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+        return sessions.session
+
+    def fetch(job):
+        job['image'] = session().get(server.image_url(f"post_{job['item']}"), timeout=30).content
+
+    def upload(job):
+        response = session().post(server.base_url + MEDIA_REST_PATH,
+                                  files={'file': (f"instagram_{job['item']}.jpg", job.pop('image'), 'image/jpeg')},
+                                  timeout=60)
+        job['media_id'] = response.json()['id'] if response.status_code == 201 else None
+
+    def create(job):
+        job['created'] = client.create_post_with_meta(f"Bench post {job['item']}", 'Body',
+                                                      meta=sample_meta(job['item']))
+
+    def finalize(job):
+        created = job['created']
+        client.finish_post(created['post_id'], created['wordpress_post'], sample_meta(job['item']), job['media_id'])
+
+    pipeline = ImportPipeline([PipelineStage('fetch', fetch, workers), PipelineStage('upload', upload, workers),
+                               PipelineStage('create', create, workers), PipelineStage('finalize', finalize, workers)])
+    start = time.perf_counter()
+    jobs = pipeline.run(range(posts))
+    elapsed = time.perf_counter() - start
+    failures = sum(1 for job in jobs if job['error'])
+
+    print(f"{f'Pipeline, {workers} worker(s) per stage':38s} {elapsed:7.2f}s  {posts / elapsed:6.1f} posts/s  "
+          f"{server.stats['http_requests']:5d} HTTP  {server.tool_call_count():5d} tool calls  "
+          f"{failures:3d} failed")
+
+
+def run_engine(server, posts, workers):
+    """ImportEngine.import_posts end to end: CDN download, deduped REST upload, create, finalize"""
+    server.reset_stats()
+    client = WordPressMCPClient(server.mcp_url, server.token, limiter=AIMDLimiter(initial_limit=workers,
+                                                                                 max_limit=max(workers, 1)))
+    scraped = [{'shortcode': f'BENCH{i:05d}', 'username': 'example_user', 'caption': f'Bench post {i}\n#bench',
+                'hashtags': ['bench'], 'likes_count': i * 3, 'comments_count': i, 'post_url': '',
+                'image_url': server.image_url(f'post_{i}')} for i in range(posts)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault('WORDPRESS_PASSWORD', 'bench')
+        instagram_cdn._shared_client = instagram_cdn.InstagramCDNClient(
+            pool_size=workers * 2, warmup_url=server.base_url + '/', cookie_path=os.path.join(tmp, 'cookies.txt'))
+        engine = ImportEngine(client, post_tracker=PostTracker(os.path.join(tmp, 'tracker.db')),
+                              media_index=MediaIndex(os.path.join(tmp, 'media_index.db')),
+                              workers=dict.fromkeys(ImportEngine.DEFAULT_WORKERS, workers))
+        start = time.perf_counter()
+        result = engine.import_posts(scraped, import_method='bench')
+        elapsed = time.perf_counter() - start
+
+    print(f"{f'ImportEngine, {workers} worker(s) per stage':38s} {elapsed:7.2f}s  {posts / elapsed:6.1f} posts/s  "
+          f"{server.stats['http_requests']:5d} HTTP  {server.tool_call_count():5d} tool calls  "
+          f"{len(result['failed']):3d} failed")
+
+
+def run_sync(server, client, posts):
+    """PostTracker sync over every post created so far"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = PostTracker(os.path.join(tmp, 'tracker.db'))
+        with server.wordpress.lock:
+            post_ids = sorted(server.wordpress.posts)[:posts]
+        for post_id in post_ids:
+            tracker.add_instagram_post({'shortcode': f'SYNC{post_id}', 'username': 'example_user'})
+            tracker.add_wordpress_post(post_id, 'Stale title', 'draft')
+            tracker.create_mapping(f'SYNC{post_id}', post_id)
+
+        server.reset_stats()
+        start = time.perf_counter()
+        result = tracker.sync_with_wordpress(client)
+        elapsed = time.perf_counter() - start
+
+    print(f"{'PostTracker.sync_with_wordpress':38s} {elapsed:7.2f}s  {len(post_ids)} mappings  "
+          f"{server.stats['http_requests']:5d} HTTP  {result}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts', type=int, default=40)
+    parser.add_argument('--latency-ms', type=float, default=40.0)
+    parser.add_argument('--jitter-ms', type=float, default=10.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    with FakeAIWUServer(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                        error_rate=args.error_rate, seed=42) as server:
+        print(f"🧪 {args.posts} posts per scenario, {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms latency, "
+              f"{args.error_rate:.0%} injected errors")
+        print("=" * 100)
+
+        run_scenario(server, 'Legacy: one call per meta key', import_legacy, args.posts)
+        run_scenario(server, 'create_post_full, batches rejected', import_full, args.posts, accept_batches=False)
+        run_scenario(server, 'create_post_full', import_full, args.posts)
+        client = run_scenario(server, f'create_post_full, {args.workers} workers', import_full, args.posts,
+                              workers=args.workers)
+        run_pipelined(server, args.posts, 1)
+        run_pipelined(server, args.posts, args.workers)
+        run_engine(server, args.posts, 1)
+        run_engine(server, args.posts, args.workers)
+        run_sync(server, client, args.posts)
+
+
+if __name__ == '__main__':
+    main()
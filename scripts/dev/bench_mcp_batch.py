@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON-RPC batching against the fake AIWU endpoint
+
+Compares one tools/call POST per operation with WordPressMCPClient.call_many,
+which packs the same operations into batch requests.
+
+Usage:
+    python scripts/dev/bench_mcp_batch.py [--calls 200] [--latency-ms 25] [--batch-size 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.client import WordPressMCPClient
+from tests.fixtures.fake_aiwu_server import FakeAIWUServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=25.0)
+    parser.add_argument('--batch-size', type=int, default=50)
+    args = parser.parse_args()
+
+    with FakeAIWUServer(latency=args.latency_ms / 1000) as server:
+        client = WordPressMCPClient(server.mcp_url, server.token)
+        post_id = client.extract_post_id(client.create_post('Bench', 'Body'))
+        calls = [('wp_update_post_meta', {'ID': post_id, 'key': f'key_{i}', 'value': i}) for i in range(args.calls)]
+
+        print(f"🧪 {args.calls} tools/call requests, {args.latency_ms:.0f} ms simulated server latency")
+        print("=" * 60)
+
+        server.reset_stats()
+        start = time.perf_counter()
+        for method, params in calls:
+            client.call_mcp_function(method, params)
+        single_time = time.perf_counter() - start
+        single_posts = server.stats['http_requests']
+
+        server.reset_stats()
+        start = time.perf_counter()
+        for i in range(0, len(calls), args.batch_size):
+            client.call_many(calls[i:i + args.batch_size])
+        batch_time = time.perf_counter() - start
+        batch_posts = server.stats['http_requests']
+
+    print(f"Single calls: {single_posts:4d} HTTP round-trips, {single_time:7.3f}s")
+    print(f"call_many:    {batch_posts:4d} HTTP round-trips, {batch_time:7.3f}s")
+    print(f"📊 Speedup: {single_time / batch_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
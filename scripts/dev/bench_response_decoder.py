@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark AIWU MCP response decoding on recorded payloads
+
+Compares the previous decode path (response.json(), json.loads on the text,
+then a re.search(r'\\{.*\\}') fallback) with response_decoder, using the
+envelopes in tests/fixtures/aiwu_responses.json. The wp_get_posts payload is
+repeated to simulate large listings.
+
+Usage:
+    python scripts/dev/bench_response_decoder.py [--posts 100] [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress import response_decoder
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', '..', 'tests', 'fixtures', 'aiwu_responses.json')
+
+
+def legacy_decode(body):
+    """Decode path used before response_decoder, including the health_check re-parse"""
+    result = json.loads(body)['result']
+    text = result['content'][0]['text']
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        if json_match:
+            try:
+                return json.loads(json_match.group())
+            except json.JSONDecodeError:
+                pass
+        return text
+
+
+def new_decode(body):
+    return response_decoder.unwrap_result(response_decoder.loads(body)['result'])
+
+
+def load_payloads(post_count):
+    with open(FIXTURES, encoding='utf-8') as f:
+        fixtures = json.load(f)
+
+    posts_envelope = fixtures['wp_get_posts']
+    posts = json.loads(posts_envelope['result']['content'][0]['text'])
+    listing = [dict(posts[i % len(posts)], ID=1000 + i) for i in range(post_count)]
+    posts_envelope['result']['content'][0]['text'] = json.dumps(listing)
+
+    return {name: json.dumps(envelope).encode() for name, envelope in fixtures.items() if 'result' in envelope}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.posts)
+
+    print(f"🧪 JSON backend: {response_decoder.JSON_BACKEND}, {args.repeat} decodes per payload")
+    print("=" * 60)
+
+    for name, body in payloads.items():
+        assert legacy_decode(body) == new_decode(body), f"decoders disagree on {name}"
+        legacy = timeit.timeit(lambda: legacy_decode(body), number=args.repeat)
+        new = timeit.timeit(lambda: new_decode(body), number=args.repeat)
+        per_call = 1e6 / args.repeat
+        print(f"{name:22s} {len(body):8d} B  legacy {legacy * per_call:8.1f} µs  "
+              f"new {new * per_call:8.1f} µs  ({legacy / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark client memory during concurrent WordPress media uploads
+
+Uploads the same set of files to the fake AIWU REST media endpoint with N
+concurrent workers, once with the old in-memory approach (read the file,
+build a multipart body) and once streaming from disk (src/utils/media_stream.py),
+and reports peak RSS growth and peak traced Python allocations.
+
+Each mode runs in its own child process so RSS high-water marks don't mix, and
+the fake server runs in a separate process so its memory isn't counted.
+
+Usage:
+    python scripts/dev/bench_upload_memory.py [--uploads 20] [--workers 20] [--size-mb 8]
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, ROOT)
+
+from src.utils.media_stream import stream_upload
+from tests.fixtures.fake_aiwu_server import MEDIA_REST_PATH
+
+HEADERS = {'Authorization': 'Basic YWRtaW46c2VjcmV0'}
+
+
+def current_rss():
+    """Resident set size in bytes (Linux), falling back to the peak from getrusage"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def upload_in_memory(upload_url, path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return requests.post(upload_url, files={'file': (os.path.basename(path), data, 'video/mp4')},
+                         headers=HEADERS, timeout=120)
+
+
+def upload_streaming(upload_url, path):
+    return stream_upload(requests, upload_url, path, mime_type='video/mp4', headers=HEADERS, timeout=120)
+
+
+def run_mode(mode, base_url, paths, workers):
+    """Upload every file with one mode and report memory (runs in a child process)"""
+    upload = upload_in_memory if mode == 'memory' else upload_streaming
+    upload_url = base_url + MEDIA_REST_PATH
+
+    # Warm up imports and the connection pool before taking the baseline
+    requests.get(base_url, timeout=10)
+    baseline = current_rss()
+    peak = [baseline]
+    done = threading.Event()
+
+    def sample():
+        while not done.is_set():
+            peak[0] = max(peak[0], current_rss())
+            time.sleep(0.005)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(lambda path: upload(upload_url, path).status_code, paths))
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    done.set()
+    sampler.join()
+
+    return {
+        'mode': mode,
+        'uploaded': statuses.count(201),
+        'seconds': round(elapsed, 2),
+        'peak_rss_growth_mb': round((peak[0] - baseline) / 2**20, 1),
+        'peak_traced_mb': round(traced_peak / 2**20, 1)
+    }
+
+
+def start_fake_server():
+    """Start the fake AIWU server in its own process and return (process, base_url)"""
+    process = subprocess.Popen([sys.executable, '-u', os.path.join(ROOT, 'tests', 'fixtures', 'fake_aiwu_server.py')],
+                               stdout=subprocess.PIPE, text=True, cwd=ROOT)
+    line = process.stdout.readline()
+    match = re.search(r'(http://[^/\s]+)', line)
+    if not match:
+        process.kill()
+        raise Exception(f"Fake AIWU server did not start: {line!r}")
+    return process, match.group(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--uploads', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=20)
+    parser.add_argument('--size-mb', type=float, default=8)
+    parser.add_argument('--mode', choices=['memory', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    parser.add_argument('--files', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.base_url, args.files, args.workers)))
+        return
+
+    server, base_url = start_fake_server()
+    try:
+        with tempfile.TemporaryDirectory(prefix='bench_upload_') as tmp_dir:
+            paths = []
+            size = int(args.size_mb * 2**20)
+            for i in range(args.uploads):
+                path = os.path.join(tmp_dir, f'clip_{i}.mp4')
+                with open(path, 'wb') as f:
+                    for offset in range(0, size, 2**20):
+                        f.write(os.urandom(min(2**20, size - offset)))
+                paths.append(path)
+
+            print(f"📦 {args.uploads} uploads x {args.size_mb} MB, {args.workers} concurrent workers")
+            print(f"{'mode':<8} {'uploaded':>8} {'seconds':>8} {'peak RSS +MB':>13} {'peak traced MB':>15}")
+            for mode in ('memory', 'stream'):
+                output = subprocess.run([sys.executable, __file__, '--mode', mode, '--base-url', base_url,
+                                         '--workers', str(args.workers), '--files', *paths],
+                                        capture_output=True, text=True, check=True).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                print(f"{result['mode']:<8} {result['uploaded']:>8} {result['seconds']:>8} "
+                      f"{result['peak_rss_growth_mb']:>13} {result['peak_traced_mb']:>15}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,6 @@ Handles Apify-based Instagram scraping endpoints
 
 from flask import Blueprint, request, jsonify, session
 import logging
-from datetime import datetime
 import os
 
 # Import our integrations
@@ -13,58 +12,6 @@ from ..integrations.instagram.apify_scraper import ApifyInstagramScraper
 
 logger = logging.getLogger(__name__)
 
-def format_instagram_post_content(post, username):
-    """
-    Format Instagram post content with clean, readable styling
-    """
-    caption = post.get('caption', '').strip()
-    hashtags = post.get('hashtags', [])
-    likes_count = post.get('likes_count', 0)
-    comments_count = post.get('comments_count', 0)
-    date_posted = post.get('date_posted', 'Unknown')
-    post_url = post.get('post_url', '')
-    
-    # Split caption and hashtags
-    caption_lines = caption.split('\n')
-    main_caption = []
-    caption_hashtags = []
-    
-    for line in caption_lines:
-        if line.strip().startswith('#') or all(word.startswith('#') for word in line.strip().split() if word):
-            caption_hashtags.extend([word for word in line.split() if word.startswith('#')])
-        else:
-            main_caption.append(line)
-    
-    # Combine hashtags from caption and metadata
-    all_hashtags = list(set(caption_hashtags + hashtags))
-    
-    # Build clean, readable content
-    content_parts = []
-    
-    # Main caption (clean, without hashtags)
-    clean_caption = '\n'.join(main_caption).strip()
-    if clean_caption:
-        content_parts.append(clean_caption)
-    
-    # Add hashtags as a clean list
-    if all_hashtags:
-        hashtag_text = ' '.join([f'#{tag.lstrip("#")}' for tag in all_hashtags[:10]])
-        content_parts.append(f"\n🏷️ **Tags:** {hashtag_text}")
-    
-    # Add Instagram metadata in a clean format
-    metadata_parts = [
-        "---",
-        f"📸 **Instagram Post by @{username}**",
-        f"📅 **Posted:** {date_posted}",
-        f"❤️ **{likes_count:,} likes** • 💬 **{comments_count:,} comments**",
-        f"🔗 [**View Original on Instagram**]({post_url})",
-        "---"
-    ]
-    
-    content_parts.extend(metadata_parts)
-    
-    return '\n\n'.join(content_parts)
-
 # Create Blueprint for Instagram routes
 instagram_bp = Blueprint('instagram', __name__, url_prefix='/api/instagram')
 
@@ -220,101 +167,19 @@ def import_apify_to_wordpress():
         if not posts:
             return jsonify({'error': 'Posts data is required'}), 400
         
-        # Get MCP client from Flask app context
+        # Get the shared import engine from Flask app context
         from flask import current_app
-        mcp_client = current_app.config.get('mcp_client')
-        
-        imported_posts = []
-        
-        for post in posts:
-            try:
-                logger.info(f"Importing Apify post: {post.get('shortcode', 'unknown')}")
-                
-                # Upload image to WordPress media library
-                media_id = None
-                if post.get('image_url'):
-                    media_result = mcp_client.upload_media(
-                        url=post['image_url'],
-                        title=f"Instagram import - @{post.get('username')} - {post.get('caption', '')[:50]}",
-                        alt=post.get('caption', '')[:100]
-                    )
-                    
-                    if media_result and 'id' in media_result:
-                        media_id = media_result['id']
-                
-                # Create WordPress post title
-                post_title = f"Instagram Post from @{post.get('username')} - {datetime.now().strftime('%Y-%m-%d')}"
-                if post.get('caption'):
-                    # Use first line of caption as title if available
-                    first_line = post['caption'].split('\n')[0][:50]
-                    if first_line and not first_line.startswith('#'):
-                        post_title = first_line
-                
-                # Enhanced content with beautiful Instagram-style formatting
-                content = format_instagram_post_content(post, post.get('username', 'unknown'))
-                
-                # Create WordPress post
-                wp_result = mcp_client.create_post(
-                    title=post_title,
-                    content=content,
-                    status='draft'  # Start as draft
-                )
-                
-                # Parse post ID from response
-                post_id = None
-                if isinstance(wp_result, dict) and 'ID' in wp_result:
-                    post_id = wp_result['ID']
-                elif isinstance(wp_result, str) and 'Post created ID' in wp_result:
-                    import re
-                    match = re.search(r'Post created ID (\d+)', wp_result)
-                    if match:
-                        post_id = int(match.group(1))
-                
-                # Add enhanced Instagram metadata
-                if post_id:
-                    meta_fields = {
-                        'instagram_post_url': post.get('post_url', ''),
-                        'instagram_id': post.get('id', ''),
-                        'instagram_shortcode': post.get('shortcode', ''),
-                        'instagram_username': post.get('username', ''),
-                        'instagram_hashtags': ','.join(post.get('hashtags', [])),
-                        'instagram_media_type': post.get('media_type', 'IMAGE'),
-                        'instagram_likes_count': str(post.get('likes_count', 0)),
-                        'instagram_comments_count': str(post.get('comments_count', 0)),
-                        'instagram_date_posted': post.get('date_posted', ''),
-                        'import_method': 'apify_scraper',
-                        'import_date': datetime.now().isoformat(),
-                        'apify_raw_data': str(post.get('raw_data', {}))[:1000]  # Truncated raw data
-                    }
-                    
-                    # Add metadata as custom fields
-                    for key, value in meta_fields.items():
-                        try:
-                            mcp_client.call_mcp_function('wp_update_post_meta', {
-                                'ID': post_id,
-                                'key': key,
-                                'value': value
-                            })
-                        except Exception as e:
-                            logger.warning(f"Could not add meta field {key}: {e}")
-                
-                # Set featured image if we have one
-                if media_id and post_id:
-                    try:
-                        mcp_client.set_featured_image(post_id, media_id)
-                    except Exception as e:
-                        logger.warning(f"Could not set featured image: {e}")
-                
-                imported_posts.append({
-                    'instagram_post': post,
-                    'wordpress_post': wp_result,
-                    'media_id': media_id,
-                    'post_id': post_id
-                })
-                
-            except Exception as e:
-                logger.error(f"Error importing post {post.get('shortcode', 'unknown')}: {e}")
-                continue
+        import_engine = current_app.config.get('import_engine')
+        
+        result = import_engine.import_posts(posts, import_method='apify_scraper', status='draft')
+        skipped_posts = result['skipped']
+        imported_posts = [{
+            'instagram_post': imported['instagram_post'],
+            'media_id': imported['media_id'],
+            'post_id': imported['post_id'],
+            'title': imported['title'],
+            'mcp_calls': imported['mcp_calls']
+        } for imported in result['imported']]
         
         # Get WordPress base URL for drafts link
         wordpress_base_url = current_app.config.get('WORDPRESS_URL', '').replace('/wp-json/mcp/v1/sse', '')
@@ -323,10 +188,16 @@ def import_apify_to_wordpress():
         response_data = {
             'success': True,
             'imported_count': len(imported_posts),
+            'skipped_count': len(skipped_posts),
             'total_posts': len(posts),
             'imported_posts': imported_posts,
+            'skipped_posts': skipped_posts,
+            'failed_posts': result['failed'],
+            'mcp_calls_total': result['mcp_calls_total'],
             'message': f'Successfully imported {len(imported_posts)} of {len(posts)} posts to WordPress'
         }
+        if skipped_posts:
+            response_data['message'] += f' ({len(skipped_posts)} already imported)'
         
         # Add drafts link if available
         if drafts_url:
@@ -339,9 +210,37 @@ def import_apify_to_wordpress():
         logger.error(f"Error importing to WordPress: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@instagram_bp.route('/import/plan', methods=['POST'])
+def plan_import():
+    """Dry run of an import: new vs tracked posts, cached media, call counts, cost and time estimates"""
+    from flask import current_app
+    planner = current_app.config.get('import_planner')
+    
+    try:
+        data = request.json or {}
+        posts = data.get('posts')
+        username = (data.get('username') or '').replace('@', '') or None
+        
+        if posts is None and not username:
+            return jsonify({'error': 'Posts or username is required'}), 400
+        if posts is None and not planner.scraper:
+            return jsonify({'error': 'Apify not configured'}), 400
+        
+        plan = planner.plan(posts=posts, username=username, limit=int(data.get('limit', 20)),
+                            scrape=bool(data.get('scrape', False)))
+        
+        return jsonify({
+            'success': True,
+            'plan': plan
+        })
+        
+    except Exception as e:
+        logger.error(f"Error planning import: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @instagram_bp.route('/apify/bulk-import', methods=['POST'])
 def bulk_import_user():
-    """Scrape user posts via Apify and import directly to WordPress"""
+    """Queue a background job that scrapes user posts via Apify and imports them to WordPress"""
     from flask import current_app
     apify_manager = current_app.config.get('apify_manager')
     
@@ -356,28 +255,35 @@ def bulk_import_user():
         if not username:
             return jsonify({'error': 'Username is required'}), 400
         
-        logger.info(f"Bulk import: scraping and importing @{username}, limit: {limit}")
+        logger.info(f"Bulk import: queueing scrape and import of @{username}, limit: {limit}")
         
         # Create progress session for bulk import
         from .progress_routes import create_progress_session
         progress_session_id = create_progress_session(f"Bulk Import @{username}", 100)
         
-        # Use the manager's built-in bulk import method with progress tracking
-        result = apify_manager.import_user_posts_to_wordpress(username, limit, auto_publish=False, progress_session_id=progress_session_id)
+        job = current_app.config['job_queue'].submit(
+            'apify_bulk_import',
+            {'username': username, 'limit': limit, 'auto_publish': False},
+            site=current_app.config.get('WORDPRESS_URL'),
+            username=username,
+            progress_session_id=progress_session_id
+        )
         
-        # Add drafts URL if import was successful
-        if result.get('success') and result.get('imported_count', 0) > 0:
-            wordpress_base_url = current_app.config.get('WORDPRESS_URL', '').replace('/wp-json/mcp/v1/sse', '')
-            if wordpress_base_url:
-                drafts_url = f"{wordpress_base_url}/wp-admin/edit.php?post_status=draft&post_type=post"
-                result['drafts_url'] = drafts_url
-                result['message'] += f'\n\n📝 View and publish your drafts: {drafts_url}'
+        response_data = {
+            'success': True,
+            'job_id': job['id'],
+            'status': job['status'],
+            'status_url': f"/api/jobs/{job['id']}",
+            'progress_session_id': progress_session_id,
+            'message': f'Bulk import of @{username} queued'
+        }
         
-        # Add progress session ID to response
-        result['progress_session_id'] = progress_session_id
+        # Add drafts URL so the client can link to the imported drafts
+        wordpress_base_url = current_app.config.get('WORDPRESS_URL', '').replace('/wp-json/mcp/v1/sse', '')
+        if wordpress_base_url:
+            response_data['drafts_url'] = f"{wordpress_base_url}/wp-admin/edit.php?post_status=draft&post_type=post"
         
-        return jsonify(result)
-
+        return jsonify(response_data), 202
         
     except Exception as e:
         logger.error(f"Error in bulk import: {str(e)}")
@@ -628,7 +534,8 @@ def get_image_cache_stats():
         stats = image_cache.get_cache_stats()
         return jsonify({
             'success': True,
-            'cache_stats': stats
+            'cache_stats': stats,
+            'cdn_stats': image_cache.cdn.get_stats()
         })
         
     except Exception as e:
@@ -0,0 +1,88 @@
+"""
+Background job API routes
+Status, listing and cancellation for jobs queued by long-running endpoints
+"""
+
+from flask import Blueprint, request, jsonify, current_app
+import logging
+
+from ..utils.job_queue import RESUMABLE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+
+@jobs_bp.route('', methods=['GET'])
+def list_jobs():
+    """List recent jobs, optionally filtered by ?status="""
+    job_queue = current_app.config['job_queue']
+    status = request.args.get('status')
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify({
+        'success': True,
+        'jobs': job_queue.list_jobs(status=status, limit=limit),
+        'stats': job_queue.get_stats()
+    })
+
+
+@jobs_bp.route('/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get a job's status and, once finished, its result"""
+    job = current_app.config['job_queue'].get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@jobs_bp.route('/<job_id>/results', methods=['GET'])
+def get_job_results(job_id):
+    """Page through a job's per-post results (?outcome=imported|skipped|failed, ?offset=, ?limit=)"""
+    job_queue = current_app.config['job_queue']
+    if not job_queue.get(job_id):
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    offset = max(0, request.args.get('offset', 0, type=int))
+    limit = min(max(1, request.args.get('limit', 100, type=int)), 500)
+    page = job_queue.get_results(job_id, outcome=request.args.get('outcome'), offset=offset, limit=limit)
+    return jsonify({'success': True, 'job_id': job_id, **page})
+
+
+@jobs_bp.route('/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a job that is still queued"""
+    job_queue = current_app.config['job_queue']
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if not job_queue.cancel(job_id):
+        return jsonify({'success': False, 'error': f"Job is {job['status']} and can no longer be cancelled"}), 409
+    return jsonify({'success': True, 'message': 'Job cancelled'})
+
+
+@jobs_bp.route('/<job_id>/resume', methods=['POST'])
+def resume_job(job_id):
+    """Resume a finished job from its checkpoints, e.g. after a failure or restart"""
+    job_queue = current_app.config['job_queue']
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if job['status'] not in RESUMABLE_STATUSES:
+        return jsonify({'success': False, 'error': f"Job is {job['status']} and cannot be resumed"}), 409
+
+    from .progress_routes import create_progress_session
+    progress_session_id = create_progress_session(f"Resume {job['job_type']} {job_id[:8]}", 100)
+    resumed = job_queue.resume_job(job_id, progress_session_id=progress_session_id)
+    if not resumed:
+        return jsonify({'success': False, 'error': 'Job was picked up by another request'}), 409
+
+    response = {
+        'success': True,
+        'job_id': job_id,
+        'status': resumed['status'],
+        'progress_session_id': progress_session_id,
+        'message': 'Job queued to resume'
+    }
+    checkpoints = current_app.config.get('import_checkpoints')
+    if checkpoints and checkpoints.has_job(job_id):
+        response['checkpoints'] = checkpoints.summary(job_id)
+    return jsonify(response), 202
@@ -19,6 +19,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.integrations.instagram.manual_import import InstagramManualImport
 from src.integrations.instagram.apify_scraper import ApifyInstagramScraper, ApifyInstagramManager
+from src.integrations.instagram.import_engine import ImportEngine
+from src.integrations.instagram.import_planner import ImportPlanner
+from src.integrations.wordpress.client import WordPressMCPClient
+from src.integrations.wordpress.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.integrations.wordpress.concurrency import AIMDLimiter
+from src.utils.apify_runs import apify_metrics
+from src.utils.import_checkpoints import ImportCheckpoints
+from src.utils.job_queue import JobQueue
+from src.utils.instagram_cdn import configure_cdn_client
+from src.utils.media_index import get_media_index
+from src.utils.post_tracker import PostTracker
 # from src.integrations.instagram.oauth import InstagramOAuth, InstagramTokenManager  # Commented out - using manual import instead
 
 # Configure logging
@@ -28,406 +39,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class WordPressMCPClient:
-    """Direct MCP client for WordPress AIWU plugin"""
-    
-    def __init__(self, wordpress_url, access_token):
-        self.wordpress_url = wordpress_url
-        self.access_token = access_token
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'Standalone-WordPress-MCP/1.0'
-        })
-        
-    def call_mcp_function(self, method, params=None):
-        """Call WordPress MCP function directly"""
-        if params is None:
-            params = {}
-            
-        # Create MCP request
-        mcp_request = {
-            "jsonrpc": "2.0",
-            "id": int(time.time()),
-            "method": "tools/call",
-            "params": {
-                "name": method,
-                "arguments": params
-            }
-        }
-        
-        try:
-            # Make request to WordPress MCP endpoint
-            url = f"{self.wordpress_url}?token={self.access_token}"
-            
-            logger.info(f"Calling MCP function: {method}")
-            response = self.session.post(url, json=mcp_request, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'result' in result:
-                    mcp_result = result['result']
-                    
-                    # Handle the nested content structure from AIWU MCP
-                    if isinstance(mcp_result, dict) and 'content' in mcp_result:
-                        content = mcp_result['content']
-                        if isinstance(content, list) and len(content) > 0:
-                            # Extract text from first content item
-                            first_content = content[0]
-                            if isinstance(first_content, dict) and 'text' in first_content:
-                                text_data = first_content['text']
-                                # Try to parse as JSON
-                                try:
-                                    parsed_data = json.loads(text_data)
-                                    logger.info(f"Parsed MCP response for {method}: {type(parsed_data)}")
-                                    return parsed_data
-                                except json.JSONDecodeError:
-                                    # Try to extract JSON from text like "Ping successful: {...}"
-                                    import re
-                                    json_match = re.search(r'\{.*\}', text_data, re.DOTALL)
-                                    if json_match:
-                                        try:
-                                            parsed_data = json.loads(json_match.group())
-                                            logger.info(f"Extracted JSON from MCP response for {method}: {type(parsed_data)}")
-                                            return parsed_data
-                                        except json.JSONDecodeError:
-                                            pass
-                                    # If not JSON, return the text as-is
-                                    return text_data
-                    
-                    # If not the expected nested structure, return as-is
-                    return mcp_result
-                elif 'error' in result:
-                    raise Exception(f"MCP Error: {result['error']}")
-                else:
-                    return result
-            else:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
-                
-        except requests.exceptions.Timeout:
-            raise Exception("Request timed out")
-        except requests.exceptions.ConnectionError:
-            raise Exception("Connection failed - check WordPress site and MCP plugin")
-        except Exception as e:
-            logger.error(f"MCP call failed: {str(e)}")
-            raise
-    
-    def ping(self):
-        """Test connection to WordPress"""
-        return self.call_mcp_function('mcp_ping')
-    
-    def get_posts(self, limit=20, post_status=None, search=None):
-        """Get WordPress posts"""
-        params = {'limit': limit}
-        if post_status:
-            params['post_status'] = post_status
-        if search:
-            params['search'] = search
-        return self.call_mcp_function('wp_get_posts', params)
-    
-    def get_post(self, post_id):
-        """Get single WordPress post"""
-        return self.call_mcp_function('wp_get_post', {'ID': post_id})
-    
-    def create_post(self, title, content, excerpt=None, status='draft', post_type='post'):
-        """Create WordPress post"""
-        params = {
-            'post_title': title,
-            'post_content': content,
-            'post_status': status,
-            'post_type': post_type
-        }
-        if excerpt:
-            params['post_excerpt'] = excerpt
-        return self.call_mcp_function('wp_create_post', params)
-    
-    def update_post(self, post_id, fields):
-        """Update WordPress post"""
-        return self.call_mcp_function('wp_update_post', {
-            'ID': post_id,
-            'fields': fields
-        })
-    
-    def delete_post(self, post_id, force=True):
-        """Delete WordPress post"""
-        return self.call_mcp_function('wp_delete_post', {
-            'ID': post_id,
-            'force': force
-        })
-    
-    def list_plugins(self):
-        """List WordPress plugins"""
-        return self.call_mcp_function('wp_list_plugins')
-    
-    def get_users(self, limit=10):
-        """Get WordPress users"""
-        return self.call_mcp_function('wp_get_users', {'limit': limit})
-    
-    def upload_media(self, url, title=None, alt=None):
-        """Upload media from URL"""
-        params = {'url': url}
-        if title:
-            params['title'] = title
-        if alt:
-            params['alt'] = alt
-        return self.call_mcp_function('wp_upload_media', params)
-    
-    def generate_ai_image(self, prompt, title=None):
-        """Generate AI image via AIWU"""
-        params = {'message': prompt}
-        if title:
-            params['title'] = title
-        return self.call_mcp_function('aiwu_image', params)
-    
-    # Content Management - Missing Functions
-    def count_posts(self, post_type='post'):
-        """Count posts by status"""
-        params = {}
-        if post_type:
-            params['post_type'] = post_type
-        return self.call_mcp_function('wp_count_posts', params)
-    
-    # User Management - Missing Functions
-    def create_user(self, user_login, user_email, user_pass=None, display_name=None, role=None):
-        """Create WordPress user"""
-        params = {
-            'user_login': user_login,
-            'user_email': user_email
-        }
-        if user_pass:
-            params['user_pass'] = user_pass
-        if display_name:
-            params['display_name'] = display_name
-        if role:
-            params['role'] = role
-        return self.call_mcp_function('wp_create_user', params)
-    
-    def update_user(self, user_id, fields):
-        """Update WordPress user"""
-        return self.call_mcp_function('wp_update_user', {
-            'ID': user_id,
-            'fields': fields
-        })
-    
-    # Post Meta & Custom Fields
-    def get_post_meta(self, post_id, key=None):
-        """Get post meta/custom fields"""
-        params = {'ID': post_id}
-        if key:
-            params['key'] = key
-        return self.call_mcp_function('wp_get_post_meta', params)
-    
-    def update_post_meta(self, post_id, key=None, value=None, meta=None):
-        """Update post meta/custom fields"""
-        params = {'ID': post_id}
-        if key and value is not None:
-            params['key'] = key
-            params['value'] = value
-        elif meta:
-            params['meta'] = meta
-        return self.call_mcp_function('wp_update_post_meta', params)
-    
-    def delete_post_meta(self, post_id, key, value=None):
-        """Delete post meta/custom fields"""
-        params = {
-            'ID': post_id,
-            'key': key
-        }
-        if value is not None:
-            params['value'] = value
-        return self.call_mcp_function('wp_delete_post_meta', params)
-    
-    # Media Management - Missing Functions
-    def get_media(self, limit=20, search=None, after=None, before=None):
-        """Get media items"""
-        params = {'limit': limit}
-        if search:
-            params['search'] = search
-        if after:
-            params['after'] = after
-        if before:
-            params['before'] = before
-        return self.call_mcp_function('wp_get_media', params)
-    
-    def update_media(self, media_id, title=None, alt=None, caption=None, description=None):
-        """Update media/attachment"""
-        params = {'ID': media_id}
-        if title:
-            params['title'] = title
-        if alt:
-            params['alt'] = alt
-        if caption:
-            params['caption'] = caption
-        if description:
-            params['description'] = description
-        return self.call_mcp_function('wp_update_media', params)
-    
-    def delete_media(self, media_id, force=True):
-        """Delete media/attachment"""
-        return self.call_mcp_function('wp_delete_media', {
-            'ID': media_id,
-            'force': force
-        })
-    
-    def set_featured_image(self, post_id, media_id=None):
-        """Set or remove featured image"""
-        params = {'post_id': post_id}
-        if media_id:
-            params['media_id'] = media_id
-        return self.call_mcp_function('wp_set_featured_image', params)
-    
-    def count_media(self, after=None, before=None):
-        """Count media attachments"""
-        params = {}
-        if after:
-            params['after'] = after
-        if before:
-            params['before'] = before
-        return self.call_mcp_function('wp_count_media', params)
-    
-    # Taxonomies (Categories & Tags)
-    def get_taxonomies(self, post_type=None):
-        """Get taxonomies for post type"""
-        params = {}
-        if post_type:
-            params['post_type'] = post_type
-        return self.call_mcp_function('wp_get_taxonomies', params)
-    
-    def get_terms(self, taxonomy, limit=50, parent=None, search=None):
-        """Get terms from taxonomy"""
-        params = {'taxonomy': taxonomy}
-        if limit:
-            params['limit'] = limit
-        if parent is not None:
-            params['parent'] = parent
-        if search:
-            params['search'] = search
-        return self.call_mcp_function('wp_get_terms', params)
-    
-    def create_term(self, taxonomy, term_name, description=None, parent=None, slug=None):
-        """Create taxonomy term"""
-        params = {
-            'taxonomy': taxonomy,
-            'term_name': term_name
-        }
-        if description:
-            params['description'] = description
-        if parent is not None:
-            params['parent'] = parent
-        if slug:
-            params['slug'] = slug
-        return self.call_mcp_function('wp_create_term', params)
-    
-    def update_term(self, term_id, taxonomy, name=None, description=None, parent=None, slug=None):
-        """Update taxonomy term"""
-        params = {
-            'term_id': term_id,
-            'taxonomy': taxonomy
-        }
-        if name:
-            params['name'] = name
-        if description:
-            params['description'] = description
-        if parent is not None:
-            params['parent'] = parent
-        if slug:
-            params['slug'] = slug
-        return self.call_mcp_function('wp_update_term', params)
-    
-    def delete_term(self, term_id, taxonomy):
-        """Delete taxonomy term"""
-        return self.call_mcp_function('wp_delete_term', {
-            'term_id': term_id,
-            'taxonomy': taxonomy
-        })
-    
-    def get_post_terms(self, post_id, taxonomy=None):
-        """Get terms attached to post"""
-        params = {'ID': post_id}
-        if taxonomy:
-            params['taxonomy'] = taxonomy
-        return self.call_mcp_function('wp_get_post_terms', params)
-    
-    def add_post_terms(self, post_id, terms, taxonomy=None, append=True):
-        """Add terms to post"""
-        params = {
-            'ID': post_id,
-            'terms': terms,
-            'append': append
-        }
-        if taxonomy:
-            params['taxonomy'] = taxonomy
-        return self.call_mcp_function('wp_add_post_terms', params)
-    
-    def count_terms(self, taxonomy):
-        """Count terms in taxonomy"""
-        return self.call_mcp_function('wp_count_terms', {'taxonomy': taxonomy})
-    
-    # Comments
-    def get_comments(self, limit=20, post_id=None, status=None, search=None, offset=None, paged=None):
-        """Get comments"""
-        params = {'limit': limit}
-        if post_id:
-            params['post_id'] = post_id
-        if status:
-            params['status'] = status
-        if search:
-            params['search'] = search
-        if offset:
-            params['offset'] = offset
-        if paged:
-            params['paged'] = paged
-        return self.call_mcp_function('wp_get_comments', params)
-    
-    def create_comment(self, post_id, comment_content, comment_author=None, comment_author_email=None, 
-                      comment_author_url=None, comment_approved='1'):
-        """Create comment"""
-        params = {
-            'post_id': post_id,
-            'comment_content': comment_content
-        }
-        if comment_author:
-            params['comment_author'] = comment_author
-        if comment_author_email:
-            params['comment_author_email'] = comment_author_email
-        if comment_author_url:
-            params['comment_author_url'] = comment_author_url
-        if comment_approved:
-            params['comment_approved'] = comment_approved
-        return self.call_mcp_function('wp_create_comment', params)
-    
-    def update_comment(self, comment_id, fields):
-        """Update comment"""
-        return self.call_mcp_function('wp_update_comment', {
-            'comment_ID': comment_id,
-            'fields': fields
-        })
-    
-    def delete_comment(self, comment_id, force=True):
-        """Delete comment"""
-        return self.call_mcp_function('wp_delete_comment', {
-            'comment_ID': comment_id,
-            'force': force
-        })
-    
-    # Site Options
-    def get_option(self, key):
-        """Get WordPress option"""
-        return self.call_mcp_function('wp_get_option', {'key': key})
-    
-    def update_option(self, key, value):
-        """Update WordPress option"""
-        return self.call_mcp_function('wp_update_option', {
-            'key': key,
-            'value': value
-        })
-    
-    # Post Types
-    def get_post_types(self):
-        """Get public post types"""
-        return self.call_mcp_function('wp_get_post_types')
-
 # Flask Application Setup
 # Configure static and template folders relative to project root
 import os
@@ -461,19 +72,79 @@ SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-this')
 app.secret_key = SECRET_KEY
 
 # Initialize MCP client
-mcp_client = WordPressMCPClient(WORDPRESS_URL, ACCESS_TOKEN)
+MCP_CACHE_SIZE = int(os.environ.get('MCP_CACHE_SIZE', 512))  # 0 disables the read cache
+MCP_MAX_CONCURRENCY = int(os.environ.get('MCP_MAX_CONCURRENCY', 8))
+MCP_INITIAL_CONCURRENCY = int(os.environ.get('MCP_INITIAL_CONCURRENCY', 2))
+MCP_BREAKER_FAILURES = int(os.environ.get('MCP_BREAKER_FAILURES', 5))
+MCP_BREAKER_RESET = float(os.environ.get('MCP_BREAKER_RESET', 30))
+
+# One adaptive limiter and circuit breaker for every WordPress call, sync or async,
+# so they back off together
+mcp_limiter = AIMDLimiter(initial_limit=MCP_INITIAL_CONCURRENCY, max_limit=MCP_MAX_CONCURRENCY)
+mcp_breaker = CircuitBreaker(failure_threshold=MCP_BREAKER_FAILURES, recovery_timeout=MCP_BREAKER_RESET)
+mcp_client = WordPressMCPClient(WORDPRESS_URL, ACCESS_TOKEN, cache_size=MCP_CACHE_SIZE,
+                                max_connections=MCP_MAX_CONCURRENCY, limiter=mcp_limiter, breaker=mcp_breaker)
+
+# Async client for concurrent fan-out calls (optional - requires httpx)
+try:
+    from src.integrations.wordpress.async_client import AsyncWordPressMCPClient, MCPFanout
+    mcp_fanout = MCPFanout(AsyncWordPressMCPClient(WORDPRESS_URL, ACCESS_TOKEN, max_concurrency=MCP_MAX_CONCURRENCY,
+                                                   metrics=mcp_client.metrics, limiter=mcp_limiter,
+                                                   breaker=mcp_breaker))
+except ImportError:
+    mcp_fanout = None
+    logger.warning("⚠️ httpx not installed - concurrent WordPress calls fall back to JSON-RPC batches")
+
+def fan_out_mcp_calls(calls):
+    """Run independent MCP calls concurrently; failed calls come back as exceptions"""
+    if mcp_fanout:
+        return mcp_fanout.gather(calls)
+    return mcp_client.call_many(calls, return_exceptions=True)
 
 # Store MCP client and WordPress URL in app config for blueprint access
 app.config['mcp_client'] = mcp_client
+app.config['mcp_fanout'] = mcp_fanout
 app.config['WORDPRESS_URL'] = WORDPRESS_URL
 
+# Instagram -> WordPress mappings, consulted by every import path to skip reimports
+post_tracker = PostTracker()
+app.config['post_tracker'] = post_tracker
+
+# Per-post checkpoints for resumable import jobs (stored alongside the job queue in data/jobs.db)
+import_checkpoints = ImportCheckpoints()
+app.config['import_checkpoints'] = import_checkpoints
+
+# SHA-256 -> WordPress media ID, so identical images reuse one attachment
+media_index = get_media_index()
+app.config['media_index'] = media_index
+
 # Initialize Apify Instagram integration
 APIFY_API_TOKEN = os.environ.get('APIFY_API_TOKEN')
 APIFY_CACHE_TTL = int(os.environ.get('APIFY_CACHE_TTL', 3600))  # Default 1 hour
+# Worker threads per import pipeline stage
+IMPORT_PIPELINE_WORKERS = {
+    'fetch': int(os.environ.get('IMPORT_FETCH_WORKERS', 4)),
+    'upload': int(os.environ.get('IMPORT_UPLOAD_WORKERS', 2)),
+    'create': int(os.environ.get('IMPORT_CREATE_WORKERS', 2)),
+    'finalize': int(os.environ.get('IMPORT_FINALIZE_WORKERS', 2))
+}
+# Concurrent downloads per post (carousel slides, videos)
+IMPORT_ASSET_WORKERS = int(os.environ.get('IMPORT_ASSET_WORKERS', 3))
+# One pooled session for all Instagram CDN downloads; cookies are refreshed once per TTL
+configure_cdn_client(pool_size=int(os.environ.get('INSTAGRAM_CDN_POOL_SIZE', 16)),
+                     warmup_ttl=int(os.environ.get('INSTAGRAM_COOKIE_TTL', 6 * 3600)))
+
+# One import engine behind every Instagram -> WordPress import route
+import_engine = ImportEngine(mcp_client, post_tracker=post_tracker, checkpoints=import_checkpoints,
+                             media_index=media_index, workers=IMPORT_PIPELINE_WORKERS,
+                             asset_workers=IMPORT_ASSET_WORKERS)
+app.config['import_engine'] = import_engine
+
 apify_manager = None
 
 if APIFY_API_TOKEN:
-    apify_manager = ApifyInstagramManager(APIFY_API_TOKEN, mcp_client, cache_ttl=APIFY_CACHE_TTL)
+    apify_manager = ApifyInstagramManager(APIFY_API_TOKEN, mcp_client, cache_ttl=APIFY_CACHE_TTL,
+                                          import_engine=import_engine)
     logger.info(f"✅ Apify Instagram integration configured with {APIFY_CACHE_TTL}s cache TTL")
 else:
     logger.warning("⚠️ Apify not configured - set APIFY_API_TOKEN for professional Instagram scraping")
@@ -481,6 +152,37 @@ else:
 # Store apify_manager in app config for blueprint access
 app.config['apify_manager'] = apify_manager
 
+# Dry-run planning of imports (counts, cost and time estimates from recorded latencies)
+app.config['import_planner'] = ImportPlanner(import_engine, scraper=apify_manager.scraper if apify_manager else None)
+
+# Background job queue for bulk imports
+IMPORT_JOB_WORKERS = int(os.environ.get('IMPORT_JOB_WORKERS', 2))
+IMPORT_JOBS_PER_SITE = int(os.environ.get('IMPORT_JOBS_PER_SITE', 2))
+IMPORT_JOBS_PER_USERNAME = int(os.environ.get('IMPORT_JOBS_PER_USERNAME', 1))
+job_queue = JobQueue(workers=IMPORT_JOB_WORKERS, max_per_site=IMPORT_JOBS_PER_SITE,
+                     max_per_username=IMPORT_JOBS_PER_USERNAME)
+
+def run_apify_bulk_import_job(job):
+    """Job handler for queued Apify bulk imports"""
+    params = job['params']
+    # Per-post results go to the job store as they finish; the job result only keeps the counts
+    result = apify_manager.import_user_posts_to_wordpress(
+        params['username'], params['limit'], auto_publish=params.get('auto_publish', False),
+        progress_session_id=job['progress_session_id'], job_id=job['id'],
+        on_result=lambda outcome, record: job_queue.add_results(job['id'], outcome, [record])
+    )
+    result['results_url'] = f"/api/jobs/{job['id']}/results"
+    if result.get('success') and result.get('imported_count', 0) > 0:
+        drafts_url = f"{WORDPRESS_URL.replace('/wp-json/mcp/v1/sse', '')}/wp-admin/edit.php?post_status=draft&post_type=post"
+        result['drafts_url'] = drafts_url
+        result['message'] += f'\n\n📝 View and publish your drafts: {drafts_url}'
+    return result
+
+if apify_manager:
+    job_queue.register('apify_bulk_import', run_apify_bulk_import_job)
+job_queue.start()
+app.config['job_queue'] = job_queue
+
 # Initialize chat handler
 from src.core.chat_handler import WordPressChatHandler
 chat_handler = WordPressChatHandler(mcp_client)
@@ -488,8 +190,10 @@ chat_handler = WordPressChatHandler(mcp_client)
 # Register Instagram API routes
 from src.api.instagram_routes import instagram_bp
 from src.api.progress_routes import progress_bp
+from src.api.job_routes import jobs_bp
 app.register_blueprint(instagram_bp)
 app.register_blueprint(progress_bp)
+app.register_blueprint(jobs_bp)
 
 # Routes
 @app.route('/')
@@ -517,36 +221,34 @@ def health_check():
         site_name = None
         timestamp = None
         
+        # The client already decodes "Ping successful: {...}" into a dict;
+        # a string here means the ping text carried no site info
         if isinstance(result, dict):
             site_name = result.get('name')
             timestamp = result.get('time')
-        elif isinstance(result, str):
-            # Parse the string response like "Ping successful: {...}"
-            import re
-            import json
-            
-            # Try to extract JSON from the string
-            json_match = re.search(r'\{.*\}', result, re.DOTALL)
-            if json_match:
-                try:
-                    json_data = json.loads(json_match.group())
-                    site_name = json_data.get('name')
-                    timestamp = json_data.get('time')
-                except json.JSONDecodeError:
-                    pass
         
         return jsonify({
             'status': 'ok',
             'wordpress_connected': True,
             'site_name': site_name,
             'timestamp': timestamp,
-            'raw_response': result
+            'raw_response': result,
+            'circuit_breaker': mcp_breaker.get_state()
         })
+    except CircuitOpenError as e:
+        # Answer immediately so the UI can degrade instead of waiting on timeouts
+        return jsonify({
+            'status': 'degraded',
+            'wordpress_connected': False,
+            'error': str(e),
+            'circuit_breaker': mcp_breaker.get_state()
+        }), 503
     except Exception as e:
         return jsonify({
             'status': 'error',
             'wordpress_connected': False,
-            'error': str(e)
+            'error': str(e),
+            'circuit_breaker': mcp_breaker.get_state()
         }), 500
 
 @app.route('/api/posts', methods=['GET'])
@@ -709,6 +411,78 @@ def count_posts():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/posts/bulk')
+def get_posts_bulk():
+    """Get several WordPress posts by ID in parallel (?ids=1,2,3)"""
+    try:
+        ids = [int(post_id) for post_id in request.args.get('ids', '').split(',') if post_id.strip()]
+        if not ids:
+            return jsonify({'error': 'ids are required'}), 400
+        
+        results = fan_out_mcp_calls([('wp_get_post', {'ID': post_id}) for post_id in ids])
+        return jsonify({
+            'posts': {str(post_id): result for post_id, result in zip(ids, results) if not isinstance(result, Exception)},
+            'errors': {str(post_id): str(result) for post_id, result in zip(ids, results) if isinstance(result, Exception)}
+        })
+    except ValueError:
+        return jsonify({'error': 'ids must be comma-separated integers'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/site/overview')
+def site_overview():
+    """Get site counts, post types and plugins with one parallel fan-out"""
+    try:
+        sections = [
+            ('post_counts', 'wp_count_posts', {'post_type': 'post'}),
+            ('media_count', 'wp_count_media', {}),
+            ('post_types', 'wp_get_post_types', {}),
+            ('taxonomies', 'wp_get_taxonomies', {}),
+            ('plugins', 'wp_list_plugins', {})
+        ]
+        results = fan_out_mcp_calls([(method, params) for _, method, params in sections])
+        
+        overview = {}
+        errors = {}
+        for (name, _, _), result in zip(sections, results):
+            if isinstance(result, Exception):
+                errors[name] = str(result)
+            else:
+                overview[name] = result
+        overview['errors'] = errors
+        return jsonify(overview)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/mcp/stats')
+def mcp_stats():
+    """Get MCP client statistics (read cache and coalesced calls)"""
+    cache_stats = mcp_client.cache.get_stats() if mcp_client.cache else {'enabled': False}
+    return jsonify({
+        'cache': cache_stats,
+        'single_flight': mcp_client.single_flight.get_stats(),
+        'concurrency': mcp_limiter.get_stats(),
+        'media_index': media_index.get_stats()
+    })
+
+@app.route('/api/metrics/mcp')
+def mcp_metrics():
+    """Get per-tool MCP latency, payload size and error metrics (JSON or ?format=prometheus)"""
+    if request.args.get('format') == 'prometheus':
+        return app.response_class(mcp_client.metrics.to_prometheus() + mcp_limiter.to_prometheus() +
+                                  import_engine.transfer_metrics.to_prometheus(prefix='import_transfer') +
+                                  apify_metrics.to_prometheus(prefix='apify_run'),
+                                  mimetype='text/plain; version=0.0.4')
+    return jsonify({**mcp_client.metrics.snapshot(), 'concurrency': mcp_limiter.get_stats(),
+                    'transfers': import_engine.transfer_metrics.snapshot(),
+                    'apify_runs': apify_metrics.snapshot()})
+
+@app.route('/api/mcp/cache/clear', methods=['POST'])
+def clear_mcp_cache():
+    """Drop all cached MCP read results"""
+    cleared = mcp_client.cache.clear() if mcp_client.cache else 0
+    return jsonify({'success': True, 'cleared_entries': cleared})
+
 @app.route('/api/post-types')
 def get_post_types():
     """Get public post types"""
@@ -1221,94 +995,25 @@ def import_instagram_to_wordpress():
         if not posts:
             return jsonify({'error': 'Posts data is required'}), 400
         
-        imported_posts = []
-        
-        for post in posts:
-            try:
-                logger.info(f"Processing Instagram post: {post}")
-                
-                # Upload image to WordPress media library
-                if post.get('image_url'):
-                    media_result = mcp_client.upload_media(
-                        url=post['image_url'],
-                        title=f"Instagram import - {post.get('caption', '')[:50]}",
-                        alt=post.get('caption', '')[:100]
-                    )
-                    
-                    if media_result and 'id' in media_result:
-                        media_id = media_result['id']
-                    else:
-                        media_id = None
-                else:
-                    media_id = None
-                
-                # Create WordPress post
-                wp_post_data = {
-                    'post_title': f"Instagram Post - {datetime.now().strftime('%Y-%m-%d')}",
-                    'post_content': post.get('caption', ''),
-                    'post_status': 'draft',  # Start as draft
-                    'post_type': 'post'
-                }
-                
-                # Add custom fields for Instagram data
-                meta_input = {
-                    'instagram_post_url': post.get('post_url', ''),
-                    'instagram_shortcode': post.get('shortcode', ''),
-                    'instagram_hashtags': ','.join(post.get('hashtags', [])),
-                    'import_method': post.get('extraction_method', 'manual'),
-                    'import_date': datetime.now().isoformat()
-                }
-                
-                wp_result = mcp_client.create_post(
-                    title=wp_post_data['post_title'],
-                    content=wp_post_data['post_content'],
-                    status=wp_post_data['post_status']
-                )
-                
-                logger.info(f"WordPress create_post result: {wp_result}")
-                logger.info(f"Result type: {type(wp_result)}")
-                
-                # Parse post ID from response (handle both dict and string formats)
-                post_id = None
-                if isinstance(wp_result, dict) and 'ID' in wp_result:
-                    post_id = wp_result['ID']
-                elif isinstance(wp_result, str) and 'Post created ID' in wp_result:
-                    # Extract ID from string like "Post created ID 32"
-                    import re
-                    match = re.search(r'Post created ID (\d+)', wp_result)
-                    if match:
-                        post_id = int(match.group(1))
-                
-                if post_id:
-                    # Add Instagram metadata as custom fields
-                    for key, value in meta_input.items():
-                        try:
-                            mcp_client.call_mcp_function('wp_update_post_meta', {
-                                'ID': post_id,
-                                'key': key,
-                                'value': value
-                            })
-                        except Exception as e:
-                            logger.warning(f"Could not add meta field {key}: {e}")
-                
-                # Set featured image if we have one
-                if media_id and wp_result and 'ID' in wp_result:
-                    mcp_client.set_featured_image(wp_result['ID'], media_id)
-                
-                imported_posts.append({
-                    'instagram_post': post,
-                    'wordpress_post': wp_result,
-                    'media_id': media_id
-                })
-                
-            except Exception as e:
-                logger.error(f"Error importing post {post.get('shortcode', 'unknown')}: {e}")
-                continue
+        # Import method comes from each post's extraction_method
+        result = import_engine.import_posts(posts, status='draft')
+        skipped_posts = result['skipped']
+        imported_posts = [{
+            'instagram_post': imported['instagram_post'],
+            'post_id': imported['post_id'],
+            'media_id': imported['media_id'],
+            'title': imported['title'],
+            'mcp_calls': imported['mcp_calls']
+        } for imported in result['imported']]
         
         return jsonify({
             'success': True,
             'imported_count': len(imported_posts),
-            'imported_posts': imported_posts
+            'skipped_count': len(skipped_posts),
+            'imported_posts': imported_posts,
+            'skipped_posts': skipped_posts,
+            'failed_posts': result['failed'],
+            'mcp_calls_total': result['mcp_calls_total']
         })
         
     except Exception as e:
@@ -8,6 +8,8 @@ import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from src.integrations.wordpress.client import MCPResponseFormatError
+
 class WordPressChatHandler:
     """Handles natural language chat commands for WordPress management"""
     
@@ -166,6 +168,15 @@ class WordPressChatHandler:
         # if 'instagram status' in message or 'instagram account' in message:
         #     return 'instagram_status', {}
         
+        # Import planning (dry run) commands
+        if 'plan import' in message or 'import plan' in message or 'dry run' in message:
+            username = self._extract_instagram_username(message)
+            if not username:
+                match = re.search(r'plan\s+import\s+(?:for\s+|of\s+)?([a-zA-Z0-9._]+)', message)
+                username = match.group(1) if match and not match.group(1).isdigit() else None
+            limit = self._extract_number(message) or 20
+            return 'import_plan', {'username': username, 'limit': limit}
+        
         # Instagram import commands (handle typos and variations)
         if ('import instagram' in message or 'instagram import' in message or 
             'import instragram' in message or 'instragram import' in message):
@@ -286,6 +297,9 @@ class WordPressChatHandler:
         elif intent == 'apify_bulk_import':
             return self._apify_bulk_import_response(params)
         
+        elif intent == 'import_plan':
+            return self._import_plan_response(params)
+        
         elif intent == 'apify_profile':
             return self._apify_profile_response(params)
         
@@ -527,15 +541,7 @@ class WordPressChatHandler:
     def _list_posts_response(self) -> Dict[str, Any]:
         """List recent posts"""
         try:
-            posts = self.mcp_client.get_posts(limit=10)
-            
-            # Ensure posts is a list
-            if not isinstance(posts, list):
-                return {
-                    'type': 'error',
-                    'message': f"❌ Unexpected response format from WordPress: {type(posts)}",
-                    'suggestions': ["Check WordPress connection", "Try 'site health'"]
-                }
+            posts = list(self.mcp_client.iter_posts(max_items=10))
             
             if not posts:
                 return {
@@ -573,6 +579,12 @@ class WordPressChatHandler:
                 'data': posts,
                 'actions': ["list drafts", "search posts", "create post"]
             }
+        except MCPResponseFormatError as e:
+            return {
+                'type': 'error',
+                'message': f"❌ Unexpected response format from WordPress: {str(e)}",
+                'suggestions': ["Check WordPress connection", "Try 'site health'"]
+            }
         except Exception as e:
             return {
                 'type': 'error',
@@ -582,15 +594,7 @@ class WordPressChatHandler:
     def _list_drafts_response(self) -> Dict[str, Any]:
         """List draft posts"""
         try:
-            drafts = self.mcp_client.get_posts(post_status='draft', limit=10)
-            
-            # Ensure drafts is a list
-            if not isinstance(drafts, list):
-                return {
-                    'type': 'error',
-                    'message': f"❌ Unexpected response format from WordPress: {type(drafts)}",
-                    'suggestions': ["Check WordPress connection", "Try 'site health'"]
-                }
+            drafts = list(self.mcp_client.iter_posts(post_status='draft', max_items=10))
             
             if not drafts:
                 return {
@@ -623,6 +627,12 @@ class WordPressChatHandler:
                 'data': valid_drafts,
                 'actions': [f"publish post {draft.get('ID')}" for draft in valid_drafts[:3] if draft.get('ID')]
             }
+        except MCPResponseFormatError as e:
+            return {
+                'type': 'error',
+                'message': f"❌ Unexpected response format from WordPress: {str(e)}",
+                'suggestions': ["Check WordPress connection", "Try 'site health'"]
+            }
         except Exception as e:
             return {
                 'type': 'error',
@@ -665,7 +675,7 @@ class WordPressChatHandler:
             }
         
         try:
-            posts = self.mcp_client.get_posts(search=query, limit=10)
+            posts = list(self.mcp_client.iter_posts(search=query, max_items=10))
             
             if not posts:
                 return {
@@ -1127,7 +1137,7 @@ Summary and final thoughts on {topic}...
     def _list_media_response(self) -> Dict[str, Any]:
         """List media items"""
         try:
-            media = self.mcp_client.get_media(limit=10)
+            media = list(self.mcp_client.iter_media(max_items=10))
             
             if not media:
                 return {
@@ -1292,7 +1302,7 @@ Summary and final thoughts on {topic}...
     def _list_comments_response(self) -> Dict[str, Any]:
         """List recent comments"""
         try:
-            comments = self.mcp_client.get_comments(limit=10)
+            comments = list(self.mcp_client.iter_comments(max_items=10))
             
             if not comments:
                 return {
@@ -1327,7 +1337,7 @@ Summary and final thoughts on {topic}...
     def _moderate_comments_response(self) -> Dict[str, Any]:
         """Show pending comments for moderation"""
         try:
-            pending = self.mcp_client.get_comments(status='hold', limit=10)
+            pending = list(self.mcp_client.iter_comments(status='hold', max_items=10))
             
             if not pending:
                 return {
@@ -1536,6 +1546,46 @@ Summary and final thoughts on {topic}...
             ]
         }
     
+    def _import_plan_response(self, params: Dict) -> Dict[str, Any]:
+        """Dry-run plan of a bulk import"""
+        username = params.get('username')
+        limit = params.get('limit', 20)
+        
+        if not username:
+            return {
+                'type': 'question',
+                'message': "Which Instagram username should I plan an import for?",
+                'suggestions': [
+                    "plan import @example_user 500",
+                    "dry run import of @example_user",
+                    "Nothing is imported while planning"
+                ]
+            }
+        
+        return {
+            'type': 'import_plan',
+            'message': f"Plan importing {limit} posts from @{username}?",
+            'info': [
+                "🆕 New posts vs. posts already imported",
+                "🖼️ Images already cached or in the media library",
+                "📞 MCP and REST calls the import will make",
+                "💰 Apify cost and ⏱️ estimated time from recorded latencies"
+            ],
+            'actions': [
+                {
+                    'type': 'import_plan',
+                    'label': f'🧮 Plan @{username} Import',
+                    'username': username,
+                    'limit': limit
+                }
+            ],
+            'suggestions': [
+                "Uses cached Apify results when available",
+                "Estimates improve as imports record call latencies",
+                f"Run 'bulk import @{username}' when the plan looks right"
+            ]
+        }
+    
     def _apify_profile_response(self, params: Dict) -> Dict[str, Any]:
         """Get Instagram profile info via Apify"""
         username = params.get('username')
@@ -1584,6 +1634,7 @@ Summary and final thoughts on {topic}...
                 "🔍 **Check Status**: 'apify status' or 'check apify'",
                 "📱 **Scrape User**: 'scrape instagram @username' or 'apify scrape username'",
                 "🚀 **Bulk Import**: 'bulk import @username' or 'scrape and import username'",
+                "🧮 **Plan Import**: 'plan import @username 500' (dry run: new posts, calls, cost, time)",
                 "👤 **Get Profile**: 'instagram profile @username' or 'get profile username'",
                 "❓ **Get Help**: 'apify help' or 'apify commands'"
             ],
@@ -6,7 +6,7 @@ Stores Apify API results locally to minimize API calls and costs
 import json
 import os
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime, timedelta
 import hashlib
 import logging
@@ -354,6 +354,35 @@ class CachedApifyInstagramScraper:
         
         return result
     
+    def iter_user_posts(self, username: str, limit: int = 50, include_stories: bool = False,
+                        use_cache: bool = True) -> Iterator[Dict]:
+        """
+        Yield user posts, from the cache when possible
+        
+        A cache miss streams the scrape page by page (see
+        ApifyInstagramScraper.iter_user_posts); the streamed posts are not
+        cached, since that would mean holding them all in memory.
+        """
+        if use_cache:
+            cached_result = self.get_cached_user_posts(username, limit, include_stories)
+            if cached_result is not None:
+                logger.info(f"Using cached results for @{username} ({len(cached_result)} posts)")
+                yield from cached_result
+                return
+        
+        logger.info(f"Streaming fresh data from Apify for @{username}")
+        yield from self.scraper.iter_user_posts(username, limit, include_stories)
+    
+    def get_cached_user_posts(self, username: str, limit: int = 50,
+                              include_stories: bool = False) -> Optional[List[Dict]]:
+        """Cached scrape_user_posts result, or None on a miss (never calls Apify)"""
+        params = {
+            'username': username,
+            'limit': limit,
+            'include_stories': include_stories
+        }
+        return self.cache.get('user_posts', params)
+    
     def scrape_post_urls(self, urls: List[str], use_cache: bool = True, 
                         cache_ttl: Optional[int] = None) -> List[Dict]:
         """
@@ -427,6 +456,10 @@ class CachedApifyInstagramScraper:
         """Get Apify usage info (not cached as it changes frequently)"""
         return self.scraper.get_usage_info()
     
+    def estimate_cost(self, operation_type: str = 'user_posts', count: int = 10) -> Dict:
+        """Estimate the Apify spend of a scrape (cache hits cost nothing)"""
+        return self.scraper.estimate_cost(operation_type, count)
+    
     def clear_cache_for_user(self, username: str) -> int:
         """
         Clear all cached data for a specific user
@@ -6,10 +6,12 @@ Professional Instagram scraping using Apify's Instagram Scraper actor
 import requests
 import json
 import time
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional
 from datetime import datetime
 import logging
 
+from ...utils.apify_runs import iter_run_items, wait_for_run
+
 logger = logging.getLogger(__name__)
 
 class ApifyInstagramScraper:
@@ -18,6 +20,11 @@ class ApifyInstagramScraper:
     Handles rate limiting, data formatting, and error handling
     """
     
+    # Approximate pay-per-result price of the Instagram Scraper actor (USD)
+    COST_PER_1000_RESULTS = 2.30
+    # Dataset items fetched per request when streaming results from a running actor
+    DATASET_PAGE_SIZE = 100
+    
     def __init__(self, api_token: str):
         self.api_token = api_token
         self.base_url = "https://api.apify.com/v2"
@@ -42,19 +49,7 @@ class ApifyInstagramScraper:
         """
         logger.info(f"Starting Apify scrape for @{username}, limit: {limit}")
         
-        # Prepare input for Apify actor (based on successful console run)
-        actor_input = {
-            "addParentData": False,
-            "directUrls": [f"https://www.instagram.com/{username}/"],
-            "enhanceUserSearchWithFacebookPage": False,
-            "isUserReelFeedURL": False,
-            "isUserTaggedFeedURL": False,
-            "onlyPostsNewerThan": "2024-01-01",  # Get posts from this year
-            "resultsLimit": limit,
-            "resultsType": "posts",
-            "searchLimit": 1,
-            "searchType": "hashtag"
-        }
+        actor_input = self._user_posts_input(username, limit)
         
         try:
             # Start the actor run
@@ -89,6 +84,63 @@ class ApifyInstagramScraper:
             logger.error(f"Error scraping @{username}: {str(e)}")
             raise
     
+    def iter_user_posts(self, username: str, limit: int = 50, include_stories: bool = False) -> Iterator[Dict]:
+        """
+        Scrape posts from an Instagram user, yielding them while the actor is still running
+        
+        Same posts as scrape_user_posts, but the run's dataset is paged
+        DATASET_PAGE_SIZE items per request as the actor writes it (see
+        iter_run_items), and each post is handed on as soon as it is
+        formatted: an import can start on the first posts within seconds
+        instead of waiting for the whole scrape, and only one page is ever
+        held in memory.
+        
+        Args:
+            username: Instagram username (without @)
+            limit: Maximum number of posts to scrape
+            include_stories: Whether to include stories (premium feature)
+            
+        Yields:
+            Formatted post dictionaries
+        """
+        logger.info(f"Starting streamed Apify scrape for @{username}, limit: {limit}")
+        
+        try:
+            run_response = self._start_actor_run(self._user_posts_input(username, limit))
+            run_id = run_response['data']['id']
+            logger.info(f"Apify run started with ID: {run_id}")
+            
+            count = 0
+            for item in iter_run_items(self.session, self.base_url, run_id, page_size=self.DATASET_PAGE_SIZE,
+                                       metric='instagram_scraper'):
+                # Check for Instagram posts (Apify uses 'Image' or 'Video' as type)
+                if item.get('type') in ['Image', 'Video'] or 'shortCode' in item:
+                    formatted_post = self._format_post_data(item, username)
+                    if formatted_post:
+                        count += 1
+                        yield formatted_post
+            
+            logger.info(f"Successfully scraped {count} posts from @{username}")
+            
+        except Exception as e:
+            logger.error(f"Error scraping @{username}: {str(e)}")
+            raise
+    
+    def _user_posts_input(self, username: str, limit: int) -> Dict:
+        """Actor input for a user's posts (based on successful console run)"""
+        return {
+            "addParentData": False,
+            "directUrls": [f"https://www.instagram.com/{username}/"],
+            "enhanceUserSearchWithFacebookPage": False,
+            "isUserReelFeedURL": False,
+            "isUserTaggedFeedURL": False,
+            "onlyPostsNewerThan": "2024-01-01",  # Get posts from this year
+            "resultsLimit": limit,
+            "resultsType": "posts",
+            "searchLimit": 1,
+            "searchType": "hashtag"
+        }
+    
     def scrape_post_urls(self, urls: List[str]) -> List[Dict]:
         """
         Scrape specific Instagram posts by URL
@@ -220,36 +272,27 @@ class ApifyInstagramScraper:
         Returns:
             List of scraped items
         """
-        start_time = time.time()
+        self._wait_for_run(run_id, timeout)
         
-        while time.time() - start_time < timeout:
-            # Check run status
-            status_url = f"{self.base_url}/actor-runs/{run_id}"
-            status_response = self.session.get(status_url)
-            status_response.raise_for_status()
-            
-            run_data = status_response.json()['data']
-            status = run_data['status']
-            
-            logger.info(f"Run {run_id} status: {status}")
-            
-            if status == 'SUCCEEDED':
-                # Get results
-                results_url = f"{self.base_url}/actor-runs/{run_id}/dataset/items"
-                results_response = self.session.get(results_url)
-                results_response.raise_for_status()
-                
-                return results_response.json()
-            
-            elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
-                error_msg = f"Actor run {status.lower()}: {run_data.get('statusMessage', 'Unknown error')}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            
-            # Wait before checking again
-            time.sleep(10)
+        # Get results
+        results_url = f"{self.base_url}/actor-runs/{run_id}/dataset/items"
+        results_response = self.session.get(results_url)
+        results_response.raise_for_status()
         
-        raise Exception(f"Actor run timed out after {timeout} seconds")
+        return results_response.json()
+    
+    def _wait_for_run(self, run_id: str, timeout: int = 300) -> Dict:
+        """
+        Wait for actor run to succeed (long-polling, see wait_for_run)
+        
+        Args:
+            run_id: Apify run ID
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            The finished run's data
+        """
+        return wait_for_run(self.session, self.base_url, run_id, timeout, metric='instagram_scraper')
     
     def _format_post_data(self, item: Dict, username: str) -> Optional[Dict]:
         """
@@ -271,12 +314,8 @@ class ApifyInstagramScraper:
             # Get the image URL (Apify provides displayUrl directly)
             image_url = item.get('displayUrl', '')
             
-            # Handle video posts
+            # Handle video posts (displayUrl is the video thumbnail)
             is_video = item.get('type', '').lower() == 'video'
-            if is_video and item.get('videoUrl'):
-                # For videos, we might want to use the video URL or thumbnail
-                # For now, we'll use displayUrl as thumbnail and note it's a video
-                pass
             
             # Parse timestamp (Apify format: "2025-10-20T14:54:06.000Z")
             timestamp = 0
@@ -321,6 +360,7 @@ class ApifyInstagramScraper:
                 'dimensions_width': item.get('dimensionsWidth', 0),
                 'location_name': item.get('locationName', ''),
                 'alt_text': item.get('alt', ''),
+                'media': self._extract_media_assets(item),
                 'extraction_method': 'apify_scraper',
                 'raw_data': item  # Store original data for debugging
             }
@@ -341,6 +381,28 @@ class ApifyInstagramScraper:
             logger.error(f"Item data: {str(item)[:500]}...")
             return None
     
+    def _extract_media_assets(self, item: Dict) -> List[Dict]:
+        """
+        Every image and video of a post, in display order
+        
+        Sidecar (carousel) posts list their slides in childPosts (or just the
+        image URLs in images); single posts are their own only asset.
+        
+        Returns:
+            List of {'type': 'image'|'video', 'url'} (videos also carry 'thumbnail_url')
+        """
+        entries = [item]
+        if item.get('type', '').lower() == 'sidecar':
+            entries = item.get('childPosts') or [{'type': 'Image', 'displayUrl': url} for url in item.get('images', [])] or [item]
+        
+        assets = []
+        for entry in entries:
+            if entry.get('type', '').lower() == 'video' and entry.get('videoUrl'):
+                assets.append({'type': 'video', 'url': entry['videoUrl'], 'thumbnail_url': entry.get('displayUrl', '')})
+            elif entry.get('displayUrl'):
+                assets.append({'type': 'image', 'url': entry['displayUrl']})
+        return assets
+    
     def _extract_username_from_url(self, url: str) -> str:
         """Extract username from Instagram URL"""
         try:
@@ -374,6 +436,25 @@ class ApifyInstagramScraper:
             logger.error(f"Error getting usage info: {str(e)}")
             return {}
     
+    def estimate_cost(self, operation_type: str = 'user_posts', count: int = 10) -> Dict:
+        """
+        Estimate the Apify spend of a scrape
+        
+        Args:
+            operation_type: 'user_posts', 'post_urls' or 'profile'
+            count: Number of posts to scrape (ignored for profiles)
+            
+        Returns:
+            {'operation_type', 'results', 'cost_per_1000_results', 'estimated_cost_usd'}
+        """
+        results = 1 if operation_type == 'profile' else max(0, int(count))
+        return {
+            'operation_type': operation_type,
+            'results': results,
+            'cost_per_1000_results': self.COST_PER_1000_RESULTS,
+            'estimated_cost_usd': round(results * self.COST_PER_1000_RESULTS / 1000, 4)
+        }
+    
     def find_instagram_actors(self) -> List[Dict]:
         """
         Find available Instagram-related actors
@@ -433,25 +514,59 @@ class ApifyInstagramManager:
     Combines scraping and WordPress import functionality
     """
     
-    def __init__(self, api_token: str, mcp_client, cache_ttl: int = 3600):
+    def __init__(self, api_token: str, mcp_client, cache_ttl: int = 3600, pipeline_workers: Dict = None,
+                 post_tracker=None, checkpoints=None, media_index=None, import_engine=None):
         from .apify_cache import CachedApifyInstagramScraper
+        from .import_engine import ImportEngine
         
         self.scraper = CachedApifyInstagramScraper(api_token, cache_ttl)
         self.mcp_client = mcp_client
+        self.engine = import_engine or ImportEngine(mcp_client, post_tracker=post_tracker, checkpoints=checkpoints,
+                                                    media_index=media_index, workers=pipeline_workers)
         logger.info("ApifyInstagramManager initialized with caching")
     
-    def import_user_posts_to_wordpress(self, username: str, limit: int = 10, auto_publish: bool = False, progress_session_id: str = None) -> Dict:
+    def import_user_posts_to_wordpress(self, username: str, limit: int = 10, auto_publish: bool = False, progress_session_id: str = None,
+                                       job_id: str = None, on_result: Callable[[str, Dict], None] = None) -> Dict:
         """
         Scrape user posts via Apify and import directly to WordPress
         
+        The import itself runs through the shared ImportEngine: posts already
+        mapped in the post tracker are skipped, the rest go through the staged
+        import pipeline.
+        
+        With on_result, the import streams: posts are read from the scrape a
+        page at a time while earlier ones are being imported, each post's
+        result goes to on_result(outcome, record) (see
+        ImportEngine.stream_posts) instead of the returned dictionary, and
+        memory use does not grow with the number of posts.
+        
+        With a job_id, every stage a post completes is checkpointed. Calling
+        again with the same job_id resumes: the recorded posts are reused,
+        and each post continues after its last completed stage. The user is
+        only scraped again when the earlier attempt stopped before reading
+        the whole scrape; posts it had recorded or imported are then left
+        out.
+        
         Args:
             username: Instagram username (without @)
             limit: Maximum number of posts to import
             auto_publish: Whether to publish posts immediately (vs draft)
+            job_id: Background job ID to checkpoint under (and resume from)
+            on_result: Receives each post's result; the return value then only holds counts
             
         Returns:
-            Import results dictionary
+            Import results dictionary; when a streamed import fails part way, it
+            still reports the posts handled before the error
         """
+        # Running counts of a streamed import, kept outside the try so a failure can report them
+        streamed = {'imported': 0, 'skipped': 0, 'failed': 0, 'mcp_calls_total': 0}
+        
+        def count_result(outcome, record):
+            streamed[outcome] += 1
+            if outcome == 'imported':
+                streamed['mcp_calls_total'] += record.get('mcp_calls', 0)
+            on_result(outcome, record)
+        
         try:
             logger.info(f"Starting bulk import for @{username}, limit: {limit}")
             
@@ -463,267 +578,146 @@ class ApifyInstagramManager:
                 except ImportError:
                     pass
             
-            # Step 1: Scrape posts
-            posts = self.scraper.scrape_user_posts(username, limit)
-            
-            if progress_session_id:
-                try:
-                    update_progress(progress_session_id, step=20, message=f"📱 Found {len(posts)} posts, starting import...")
-                except:
-                    pass
-            
-            if not posts:
-                return {
-                    'success': False,
-                    'message': f'No posts found for @{username}',
-                    'scraped_count': 0,
-                    'imported_count': 0
-                }
+            posts = None
+            resuming = self.engine.can_resume(job_id)
+            # A resumed job that had read its whole scrape needs nothing but its checkpoints
+            needs_posts = self.engine.needs_posts(job_id)
+            if resuming:
+                logger.info(f"♻️ Resuming import job {job_id} for @{username}")
+                if progress_session_id:
+                    try:
+                        update_progress(progress_session_id, step=20,
+                                        message=f"♻️ Resuming import of @{username}...")
+                    except:
+                        pass
+            if needs_posts and on_result:
+                # Step 1: Scrape posts, read a page at a time as the import consumes them
+                posts = self.scraper.iter_user_posts(username, limit)
+                
+                if progress_session_id:
+                    try:
+                        update_progress(progress_session_id, step=20, message=f"📱 Importing posts from @{username} as they arrive...")
+                    except:
+                        pass
+            elif needs_posts:
+                # Step 1: Scrape posts
+                posts = self.scraper.scrape_user_posts(username, limit)
+                
+                if progress_session_id:
+                    try:
+                        update_progress(progress_session_id, step=20, message=f"📱 Found {len(posts)} posts, starting import...")
+                    except:
+                        pass
+                
+                if not posts and not resuming:
+                    return {
+                        'success': False,
+                        'message': f'No posts found for @{username}',
+                        'scraped_count': 0,
+                        'imported_count': 0
+                    }
             
             # Step 2: Import to WordPress
-            imported_posts = []
-            total_posts = len(posts)
+            status = 'publish' if auto_publish else 'draft'
+            
+            def on_progress(completed, total, imported, errors):
+                if progress_session_id:
+                    try:
+                        progress_step = 20 + int((completed / total) * 70)  # 20-90% range for import
+                        update_progress(
+                            progress_session_id, 
+                            step=progress_step, 
+                            message=(f"📝 Imported {imported} of {total} posts..." if not errors else
+                                     f"📝 Processing {completed} of {total} posts (some errors)..."),
+                            details={'imported': imported, 'total': total, 'errors': errors}
+                        )
+                    except:
+                        pass
+            
+            if on_result:
+                summary = self.engine.stream_posts(posts, import_method='apify_bulk_import', status=status,
+                                                   username=username, job_id=job_id, on_progress=on_progress,
+                                                   on_result=count_result, expected_total=limit)
+                if not summary['posts']:
+                    return {
+                        'success': False,
+                        'message': f'No posts found for @{username}',
+                        'scraped_count': 0,
+                        'imported_count': 0
+                    }
+                scraped_count = summary['posts']
+                imported_count = summary['imported']
+                skipped_count = summary['skipped']
+                failed_count = summary['failed']
+                details = {}
+            else:
+                result = self.engine.import_posts(posts, import_method='apify_bulk_import', status=status,
+                                                  username=username, job_id=job_id, on_progress=on_progress)
+                summary = result
+                imported_posts = [{
+                    'shortcode': imported['shortcode'],
+                    'wordpress_id': imported['post_id'],
+                    'title': imported['title'],
+                    'status': imported['status'],
+                    'mcp_calls': imported['mcp_calls']
+                } for imported in result['imported']]
+                scraped_count = len(result['posts'])
+                imported_count = len(imported_posts)
+                skipped_count = len(result['skipped'])
+                failed_count = len(result['failed'])
+                details = {
+                    'imported_posts': imported_posts,
+                    'skipped_posts': result['skipped'],
+                    'failed_posts': result['failed']
+                }
             
-            for i, post in enumerate(posts, 1):
-                try:
-                    # Download and upload image to WordPress using proven breakthrough method
-                    media_id = None
-                    if post.get('image_url'):
-                        try:
-                            # Use the proven working Instagram image downloader
-                            from ...utils.instagram_image_downloader_working import InstagramImageDownloader
-                            
-                            downloader = InstagramImageDownloader()
-                            success, image_data, error = downloader.download_image(post['image_url'])
-                            
-                            if success and image_data:
-                                logger.info(f"✅ Downloaded {len(image_data)} bytes for post {post.get('shortcode')}")
-                                
-                                # Upload to WordPress using REST API
-                                wp_url = self.mcp_client.wordpress_url.replace('/wp-json/mcp/v1/sse', '')
-                                upload_url = f"{wp_url}/wp-json/wp/v2/media"
-                                
-                                # Use WordPress credentials from environment
-                                import os
-                                wp_username = os.getenv('WORDPRESS_USERNAME', 'admin')
-                                wp_password = os.getenv('WORDPRESS_PASSWORD', '')
-                                
-                                if wp_username and wp_password:
-                                    import base64
-                                    credentials = base64.b64encode(f"{wp_username}:{wp_password}".encode()).decode()
-                                    
-                                    filename = f"instagram_{post.get('username', 'unknown')}_{post.get('shortcode', 'unknown')}.jpg"
-                                    
-                                    files = {
-                                        'file': (filename, image_data, 'image/jpeg')
-                                    }
-                                    
-                                    upload_headers = {
-                                        'Authorization': f'Basic {credentials}'
-                                    }
-                                    
-                                    upload_response = requests.post(upload_url, files=files, headers=upload_headers, timeout=60)
-                                    
-                                    if upload_response.status_code == 201:
-                                        media_data = upload_response.json()
-                                        media_id = media_data['id']
-                                        logger.info(f"✅ Successfully uploaded image for post {post.get('shortcode')} (Media ID: {media_id})")
-                                    else:
-                                        logger.warning(f"⚠️ WordPress upload failed: {upload_response.status_code} - {upload_response.text[:200]}")
-                                else:
-                                    logger.warning("⚠️ WordPress credentials not configured for direct upload")
-                            else:
-                                logger.warning(f"⚠️ Image download failed for post {post.get('shortcode')}: {error}")
-                            
-                        except Exception as e:
-                            logger.warning(f"⚠️ Image download/upload failed for post {post.get('shortcode')}: {e}")
-                            # Fall back to MCP upload (will likely fail but worth trying)
-                            try:
-                                media_result = self.mcp_client.upload_media(
-                                    url=post['image_url'],
-                                    title=f"Instagram - @{username} - {post.get('caption', '')[:50]}",
-                                    alt=post.get('caption', '')[:100]
-                                )
-                                if media_result and 'id' in media_result:
-                                    media_id = media_result['id']
-                            except:
-                                pass
-                    
-                    # Create post title
-                    post_title = f"@{username} - {datetime.now().strftime('%Y-%m-%d')}"
-                    if post.get('caption'):
-                        first_line = post['caption'].split('\n')[0][:50]
-                        if first_line and not first_line.startswith('#'):
-                            post_title = first_line
-                    
-                    # Enhanced content with beautiful Instagram-style formatting
-                    content = self._format_instagram_post_content(post, username)
-                    
-                    # Create WordPress post
-                    status = 'publish' if auto_publish else 'draft'
-                    wp_result = self.mcp_client.create_post(
-                        title=post_title,
-                        content=content,
-                        status=status
-                    )
-                    
-                    # Parse post ID
-                    post_id = None
-                    if isinstance(wp_result, dict) and 'ID' in wp_result:
-                        post_id = wp_result['ID']
-                    elif isinstance(wp_result, str) and 'Post created ID' in wp_result:
-                        import re
-                        match = re.search(r'Post created ID (\d+)', wp_result)
-                        if match:
-                            post_id = int(match.group(1))
-                    
-                    # Add comprehensive metadata
-                    if post_id:
-                        meta_fields = {
-                            'instagram_username': username,
-                            'instagram_shortcode': post.get('shortcode', ''),
-                            'instagram_likes': str(post.get('likes_count', 0)),
-                            'instagram_comments': str(post.get('comments_count', 0)),
-                            'instagram_hashtags': ','.join(post.get('hashtags', [])),
-                            'instagram_post_url': post.get('post_url', ''),
-                            'import_method': 'apify_bulk_import',
-                            'import_date': datetime.now().isoformat()
-                        }
-                        
-                        for key, value in meta_fields.items():
-                            try:
-                                self.mcp_client.call_mcp_function('wp_update_post_meta', {
-                                    'ID': post_id,
-                                    'key': key,
-                                    'value': value
-                                })
-                            except Exception as e:
-                                logger.warning(f"Could not add meta field {key}: {e}")
-                        
-                        # Set featured image
-                        if media_id:
-                            try:
-                                self.mcp_client.set_featured_image(post_id, media_id)
-                            except Exception as e:
-                                logger.warning(f"Could not set featured image: {e}")
-                    
-                    imported_posts.append({
-                        'shortcode': post.get('shortcode'),
-                        'wordpress_id': post_id,
-                        'title': post_title,
-                        'status': status
-                    })
-                    
-                    # Update progress
-                    if progress_session_id:
-                        try:
-                            progress_step = 20 + int((i / total_posts) * 70)  # 20-90% range for import
-                            update_progress(
-                                progress_session_id, 
-                                step=progress_step, 
-                                message=f"📝 Imported {len(imported_posts)} of {total_posts} posts...",
-                                details={'imported': len(imported_posts), 'total': total_posts}
-                            )
-                        except:
-                            pass
-                    
-                except Exception as e:
-                    logger.error(f"Error importing post {post.get('shortcode')}: {e}")
-                    
-                    # Update progress even on error
-                    if progress_session_id:
-                        try:
-                            progress_step = 20 + int((i / total_posts) * 70)
-                            update_progress(
-                                progress_session_id, 
-                                step=progress_step, 
-                                message=f"📝 Processing {i} of {total_posts} posts (some errors)...",
-                                details={'imported': len(imported_posts), 'total': total_posts, 'errors': i - len(imported_posts)}
-                            )
-                        except:
-                            pass
-                    continue
+            if not imported_count and not failed_count and skipped_count:
+                message = f'All {scraped_count} posts from @{username} were already imported'
+            else:
+                message = f'Successfully imported {imported_count} of {scraped_count} posts from @{username}'
+                if skipped_count:
+                    message += f' ({skipped_count} already imported)'
             
             # Final progress update
             if progress_session_id:
                 try:
                     from ...api.progress_routes import complete_progress
-                    complete_progress(
-                        progress_session_id, 
-                        f"✅ Successfully imported {len(imported_posts)} of {len(posts)} posts from @{username}!"
-                    )
+                    complete_progress(progress_session_id, f"✅ {message}!")
                 except:
                     pass
             
             return {
                 'success': True,
                 'username': username,
-                'scraped_count': len(posts),
-                'imported_count': len(imported_posts),
-                'imported_posts': imported_posts,
-                'message': f'Successfully imported {len(imported_posts)} of {len(posts)} posts from @{username}'
+                'scraped_count': scraped_count,
+                'imported_count': imported_count,
+                'skipped_count': skipped_count,
+                'failed_count': failed_count,
+                **details,
+                'mcp_calls_total': summary['mcp_calls_total'],
+                'resumed': summary['resumed'],
+                'message': message
             }
             
         except Exception as e:
             logger.error(f"Error in bulk import for @{username}: {str(e)}")
-            return {
+            result = {
                 'success': False,
                 'error': str(e),
                 'scraped_count': 0,
                 'imported_count': 0
             }
-    
-    def _format_instagram_post_content(self, post, username):
-        """
-        Format Instagram post content with clean, readable styling
-        """
-        caption = post.get('caption', '').strip()
-        hashtags = post.get('hashtags', [])
-        likes_count = post.get('likes_count', 0)
-        comments_count = post.get('comments_count', 0)
-        date_posted = post.get('date_posted', 'Unknown')
-        post_url = post.get('post_url', '')
-        
-        # Split caption and hashtags
-        caption_lines = caption.split('\n')
-        main_caption = []
-        caption_hashtags = []
-        
-        for line in caption_lines:
-            if line.strip().startswith('#') or all(word.startswith('#') for word in line.strip().split() if word):
-                caption_hashtags.extend([word for word in line.split() if word.startswith('#')])
-            else:
-                main_caption.append(line)
-        
-        # Combine hashtags from caption and metadata
-        all_hashtags = list(set(caption_hashtags + hashtags))
-        
-        # Build clean, readable content
-        content_parts = []
-        
-        # Main caption (clean, without hashtags)
-        clean_caption = '\n'.join(main_caption).strip()
-        if clean_caption:
-            content_parts.append(clean_caption)
-        
-        # Add hashtags as a clean list
-        if all_hashtags:
-            hashtag_text = ' '.join([f'#{tag.lstrip("#")}' for tag in all_hashtags[:10]])
-            content_parts.append(f"\n🏷️ **Tags:** {hashtag_text}")
-        
-        # Add Instagram metadata in a clean format
-        metadata_parts = [
-            "---",
-            f"📸 **Instagram Post by @{username}**",
-            f"📅 **Posted:** {date_posted}",
-            f"❤️ **{likes_count:,} likes** • 💬 **{comments_count:,} comments**",
-            f"🔗 [**View Original on Instagram**]({post_url})",
-            "---"
-        ]
-        
-        content_parts.extend(metadata_parts)
-        
-        return '\n\n'.join(content_parts)
+            if on_result and any(streamed.values()):
+                # Posts created before the error are in WordPress (and their results went to on_result)
+                result.update({
+                    'scraped_count': streamed['imported'] + streamed['skipped'] + streamed['failed'],
+                    'imported_count': streamed['imported'],
+                    'skipped_count': streamed['skipped'],
+                    'failed_count': streamed['failed'],
+                    'mcp_calls_total': streamed['mcp_calls_total'],
+                    'message': f"Import of @{username} stopped after {streamed['imported']} imported posts: {e}"
+                })
+            return result
 
 def test_apify_scraper():
     """Test function for Apify scraper (requires API token)"""
@@ -0,0 +1,702 @@
+"""
+Instagram -> WordPress import engine
+The single implementation behind every import route: skips posts already in
+the post tracker, runs the rest through a staged pipeline (image/video fetch
+-> media upload -> post create -> meta/featured image), checkpoints
+background jobs and reports progress
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+import logging
+
+import requests
+
+from ..wordpress.concurrency import OVERLOAD
+from ..wordpress.mcp_metrics import MCPMetrics
+from ..wordpress.single_flight import SingleFlight
+from ...utils.import_pipeline import ImportPipeline, PipelineStage
+from ...utils.media_index import rest_media_exists
+from ...utils.media_stream import RANGE_SIZE, stream_upload
+
+logger = logging.getLogger(__name__)
+
+
+def derive_post_title(post: Dict, username: str = None) -> str:
+    """First caption line (unless it is only hashtags), else a dated fallback"""
+    if post.get('caption'):
+        first_line = post['caption'].split('\n')[0][:50]
+        if first_line and not first_line.startswith('#'):
+            return first_line
+    date = datetime.now().strftime('%Y-%m-%d')
+    return f"Instagram Post from @{username} - {date}" if username else f"Instagram Post - {date}"
+
+
+def post_media_assets(post: Dict) -> List[Dict]:
+    """
+    Images and videos to import for a post, in display order
+
+    Uses the post's media list (every carousel slide and video) when the
+    scraper provided one, else its image_url. A post without any image gets
+    its image_url (the video thumbnail) as an extra 'thumbnail' asset so it
+    still has a featured image.
+    """
+    assets = [dict(asset) for asset in post.get('media') or []]
+    if not assets and post.get('image_url'):
+        assets = [{'type': 'image', 'url': post['image_url']}]
+    if post.get('image_url') and not any(asset['type'] == 'image' for asset in assets):
+        assets.insert(0, {'type': 'image', 'url': post['image_url'], 'thumbnail': True})
+    return assets
+
+
+def format_instagram_post_content(post: Dict, username: str, media: List[Dict] = None) -> str:
+    """
+    Format Instagram post content with clean, readable styling
+
+    With the uploaded media, carousel images become a gallery and videos a
+    video player.
+    """
+    caption = post.get('caption', '').strip()
+    hashtags = post.get('hashtags', [])
+    likes_count = post.get('likes_count', 0)
+    comments_count = post.get('comments_count', 0)
+    date_posted = post.get('date_posted', 'Unknown')
+    post_url = post.get('post_url', '')
+
+    # Split caption and hashtags
+    caption_lines = caption.split('\n')
+    main_caption = []
+    caption_hashtags = []
+
+    for line in caption_lines:
+        if line.strip().startswith('#') or all(word.startswith('#') for word in line.strip().split() if word):
+            caption_hashtags.extend([word for word in line.split() if word.startswith('#')])
+        else:
+            main_caption.append(line)
+
+    # Combine hashtags from caption and metadata
+    all_hashtags = list(set(caption_hashtags + hashtags))
+
+    # Build clean, readable content
+    content_parts = []
+
+    # Main caption (clean, without hashtags)
+    clean_caption = '\n'.join(main_caption).strip()
+    if clean_caption:
+        content_parts.append(clean_caption)
+
+    # Carousel slides as a gallery, videos as players
+    if media:
+        images = [item for item in media if item['type'] == 'image' and not item.get('thumbnail')]
+        if len(images) > 1:
+            content_parts.append(f'[gallery ids="{",".join(str(item["id"]) for item in images)}" link="file"]')
+        for video in media:
+            if video['type'] == 'video' and video.get('source_url'):
+                content_parts.append(f'[video src="{video["source_url"]}"]')
+
+    # Add hashtags as a clean list
+    if all_hashtags:
+        hashtag_text = ' '.join([f'#{tag.lstrip("#")}' for tag in all_hashtags[:10]])
+        content_parts.append(f"\n🏷️ **Tags:** {hashtag_text}")
+
+    # Add Instagram metadata in a clean format
+    metadata_parts = [
+        "---",
+        f"📸 **Instagram Post by @{username}**",
+        f"📅 **Posted:** {date_posted}",
+        f"❤️ **{likes_count or 0:,} likes** • 💬 **{comments_count or 0:,} comments**",
+        f"🔗 [**View Original on Instagram**]({post_url})",
+        "---"
+    ]
+
+    content_parts.extend(metadata_parts)
+
+    return '\n\n'.join(content_parts)
+
+
+def build_post_meta(post: Dict, username: str, import_method: str) -> Dict[str, str]:
+    """Instagram metadata stored as WordPress custom fields"""
+    return {
+        'instagram_post_url': post.get('post_url', ''),
+        'instagram_id': str(post.get('id', '') or ''),
+        'instagram_shortcode': post.get('shortcode', ''),
+        'instagram_username': username,
+        'instagram_hashtags': ','.join(post.get('hashtags', [])),
+        'instagram_media_type': post.get('media_type', 'IMAGE'),
+        'instagram_likes_count': str(post.get('likes_count', 0)),
+        'instagram_comments_count': str(post.get('comments_count', 0)),
+        'instagram_date_posted': post.get('date_posted', ''),
+        'import_method': import_method,
+        'import_date': datetime.now().isoformat()
+    }
+
+
+class ImportEngine:
+    """
+    Imports Instagram posts into WordPress
+
+    Every import route goes through import_posts, so batching, concurrency,
+    dedupe and progress reporting live in one place.
+    """
+
+    DEFAULT_WORKERS = {'fetch': 4, 'upload': 2, 'create': 2, 'finalize': 2}
+    # Posts read from a stream per post tracker lookup
+    SKIP_BATCH_SIZE = 50
+
+    def __init__(self, mcp_client, post_tracker=None, checkpoints=None, media_index=None, workers: Dict = None,
+                 asset_workers: int = 3, video_range_size: int = RANGE_SIZE):
+        """
+        Args:
+            mcp_client: WordPressMCPClient posts are created through
+            post_tracker: PostTracker used to skip and record imports
+            checkpoints: ImportCheckpoints for resumable background jobs
+            media_index: MediaIndex for reusing identical uploaded images
+            workers: Worker threads per pipeline stage (fetch, upload, create, finalize)
+            asset_workers: Concurrent downloads per post (carousel slides, videos)
+            video_range_size: Bytes per Range request when downloading videos
+        """
+        self.mcp_client = mcp_client
+        self.post_tracker = post_tracker
+        self.checkpoints = checkpoints
+        self.media_index = media_index
+        self.workers = {**self.DEFAULT_WORKERS, **(workers or {})}
+        self.asset_workers = max(1, asset_workers)
+        self.video_range_size = video_range_size
+        # Latency of CDN downloads and REST media calls, by operation (the import planner reads these)
+        self.transfer_metrics = MCPMetrics()
+        self._upload_flight = SingleFlight()
+        self._image_downloader = None
+
+    @property
+    def site_url(self) -> str:
+        """WordPress base URL (the MCP endpoint without its path)"""
+        return self.mcp_client.wordpress_url.replace('/wp-json/mcp/v1/sse', '')
+
+    @staticmethod
+    def has_rest_credentials() -> bool:
+        """Whether WORDPRESS_USERNAME/WORDPRESS_PASSWORD allow direct REST media uploads"""
+        return bool(os.getenv('WORDPRESS_USERNAME', 'admin') and os.getenv('WORDPRESS_PASSWORD', ''))
+
+    def can_resume(self, job_id: str) -> bool:
+        """Whether an earlier attempt of job_id left checkpoints to continue from"""
+        return bool(job_id and self.checkpoints and self.checkpoints.has_job(job_id))
+
+    def needs_posts(self, job_id: str) -> bool:
+        """
+        Whether a run of job_id has posts to read: it is new, or its earlier
+        attempt stopped before reading all of its posts (e.g. mid-scrape)
+        """
+        return not self.can_resume(job_id) or not self.checkpoints.feed_complete(job_id)
+
+    def import_posts(self, posts: List[Dict] = None, import_method: str = None, status: str = 'draft',
+                     username: str = None, job_id: str = None,
+                     on_progress: Callable[[int, int, int, int], None] = None) -> Dict:
+        """
+        Import posts to WordPress
+
+        Posts already mapped in the post tracker are skipped before any image
+        is downloaded. With a job_id, every stage a post completes is
+        checkpointed; when the job already has checkpoints (see can_resume)
+        the recorded posts are continued first. posts is then only read if
+        the earlier attempt stopped before reading all of its posts (see
+        needs_posts), and only the posts it had not recorded are imported.
+
+        Args:
+            posts: Scraped post dictionaries
+            import_method: Recorded in the post meta and tracker (default: each post's extraction_method)
+            status: WordPress post status
+            username: Instagram username (default: each post's own)
+            job_id: Background job ID to checkpoint under (and resume from)
+            on_progress: Called as on_progress(completed, total, imported, errors) after each post
+
+        Returns:
+            {'posts', 'imported', 'skipped', 'failed', 'resumed', 'mcp_calls_total', 'stats'}
+        """
+        posts = posts or []
+        jobs = []
+        skipped = []
+        summary = self._run_import(posts, import_method, status, username, job_id, on_progress,
+                                   on_job_done=jobs.append, on_skipped=skipped.extend, expected_total=len(posts))
+        jobs.sort(key=lambda job: job['index'])
+
+        return {
+            # Resumed jobs import the posts recorded by the earlier attempt
+            'posts': [job['item'] for job in jobs] if summary['resumed'] else posts,
+            'imported': [{'instagram_post': job['item'], **self._imported_record(job, status)}
+                         for job in jobs if job['error'] is None],
+            'skipped': skipped,
+            'failed': [self._failed_record(job) for job in jobs if job['error'] is not None],
+            'resumed': summary['resumed'],
+            'mcp_calls_total': summary['mcp_calls_total'],
+            'stats': summary['stats']
+        }
+
+    def stream_posts(self, posts: Iterable[Dict] = None, import_method: str = None, status: str = 'draft',
+                     username: str = None, job_id: str = None,
+                     on_progress: Callable[[int, int, int, int], None] = None,
+                     on_result: Callable[[str, Dict], None] = None, expected_total: int = None) -> Dict:
+        """
+        Import posts as an iterable yields them, handing each result off instead of collecting it
+
+        For accounts too large to hold in memory: posts are read (and checked
+        against the post tracker) in batches of up to SKIP_BATCH_SIZE while
+        earlier ones are still in the pipeline, and every result goes to
+        on_result as soon as it is known, so memory is bounded by the
+        pipeline queues rather than the number of posts. Checkpointing and
+        resuming work as in import_posts: a resumed job continues the posts
+        it had read before it stopped, then - if it stopped mid-stream -
+        reads posts again for the ones it never got to.
+
+        Args:
+            posts: Iterable of scraped post dictionaries (e.g. a generator paging a scrape)
+            import_method: Recorded in the post meta and tracker (default: each post's extraction_method)
+            status: WordPress post status
+            username: Instagram username (default: each post's own)
+            job_id: Background job ID to checkpoint under (and resume from)
+            on_progress: Called as on_progress(completed, total, imported, errors) after each post;
+                         total is estimated from expected_total until posts is exhausted
+            on_result: Called as on_result(outcome, record) per post, where outcome is 'imported'
+                       ({'shortcode', 'post_id', 'title', 'status', 'media_id', 'media', 'mcp_calls'}),
+                       'skipped' ({'shortcode', 'wordpress_post_id'}) or 'failed' ({'shortcode', 'stage', 'error'})
+            expected_total: Number of posts posts is expected to yield
+
+        Returns:
+            {'posts', 'imported', 'skipped', 'failed', 'resumed', 'mcp_calls_total', 'stats'}
+            with counts in place of lists
+        """
+        def on_job_done(job):
+            if job['error'] is None:
+                on_result('imported', self._imported_record(job, status))
+            else:
+                on_result('failed', self._failed_record(job))
+
+        def on_skipped(records):
+            for record in records:
+                on_result('skipped', record)
+
+        return self._run_import(posts or [], import_method, status, username, job_id, on_progress,
+                                on_job_done=on_job_done if on_result else None,
+                                on_skipped=on_skipped if on_result else None, expected_total=expected_total)
+
+    def _run_import(self, posts: Iterable[Dict], import_method: Optional[str], status: str, username: Optional[str],
+                    job_id: Optional[str], on_progress: Callable = None, on_job_done: Callable = None,
+                    on_skipped: Callable = None, expected_total: int = None) -> Dict:
+        """Push posts (or a resumed job's checkpoints) through the pipeline, reporting each finished job"""
+        counts = {'posts': 0, 'imported': 0, 'skipped': 0, 'failed': 0, 'mcp_calls_total': 0}
+        feed_state = {'exhausted': False}
+        resumed = self.can_resume(job_id)
+        pending_checkpoints = {}
+        if resumed:
+            # Resume: continue the posts recorded by the earlier attempt
+            summary = self.checkpoints.summary(job_id)
+            logger.info(f"♻️ Resuming import job {job_id}: {summary}")
+            parts = [self._resumed_posts(job_id, pending_checkpoints, counts)]
+            if not self.checkpoints.feed_complete(job_id):
+                # It stopped before reading all its posts: import the ones it never recorded too
+                logger.info(f"♻️ Import job {job_id} stopped mid-stream, reading the posts it did not get to")
+                parts.append(self._new_posts(posts, job_id, counts, on_skipped, first_position=summary['posts'],
+                                             exclude=self.checkpoints.shortcodes(job_id)))
+        else:
+            if job_id and self.checkpoints:
+                self.checkpoints.start(job_id, [])
+            parts = [self._new_posts(posts, job_id, counts, on_skipped)]
+
+        def feed_posts():
+            for part in parts:
+                yield from part
+            feed_state['exhausted'] = True
+
+        def on_post_done(job, completed):
+            if job['error'] is None:
+                counts['imported'] += 1
+                counts['mcp_calls_total'] += job['mcp_calls']
+                if self.post_tracker and not job['already_done']:
+                    try:
+                        self.post_tracker.record_import(job['item'], job['post_id'], job['title'], status,
+                                                        import_method=job['import_method'])
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not record mapping for {job['item'].get('shortcode')}: {e}")
+            else:
+                counts['failed'] += 1
+                logger.error(f"Error importing post {job['item'].get('shortcode')}: {job['error']}")
+                self._checkpoint(job, error=job['error'])
+
+            if on_job_done:
+                on_job_done(job)
+            if on_progress:
+                read = counts['posts'] - counts['skipped']
+                total = read if feed_state['exhausted'] else max(read, (expected_total or 0) - counts['skipped'])
+                try:
+                    on_progress(completed, total, counts['imported'], counts['failed'])
+                except Exception as e:
+                    logger.warning(f"⚠️ Progress hook failed: {e}")
+
+        # Images are spooled to disk between the fetch and upload stages
+        with tempfile.TemporaryDirectory(prefix='instagram_import_') as spool_dir:
+            pipeline = self._build_pipeline(username, status, import_method, job_id, pending_checkpoints, spool_dir)
+            pipeline.stream(feed_posts(), on_post_done)
+        logger.info(f"Import pipeline stages: {pipeline.stats}")
+
+        return {**counts, 'resumed': resumed, 'stats': pipeline.stats}
+
+    def _new_posts(self, posts: Iterable[Dict], job_id: Optional[str], counts: Dict, on_skipped: Callable = None,
+                   first_position: int = 0, exclude: Set[str] = None) -> Iterator[Dict]:
+        """
+        Yield the posts not imported yet, checkpointing them as they are read
+
+        Runs on the pipeline's feeder thread. Posts are checked against the
+        post tracker in batches that start at one post and double up to
+        SKIP_BATCH_SIZE, so a slow source (a scrape still running) gets its
+        first post into the pipeline without waiting for a whole batch; only
+        shortcodes are kept across batches, to skip repeats. Posts whose
+        shortcode is in exclude (a resumed job's recorded posts) are dropped
+        without being counted. Once posts is exhausted the job's feed is
+        marked complete, so a resume does not read posts again.
+        """
+        posts = iter(posts or [])
+        exclude = exclude or set()
+        seen = set()
+        position = first_position
+        batch_size = 1
+        while True:
+            batch = list(islice(posts, batch_size))
+            if not batch:
+                break
+            batch_size = min(batch_size * 2, self.SKIP_BATCH_SIZE)
+            if exclude:
+                batch = [post for post in batch if post.get('shortcode') not in exclude]
+            counts['posts'] += len(batch)
+            new_posts, skipped = batch, []
+            if self.post_tracker:
+                # One batched lookup instead of re-importing posts we already have
+                new_posts, skipped = self.post_tracker.filter_new_posts(batch)
+                repeats = [post for post in new_posts if post.get('shortcode') in seen]
+                if repeats:
+                    new_posts = [post for post in new_posts if post.get('shortcode') not in seen]
+                    skipped += [{'shortcode': post['shortcode'], 'wordpress_post_id': None} for post in repeats]
+                seen.update(post['shortcode'] for post in batch if post.get('shortcode'))
+            if skipped:
+                logger.info(f"⏭️ Skipping {len(skipped)} already imported posts")
+                counts['skipped'] += len(skipped)
+                if on_skipped:
+                    try:
+                        on_skipped(skipped)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Skipped-post hook failed: {e}")
+            if job_id and self.checkpoints:
+                self.checkpoints.append(job_id, position, new_posts)
+            position += len(new_posts)
+            yield from new_posts
+        if job_id and self.checkpoints:
+            self.checkpoints.finish_feed(job_id)
+
+    def _resumed_posts(self, job_id: str, pending_checkpoints: Dict, counts: Dict) -> Iterator[Dict]:
+        """Yield a resumed job's recorded posts, leaving each checkpoint for the fetch stage to pick up"""
+        for checkpoint in self.checkpoints.iter_checkpoints(job_id):
+            pending_checkpoints[checkpoint['position']] = checkpoint
+            counts['posts'] += 1
+            yield checkpoint['post']
+
+    @staticmethod
+    def _imported_record(job: Dict, status: str) -> Dict:
+        return {
+            'shortcode': job['item'].get('shortcode'),
+            'post_id': job['post_id'],
+            'title': job['title'],
+            'status': status,
+            'media_id': job['media_id'],
+            'media': job['media'],
+            'mcp_calls': job['mcp_calls']
+        }
+
+    @staticmethod
+    def _failed_record(job: Dict) -> Dict:
+        return {
+            'shortcode': job['item'].get('shortcode'),
+            'stage': job['failed_stage'],
+            'error': job['error']
+        }
+
+    def _build_pipeline(self, username: Optional[str], status: str, import_method: Optional[str], job_id: str = None,
+                        pending_checkpoints: Dict = None, spool_dir: str = None) -> ImportPipeline:
+        """Pipeline of the four import stages"""
+        workers = self.workers
+
+        def prepare(job):
+            # Attach the post's checkpoint so later stages can skip completed work
+            job['job_id'] = job_id
+            job['username'] = username or job['item'].get('username') or 'unknown'
+            job['import_method'] = import_method or job['item'].get('extraction_method', 'manual')
+            job['spool_dir'] = spool_dir or tempfile.gettempdir()
+            job['checkpoint'] = pending_checkpoints.pop(job['index'], {}) if pending_checkpoints is not None else {}
+            job['already_done'] = bool(job['checkpoint'].get('done'))
+            self._fetch_media_stage(job)
+
+        return ImportPipeline([
+            PipelineStage('fetch', prepare, workers['fetch']),
+            PipelineStage('upload', self._upload_media_stage, workers['upload']),
+            PipelineStage('create', lambda job: self._create_post_stage(job, status), workers['create']),
+            PipelineStage('finalize', self._finalize_post_stage, workers['finalize'])
+        ])
+
+    def _checkpoint(self, job: Dict, **fields):
+        """Persist a completed stage for the job's post (no-op outside background jobs)"""
+        if self.checkpoints and job.get('job_id'):
+            self.checkpoints.update(job['job_id'], job['index'], **fields)
+
+    def _fetch_media_stage(self, job: Dict):
+        """Download the post's images and videos from the Instagram CDN into the spool directory"""
+        checkpoint = job['checkpoint']
+        job['assets'] = []
+        if job['already_done'] or checkpoint.get('media') or checkpoint.get('media_id') or checkpoint.get('featured_set'):
+            return
+
+        assets = job['assets'] = post_media_assets(job['item'])
+        if len(assets) > 1:
+            # Slides download concurrently, but at most asset_workers per post so one
+            # large carousel cannot take every CDN connection from the rest of the batch
+            with ThreadPoolExecutor(max_workers=min(self.asset_workers, len(assets)),
+                                    thread_name_prefix=f"import-assets-{job['index']}") as pool:
+                list(pool.map(lambda n: self._fetch_asset(job, n), range(len(assets))))
+        elif assets:
+            self._fetch_asset(job, 0)
+
+        if any(asset.get('file') for asset in assets):
+            self._checkpoint(job, image_fetched=1)
+
+    def _fetch_asset(self, job: Dict, n: int):
+        """Download one image (or Range-stream one video) of a post"""
+        post = job['item']
+        asset = job['assets'][n]
+        extension = 'mp4' if asset['type'] == 'video' else 'jpg'
+        suffix = f'_{n}' if n else ''
+        asset['filename'] = f"instagram_{post.get('username', 'unknown')}_{post.get('shortcode', 'unknown')}{suffix}.{extension}"
+
+        try:
+            downloader = self._get_image_downloader()
+            dest_path = os.path.join(job['spool_dir'], f"{job['index']:05d}_{asset['filename']}")
+            start = time.perf_counter()
+            if asset['type'] == 'video':
+                success, media_file, error = downloader.download_video_to_file(asset['url'], dest_path,
+                                                                               self.video_range_size)
+            else:
+                success, media_file, error = downloader.download_image_to_file(asset['url'], dest_path)
+            self.transfer_metrics.record(f"cdn_{asset['type']}_download", time.perf_counter() - start,
+                                         response_bytes=media_file['size'] if media_file else 0,
+                                         error=not success)
+
+            if success and media_file:
+                logger.info(f"✅ Downloaded {media_file['size']} bytes ({asset['type']}) for post {post.get('shortcode')}")
+                asset['file'] = media_file
+            else:
+                logger.warning(f"⚠️ {asset['type'].title()} download failed for post {post.get('shortcode')}: {error}")
+        except Exception as e:
+            logger.warning(f"⚠️ {asset['type'].title()} download failed for post {post.get('shortcode')}: {e}")
+            asset['fallback'] = True
+
+    def _get_image_downloader(self):
+        """Downloader shared by all fetch workers (it uses the process-wide pooled CDN session)"""
+        if self._image_downloader is None:
+            # Use the proven working Instagram image downloader
+            from ...utils.instagram_image_downloader_working import InstagramImageDownloader
+            self._image_downloader = InstagramImageDownloader(media_index=self.media_index)
+        return self._image_downloader
+
+    def _upload_media_stage(self, job: Dict):
+        """Upload the downloaded images and videos to the WordPress media library"""
+        checkpoint = job['checkpoint']
+        job['media'] = list(checkpoint.get('media') or [])
+        job['media_id'] = checkpoint.get('media_id')
+        assets = job.pop('assets', [])
+
+        try:
+            for asset in assets:
+                uploaded = self._upload_asset(job, asset)
+                if uploaded:
+                    job['media'].append(uploaded)
+        finally:
+            for asset in assets:
+                if asset.get('file'):
+                    os.remove(asset['file']['path'])
+
+        if not job['media_id']:
+            # The first image is the featured image (a video's thumbnail when there is no other)
+            job['media_id'] = next((media['id'] for media in job['media'] if media['type'] == 'image'), None)
+
+        if job['media'] and not checkpoint.get('media'):
+            self._checkpoint(job, media_id=job['media_id'], media=job['media'])
+
+    def _upload_asset(self, job: Dict, asset: Dict) -> Optional[Dict]:
+        """
+        Upload one spooled asset, returning {'type', 'id', 'source_url', 'thumbnail'}
+
+        Falls back to an MCP upload from the CDN URL when the asset could not
+        be downloaded or the REST upload did not go through.
+        """
+        post = job['item']
+        media = None
+        fallback = asset.get('fallback', False)
+
+        if asset.get('file'):
+            try:
+                media = self._upload_media_rest(post, asset['file'], asset['filename'], asset['type'])
+            except Exception as e:
+                logger.warning(f"⚠️ {asset['type'].title()} upload failed for post {post.get('shortcode')}: {e}")
+            fallback = media is None
+
+        if fallback:
+            # Fall back to MCP upload (will likely fail but worth trying)
+            try:
+                media_result = self.mcp_client.upload_media(
+                    url=asset['url'],
+                    title=f"Instagram - @{job['username']} - {post.get('caption', '')[:50]}",
+                    alt=post.get('caption', '')[:100]
+                )
+                if media_result and 'id' in media_result:
+                    media = {'id': media_result['id'], 'source_url': media_result.get('url')}
+            except Exception as e:
+                logger.warning(f"⚠️ MCP {asset['type']} upload failed for post {post.get('shortcode')}: {e}")
+
+        if not media:
+            return None
+        return {'type': asset['type'], 'id': media['id'], 'source_url': media.get('source_url'),
+                'thumbnail': bool(asset.get('thumbnail'))}
+
+    def _upload_media_rest(self, post: Dict, media_file: Dict, filename: str,
+                           media_type: str = 'image') -> Optional[Dict]:
+        """
+        Upload a spooled file through the WordPress REST API, returning {'id', 'source_url'}
+
+        The file is streamed from disk. With a media index, bytes already
+        uploaded to this site reuse the existing attachment instead.
+        """
+        wp_url = self.site_url
+        upload_url = f"{wp_url}/wp-json/wp/v2/media"
+
+        # Use WordPress credentials from environment
+        wp_username = os.getenv('WORDPRESS_USERNAME', 'admin')
+        wp_password = os.getenv('WORDPRESS_PASSWORD', '')
+
+        if not (wp_username and wp_password):
+            logger.warning("⚠️ WordPress credentials not configured for direct upload")
+            return None
+
+        import base64
+        credentials = base64.b64encode(f"{wp_username}:{wp_password}".encode()).decode()
+
+        upload_headers = {
+            'Authorization': f'Basic {credentials}'
+        }
+        # Videos can take far longer than images to reach WordPress
+        timeout = 300 if media_type == 'video' else 60
+
+        if not self.media_index:
+            return self._post_media(upload_url, media_file['path'], filename, upload_headers, post, timeout)
+
+        # Identical bytes uploaded by concurrent workers share one upload
+        file_hash = media_file.get('sha256') or self.media_index.hash_file(media_file['path'])
+        return self._upload_flight.do((wp_url, file_hash), self._upload_unless_indexed,
+                                      file_hash, wp_url, upload_url, media_file, filename, upload_headers, post,
+                                      timeout)
+
+    def _upload_unless_indexed(self, file_hash: str, wp_url: str, upload_url: str, media_file: Dict,
+                               filename: str, upload_headers: Dict, post: Dict, timeout: int = 60) -> Optional[Dict]:
+        existing = self.media_index.find_existing(
+            file_hash, wp_url, exists=lambda media_id: self._media_exists(wp_url, media_id, upload_headers))
+        if existing:
+            logger.info(f"♻️ Reusing media {existing['media_id']} for post {post.get('shortcode')} (identical file)")
+            return {'id': existing['media_id'], 'source_url': existing.get('source_url')}
+
+        media = self._post_media(upload_url, media_file['path'], filename, upload_headers, post, timeout)
+        if not media:
+            return None
+        self.media_index.record(file_hash, wp_url, media['id'], media.get('source_url'), filename,
+                                media_file.get('size'))
+        return media
+
+    def _media_exists(self, wp_url: str, media_id: int, upload_headers: Dict) -> bool:
+        start = time.perf_counter()
+        try:
+            return rest_media_exists(wp_url, media_id, upload_headers)
+        finally:
+            self.transfer_metrics.record('rest_media_lookup', time.perf_counter() - start)
+
+    def _post_media(self, upload_url: str, path: str, filename: str, upload_headers: Dict,
+                    post: Dict, timeout: int = 60) -> Optional[Dict]:
+        # Share the WordPress concurrency budget with MCP calls
+        with self.mcp_client.limiter.slot(60) as slot:
+            start = time.perf_counter()
+            try:
+                upload_response = stream_upload(requests, upload_url, path, filename, headers=upload_headers,
+                                                timeout=timeout)
+            except Exception:
+                self.transfer_metrics.record('rest_media_upload', time.perf_counter() - start, error=True)
+                raise
+            self.transfer_metrics.record('rest_media_upload', time.perf_counter() - start, os.path.getsize(path),
+                                         len(upload_response.content), error=upload_response.status_code != 201)
+            if upload_response.status_code == 429 or upload_response.status_code >= 500:
+                slot.outcome = OVERLOAD
+
+        if upload_response.status_code == 201:
+            media = upload_response.json()
+            logger.info(f"✅ Successfully uploaded {filename} for post {post.get('shortcode')} (Media ID: {media['id']})")
+            return {'id': media['id'], 'source_url': media.get('source_url')}
+
+        logger.warning(f"⚠️ WordPress upload failed: {upload_response.status_code} - {upload_response.text[:200]}")
+        return None
+
+    def _create_post_stage(self, job: Dict, status: str):
+        """Create the WordPress post with its meta as meta_input"""
+        post = job['item']
+        username = job['username']
+
+        post_title = derive_post_title(post, username)
+        content = format_instagram_post_content(post, username, job['media'])
+        meta_fields = build_post_meta(post, username, job['import_method'])
+
+        job['meta'] = meta_fields
+        checkpoint = job['checkpoint']
+        if checkpoint.get('post_id'):
+            # Created by an earlier attempt - never create it twice
+            job['title'] = checkpoint['title']
+            job['post_id'] = checkpoint['post_id']
+            job['wordpress_post'] = None
+            job['mcp_calls'] = 0
+            return
+
+        created = self.mcp_client.create_post_with_meta(
+            title=post_title,
+            content=content,
+            status=status,
+            meta=meta_fields
+        )
+        if not created['post_id']:
+            # Fail the create stage so the post is reported and retried instead of recorded without an ID
+            raise Exception(f"WordPress did not return a post ID: {str(created['wordpress_post'])[:200]}")
+        job['title'] = post_title
+        job['post_id'] = created['post_id']
+        job['wordpress_post'] = created['wordpress_post']
+        job['mcp_calls'] = 1
+        self._checkpoint(job, post_id=created['post_id'], title=post_title)
+
+    def _finalize_post_stage(self, job: Dict):
+        """Write leftover meta and the featured image in one batched call"""
+        checkpoint = job['checkpoint']
+        if job['already_done']:
+            return
+
+        meta = None if checkpoint.get('meta_written') else job['meta']
+        featured_media_id = None if checkpoint.get('featured_set') else job['media_id']
+        finished = self.mcp_client.finish_post(job['post_id'], job.pop('wordpress_post'), meta, featured_media_id)
+        job['mcp_calls'] += finished['mcp_calls']
+
+        meta_written = bool(checkpoint.get('meta_written')) or 'wp_update_post_meta' not in finished['failed']
+        featured_set = bool(checkpoint.get('featured_set')) or (
+            bool(featured_media_id) and 'wp_set_featured_image' not in finished['failed'])
+        self._checkpoint(job, meta_written=int(meta_written), featured_set=int(featured_set),
+                         done=int(not finished['failed']), error=None)
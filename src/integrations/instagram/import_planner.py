@@ -0,0 +1,226 @@
+"""
+Instagram import planner
+Dry run of an import: how many posts are new versus already tracked, how
+many images are already cached locally or in the media library, the CDN,
+REST and MCP calls the import would issue, the Apify spend, and a wall-clock
+estimate built from recorded per-call latencies
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from .import_engine import post_media_assets
+
+logger = logging.getLogger(__name__)
+
+# Seconds per call when nothing has been recorded yet
+DEFAULT_LATENCY_SECONDS = {
+    'cdn_image_download': 0.5,
+    'cdn_video_download': 5.0,
+    'rest_media_lookup': 0.3,
+    'rest_media_upload': 1.5,
+    'wp_upload_media': 3.0,
+    'wp_create_post': 1.0,
+    'finish_post': 1.0
+}
+
+
+class ImportPlanner:
+    """
+    Plans an ImportEngine run without importing anything
+
+    Nothing is downloaded, uploaded or created; the only optional side
+    effect is an Apify scrape (scrape=True), whose result is cached so the
+    real import reuses it.
+    """
+
+    def __init__(self, import_engine, scraper=None, image_cache=None):
+        """
+        Args:
+            import_engine: ImportEngine the import would run on
+            scraper: CachedApifyInstagramScraper for planning by username
+            image_cache: InstagramImageCache (default: the shared one)
+        """
+        self.engine = import_engine
+        self.scraper = scraper
+        self._image_cache = image_cache
+
+    @property
+    def image_cache(self):
+        if self._image_cache is None:
+            from ...utils.image_cache import image_cache
+            self._image_cache = image_cache
+        return self._image_cache
+
+    def plan(self, posts: List[Dict] = None, username: str = None, limit: int = 10, scrape: bool = False) -> Dict:
+        """
+        Plan importing posts, or an Apify user's latest posts
+
+        Args:
+            posts: Posts to plan for (as the import routes receive them)
+            username: Plan an Apify import of this user instead
+            limit: Posts to scrape for username
+            scrape: Scrape username via Apify when no cached result exists
+
+        Returns:
+            {'source', 'username', 'posts', 'media', 'calls', 'apify', 'estimate'}; source is
+            'request', 'apify_cache', 'apify' or 'estimate' (not scraped yet: every post is
+            assumed new with one image)
+        """
+        source = 'request'
+        apify = None
+        if posts is None:
+            if not username:
+                raise Exception("Posts or a username is required")
+            if self.scraper is None:
+                raise Exception("Apify integration not configured")
+            posts = self.scraper.get_cached_user_posts(username, limit)
+            if posts is not None:
+                source = 'apify_cache'
+                apify = {**self.scraper.estimate_cost('user_posts', 0), 'cached': True}
+            else:
+                apify = {**self.scraper.estimate_cost('user_posts', limit), 'cached': False}
+                if scrape:
+                    posts = self.scraper.scrape_user_posts(username, limit)
+                    source = 'apify'
+                else:
+                    source = 'estimate'
+
+        if source == 'estimate':
+            new_posts = [{}] * limit
+            skipped = []
+            assets = [[{'type': 'image'}] for _ in new_posts]
+        else:
+            new_posts, skipped = (self.engine.post_tracker.filter_new_posts(posts) if self.engine.post_tracker
+                                  else (posts, []))
+            assets = [post_media_assets(post) for post in new_posts]
+
+        media = self._count_media(assets)
+        calls = self._count_calls(len(new_posts), assets, media)
+        return {
+            'source': source,
+            'username': username,
+            'posts': {
+                'total': len(new_posts) + len(skipped),
+                'new': len(new_posts),
+                'already_imported': len(skipped),
+                'skipped_posts': skipped
+            },
+            'media': media,
+            'calls': calls,
+            'apify': apify,
+            'estimate': self._estimate_time(len(new_posts), assets, media, calls)
+        }
+
+    def _count_media(self, assets: List[List[Dict]]) -> Dict[str, int]:
+        """Images and videos to import, and how many need no upload"""
+        site = self.engine.site_url
+        media_index = self.engine.media_index
+        in_cache = in_library = 0
+        for asset in (asset for post_assets in assets for asset in post_assets):
+            if asset['type'] != 'image' or not asset.get('url'):
+                continue
+            cached_path = self.image_cache.get_cached_path(asset['url'])
+            if not cached_path:
+                continue
+            in_cache += 1
+            # Bytes we already have locally can be matched against uploaded attachments
+            if media_index and media_index.lookup(media_index.hash_file(cached_path), site):
+                in_library += 1
+
+        images = sum(1 for post_assets in assets for asset in post_assets if asset['type'] == 'image')
+        videos = sum(1 for post_assets in assets for asset in post_assets if asset['type'] == 'video')
+        return {
+            'images': images,
+            'videos': videos,
+            'carousels': sum(1 for post_assets in assets if len(post_assets) > 1),
+            'in_local_cache': in_cache,
+            'in_media_library': in_library,
+            'to_upload': images + videos - in_library
+        }
+
+    def _count_calls(self, new_count: int, assets: List[List[Dict]], media: Dict[str, int]) -> Dict:
+        """Calls the import would issue, by endpoint"""
+        rest = self.engine.has_rest_credentials()
+        with_image = sum(1 for post_assets in assets if any(asset['type'] == 'image' for asset in post_assets))
+        mcp = {
+            'wp_create_post': new_count,
+            # At most: skipped when the server already stored the meta_input
+            'wp_update_post_meta': new_count,
+            'wp_set_featured_image': with_image,
+            'wp_upload_media': 0 if rest else media['to_upload']
+        }
+        batched = self.engine.mcp_client.batch_supported is not False
+        follow_ups = mcp['wp_update_post_meta'] + mcp['wp_set_featured_image']
+        return {
+            'cdn_downloads': media['images'] + media['videos'],
+            'rest': {
+                'media_upload': media['to_upload'] if rest else 0,
+                'media_lookup': media['in_media_library'] if rest else 0
+            },
+            'mcp': {
+                **mcp,
+                'total': sum(mcp.values()),
+                # Meta and featured image go out as one batch per post when the server accepts batches
+                'round_trips': new_count + mcp['wp_upload_media'] + (
+                    min(follow_ups, new_count) if batched else follow_ups)
+            }
+        }
+
+    def _estimate_time(self, new_count: int, assets: List[List[Dict]], media: Dict[str, int], calls: Dict) -> Dict:
+        """Pipeline wall-clock estimate: the slowest stage, plus one post's trip through the others"""
+        latency = {}
+        latency_source = {}
+        for name in DEFAULT_LATENCY_SECONDS:
+            latency[name], latency_source[name] = self._latency(name)
+
+        workers = self.engine.workers
+        per_post = max((len(post_assets) for post_assets in assets), default=1)
+        asset_parallelism = max(1, min(self.engine.asset_workers, per_post))
+        upload_call = 'rest_media_upload' if calls['rest']['media_upload'] else 'wp_upload_media'
+        work = {
+            'fetch': (media['images'] * latency['cdn_image_download'] +
+                      media['videos'] * latency['cdn_video_download']) / asset_parallelism,
+            'upload': (media['to_upload'] * latency[upload_call] +
+                       calls['rest']['media_lookup'] * latency['rest_media_lookup']),
+            'create': new_count * latency['wp_create_post'],
+            'finalize': new_count * latency['finish_post']
+        }
+        stages = {stage: seconds / workers[stage] for stage, seconds in work.items()}
+        # Upload, create and finalize share the WordPress concurrency limit
+        stages['wordpress'] = (work['upload'] + work['create'] + work['finalize']) / max(
+            1, self.engine.mcp_client.limiter.limit)
+
+        bottleneck = max(stages, key=stages.get)
+        fill = (latency['cdn_image_download'] + latency[upload_call] + latency['wp_create_post'] +
+                latency['finish_post']) if new_count else 0.0
+        return {
+            'seconds': math.ceil(stages[bottleneck] + fill),
+            'bottleneck': bottleneck,
+            'stages': {stage: round(seconds, 2) for stage, seconds in stages.items()},
+            'latency_seconds': {name: round(value, 3) for name, value in latency.items()},
+            'latency_source': latency_source
+        }
+
+    def _latency(self, name: str) -> Tuple[float, str]:
+        """Mean recorded latency of a call in seconds, else the default"""
+        if name == 'finish_post':
+            # Its batched calls each record the whole round trip
+            recorded = [self._recorded(tool) for tool in ('wp_set_featured_image', 'wp_update_post_meta')]
+            recorded = [value for value in recorded if value is not None]
+            if recorded:
+                return max(recorded), 'recorded'
+            return DEFAULT_LATENCY_SECONDS[name], 'default'
+
+        recorded = self._recorded(name)
+        if recorded is not None:
+            return recorded, 'recorded'
+        return DEFAULT_LATENCY_SECONDS[name], 'default'
+
+    def _recorded(self, name: str) -> Optional[float]:
+        for metrics in (self.engine.transfer_metrics, self.engine.mcp_client.metrics):
+            tool = metrics.snapshot()['tools'].get(name)
+            if tool and tool['calls'] > tool['errors']:
+                return tool['latency_ms']['mean'] / 1000
+        return None
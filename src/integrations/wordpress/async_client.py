@@ -0,0 +1,255 @@
+"""
+Asynchronous WordPress AIWU MCP client
+httpx-based client with bounded concurrency, plus a sync facade so Flask
+routes can fan out independent calls and wait on all of them
+"""
+
+import asyncio
+import threading
+import time
+import logging
+import httpx
+
+from .circuit_breaker import CircuitOpenError
+from .client import MCPTimeoutError, WordPressTools
+from .concurrency import OK, OVERLOAD
+from .mcp_metrics import MCPMetrics
+from .response_decoder import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - lets httpx multiplex calls over one HTTP/2 connection
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+class AsyncWordPressMCPClient(WordPressTools):
+    """
+    Async MCP client for WordPress AIWU plugin
+
+    Exposes the same tool methods as WordPressMCPClient (get_posts, create_post,
+    update_post_meta, set_featured_image, ...), each returning an awaitable.
+    All calls share one httpx.AsyncClient with keep-alive connections, and at
+    most max_concurrency calls are in flight at once. When the h2 package is
+    installed and the site speaks HTTP/2, the calls are multiplexed over a
+    single connection. Use a client from a single event loop.
+    """
+
+    def __init__(self, wordpress_url, access_token, max_concurrency=8, timeout=30.0, transport=None, metrics=None,
+                 limiter=None, breaker=None):
+        self.wordpress_url = wordpress_url
+        self.access_token = access_token
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._transport = transport
+        self.metrics = metrics or MCPMetrics()
+        # Optional AIMDLimiter and CircuitBreaker shared with the sync client so both back off together
+        self.limiter = limiter
+        self.breaker = breaker
+        self._client = None
+        self._semaphore = None
+
+    def _get_client(self):
+        """Create the shared httpx client on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json',
+                    'User-Agent': 'Standalone-WordPress-MCP/1.0'
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                timeout=self.timeout,
+                http2=HTTP2_AVAILABLE,
+                transport=self._transport
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def call_mcp_function(self, method, params=None, timeout=None):
+        """Call WordPress MCP function; timeout overrides the client default for this call"""
+        client = self._get_client()
+        mcp_request = self._build_request(method, params)
+        body = dumps(mcp_request)
+        response = None
+        error = None
+        elapsed = 0.0
+        
+        try:
+            if self.breaker:
+                self.breaker.before_call()
+            async with self._semaphore:
+                token = await self._acquire_slot() if self.limiter else None
+                outcome = OK
+                logger.info(f"Calling MCP function (async): {method}")
+                start = time.perf_counter()
+                try:
+                    response = await client.post(self._endpoint_url(), content=body,
+                                                 timeout=timeout or self.timeout)
+                    if self.breaker:
+                        self.breaker.record_success()
+                    if response.status_code == 429 or response.status_code >= 500:
+                        outcome = OVERLOAD
+                except httpx.TimeoutException:
+                    outcome = OVERLOAD
+                    if self.breaker:
+                        self.breaker.record_failure()
+                    raise MCPTimeoutError("Request timed out")
+                except httpx.TransportError:
+                    outcome = OVERLOAD
+                    if self.breaker:
+                        self.breaker.record_failure()
+                    raise Exception("Connection failed - check WordPress site and MCP plugin")
+                finally:
+                    elapsed = time.perf_counter() - start
+                    if self.limiter:
+                        self.limiter.release(token, outcome, elapsed if outcome == OK else None)
+            
+            if response.status_code == 200:
+                return self._unwrap_response(method, loads(response.content), mcp_request['id'])
+            else:
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
+        
+        except Exception as e:
+            error = e
+            if self.breaker and response is None and not isinstance(e, CircuitOpenError):
+                self.breaker.abandon()
+            logger.error(f"MCP call failed: {str(e)}")
+            raise
+        finally:
+            if response is not None or error is not None:
+                self.metrics.record(method, elapsed, len(body),
+                                    len(response.content) if response is not None else 0,
+                                    error=error is not None, timeout=isinstance(error, MCPTimeoutError))
+    
+    async def _acquire_slot(self):
+        """
+        Wait for a limiter slot on a worker thread
+
+        Cancelling the caller cannot stop the thread's wait, so a slot it
+        still acquires afterwards is handed straight back; otherwise the
+        shared limiter would lose that capacity for good.
+        """
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self.limiter.acquire, self.timeout))
+        try:
+            return await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(self._abandon_slot)
+            raise
+
+    def _abandon_slot(self, acquiring):
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self.limiter.abandon(acquiring.result())
+
+    async def call_many(self, calls, return_exceptions=False, timeout=None):
+        """
+        Run several MCP calls concurrently
+
+        Args:
+            calls: List of (method, params) tuples
+            return_exceptions: Put failed calls' exceptions in the result list
+                instead of raising the first one
+            timeout: Per-call timeout override
+
+        Returns:
+            List of results in the same order as calls
+        """
+        return await asyncio.gather(
+            *(self.call_mcp_function(method, params, timeout=timeout) for method, params in calls),
+            return_exceptions=return_exceptions
+        )
+
+    async def create_post_full(self, title, content, status='draft', meta=None, featured_media_id=None,
+                               excerpt=None, post_type='post'):
+        """Create a post, then write its meta and featured image concurrently"""
+        params = self._create_post_params(title, content, excerpt, status, post_type, meta)
+        wp_result = await self.call_mcp_function('wp_create_post', params)
+        post_id = self.extract_post_id(wp_result)
+
+        follow_up = self._post_follow_up_calls(post_id, wp_result, meta, featured_media_id)
+        if follow_up:
+            results = await self.call_many(follow_up, return_exceptions=True)
+            for (method, _), result in zip(follow_up, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"{method} failed for post {post_id}: {result}")
+
+        return {
+            'post_id': post_id,
+            'wordpress_post': wp_result,
+            'mcp_calls': 1 + len(follow_up),
+            'round_trips': 2 if follow_up else 1
+        }
+
+    async def aclose(self):
+        """Close the shared httpx client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+class MCPFanout:
+    """
+    Sync facade over AsyncWordPressMCPClient for Flask request threads
+
+    Runs the async client on a private event-loop thread, started on first
+    use, so a route can submit N independent calls and block until all finish.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        """Start the background event loop thread if it is not running"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='mcp-fanout', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def _run(self, coro, timeout=None):
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout)
+
+    def gather(self, calls, return_exceptions=True, timeout=None):
+        """
+        Run independent MCP calls concurrently and wait for all of them
+
+        Args:
+            calls: List of (method, params) tuples
+            return_exceptions: Return failed calls as exceptions in the list
+            timeout: Overall wait limit in seconds
+
+        Returns:
+            List of results in the same order as calls
+        """
+        return self._run(self.client.call_many(calls, return_exceptions=return_exceptions), timeout)
+
+    def call(self, method, params=None, timeout=None):
+        """Run a single MCP call on the fan-out loop"""
+        return self._run(self.client.call_mcp_function(method, params, timeout=timeout))
+
+    def close(self):
+        """Close the async client and stop the loop thread"""
+        with self._lock:
+            if self._thread is None:
+                return
+            asyncio.run_coroutine_threadsafe(self.client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._thread = None
+            self._loop = None
@@ -0,0 +1,108 @@
+"""
+Circuit breaker for the WordPress endpoint
+Opens after consecutive connection failures or timeouts so callers fail
+fast instead of each waiting out the full request timeout
+"""
+
+import threading
+import time
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling WordPress while the circuit is open"""
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; open ->
+    half-open once recovery_timeout has passed. In half-open state up to
+    half_open_max_calls probe calls go through: a success closes the
+    circuit, a failure opens it again. Everything else fails fast.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probes_in_flight = 0
+        self._stats = {'opened': 0, 'rejected': 0, 'probes': 0}
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Check whether a call may go out
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with its probes in flight
+        """
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = HALF_OPEN
+                self._probes_in_flight = 0
+                logger.info("🔌 WordPress circuit half-open - sending probe call")
+
+            if self.state == CLOSED:
+                return
+            if self.state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                self._stats['probes'] += 1
+                return
+
+            self._stats['rejected'] += 1
+            raise CircuitOpenError(
+                f"WordPress unavailable - circuit open after {self.consecutive_failures} failures, "
+                f"retrying in {self._retry_in():.0f}s"
+            )
+
+    def record_success(self):
+        """WordPress answered (any HTTP status)"""
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("✅ WordPress circuit closed - endpoint reachable again")
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probes_in_flight = 0
+
+    def record_failure(self):
+        """Connection failure or timeout"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._probes_in_flight = 0
+                self._stats['opened'] += 1
+                logger.warning(f"⚠️ WordPress circuit open after {self.consecutive_failures} consecutive failures - "
+                               f"failing fast for {self.recovery_timeout:.0f}s")
+
+    def abandon(self):
+        """A permitted call ended without reaching WordPress (e.g. no free call slot)"""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def _retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the circuit state and counters"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_in': round(self._retry_in(), 1),
+                **self._stats
+            }
@@ -0,0 +1,850 @@
+"""
+WordPress AIWU MCP client
+Synchronous JSON-RPC client for the AIWU MCP endpoint, plus the tool
+wrappers it shares with the async client
+"""
+
+import itertools
+import threading
+import time
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AIMDLimiter, OVERLOAD
+from .mcp_cache import MCPResponseCache, READ_TOOLS
+from .mcp_metrics import MCPMetrics
+from .response_decoder import dumps, loads, unwrap_result, extract_post_id
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class MCPTimeoutError(Exception):
+    """An MCP request did not complete within its timeout"""
+
+class MCPResponseFormatError(Exception):
+    """An MCP tool replied with data of an unexpected shape"""
+
+class RequestIdAllocator:
+    """
+    Hands out unique, increasing JSON-RPC request ids
+    
+    Seeded from the clock in microseconds so ids from a restarted process
+    do not repeat the previous run's.
+    """
+    
+    def __init__(self, start=None):
+        self._counter = itertools.count(start if start is not None else int(time.time() * 1_000_000))
+        self._lock = threading.Lock()
+    
+    def next_id(self):
+        with self._lock:
+            return next(self._counter)
+
+# Shared by every client in the process so concurrent requests never share an id
+request_ids = RequestIdAllocator()
+
+class WordPressTools:
+    """
+    WordPress tool wrappers shared by the sync and async MCP clients
+    
+    Every wrapper returns self.call_mcp_function(...), so on the async client
+    the same methods return awaitables.
+    """
+    
+    def _endpoint_url(self):
+        """Build the authenticated MCP endpoint URL"""
+        return f"{self.wordpress_url}?token={self.access_token}"
+    
+    def _build_request(self, method, params=None, request_id=None):
+        """Build a JSON-RPC tools/call request"""
+        if params is None:
+            params = {}
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id if request_id is not None else request_ids.next_id(),
+            "method": "tools/call",
+            "params": {
+                "name": method,
+                "arguments": params
+            }
+        }
+    
+    def _unwrap_response(self, method, result, request_id=None):
+        """Turn a single JSON-RPC response object into the tool result"""
+        if request_id is not None and result.get('id') not in (None, request_id):
+            raise Exception(f"MCP Error: response id {result.get('id')} does not match request id {request_id} for {method}")
+        if 'result' in result:
+            # AIWU nests the tool output as text in result.content[0]
+            return unwrap_result(result['result'])
+        elif 'error' in result:
+            raise Exception(f"MCP Error: {result['error']}")
+        else:
+            return result
+    
+    @staticmethod
+    def extract_post_id(wp_result):
+        """Parse the post ID from a wp_create_post result (dict or "Post created ID 32" text)"""
+        return extract_post_id(wp_result)
+    
+    @staticmethod
+    def _create_post_params(title, content, excerpt=None, status='draft', post_type='post', meta=None):
+        """Build wp_create_post arguments, with meta sent as meta_input"""
+        params = {
+            'post_title': title,
+            'post_content': content,
+            'post_status': status,
+            'post_type': post_type
+        }
+        if excerpt:
+            params['post_excerpt'] = excerpt
+        if meta:
+            params['meta_input'] = meta
+        return params
+    
+    @staticmethod
+    def _post_follow_up_calls(post_id, wp_result, meta=None, featured_media_id=None):
+        """Calls still needed after wp_create_post: meta it did not echo back, featured image"""
+        follow_up = []
+        if post_id:
+            saved_meta = wp_result.get('meta') if isinstance(wp_result, dict) else None
+            if meta and not (isinstance(saved_meta, dict) and set(meta) <= set(saved_meta)):
+                follow_up.append(('wp_update_post_meta', {'ID': post_id, 'meta': meta}))
+            if featured_media_id:
+                follow_up.append(('wp_set_featured_image', {'post_id': post_id, 'media_id': featured_media_id}))
+        return follow_up
+    
+    def ping(self):
+        """Test connection to WordPress"""
+        return self.call_mcp_function('mcp_ping')
+    
+    def get_posts(self, limit=20, post_status=None, search=None):
+        """Get WordPress posts"""
+        params = {'limit': limit}
+        if post_status:
+            params['post_status'] = post_status
+        if search:
+            params['search'] = search
+        return self.call_mcp_function('wp_get_posts', params)
+    
+    def get_post(self, post_id):
+        """Get single WordPress post"""
+        return self.call_mcp_function('wp_get_post', {'ID': post_id})
+    
+    def create_post(self, title, content, excerpt=None, status='draft', post_type='post'):
+        """Create WordPress post"""
+        return self.call_mcp_function('wp_create_post', self._create_post_params(title, content, excerpt, status, post_type))
+    
+    def update_post(self, post_id, fields):
+        """Update WordPress post"""
+        return self.call_mcp_function('wp_update_post', {
+            'ID': post_id,
+            'fields': fields
+        })
+    
+    def delete_post(self, post_id, force=True):
+        """Delete WordPress post"""
+        return self.call_mcp_function('wp_delete_post', {
+            'ID': post_id,
+            'force': force
+        })
+    
+    def list_plugins(self):
+        """List WordPress plugins"""
+        return self.call_mcp_function('wp_list_plugins')
+    
+    def get_users(self, limit=10):
+        """Get WordPress users"""
+        return self.call_mcp_function('wp_get_users', {'limit': limit})
+    
+    def upload_media(self, url, title=None, alt=None):
+        """Upload media from URL"""
+        params = {'url': url}
+        if title:
+            params['title'] = title
+        if alt:
+            params['alt'] = alt
+        return self.call_mcp_function('wp_upload_media', params)
+    
+    def generate_ai_image(self, prompt, title=None):
+        """Generate AI image via AIWU"""
+        params = {'message': prompt}
+        if title:
+            params['title'] = title
+        return self.call_mcp_function('aiwu_image', params)
+    
+    # Content Management - Missing Functions
+    def count_posts(self, post_type='post'):
+        """Count posts by status"""
+        params = {}
+        if post_type:
+            params['post_type'] = post_type
+        return self.call_mcp_function('wp_count_posts', params)
+    
+    # User Management - Missing Functions
+    def create_user(self, user_login, user_email, user_pass=None, display_name=None, role=None):
+        """Create WordPress user"""
+        params = {
+            'user_login': user_login,
+            'user_email': user_email
+        }
+        if user_pass:
+            params['user_pass'] = user_pass
+        if display_name:
+            params['display_name'] = display_name
+        if role:
+            params['role'] = role
+        return self.call_mcp_function('wp_create_user', params)
+    
+    def update_user(self, user_id, fields):
+        """Update WordPress user"""
+        return self.call_mcp_function('wp_update_user', {
+            'ID': user_id,
+            'fields': fields
+        })
+    
+    # Post Meta & Custom Fields
+    def get_post_meta(self, post_id, key=None):
+        """Get post meta/custom fields"""
+        params = {'ID': post_id}
+        if key:
+            params['key'] = key
+        return self.call_mcp_function('wp_get_post_meta', params)
+    
+    def update_post_meta(self, post_id, key=None, value=None, meta=None):
+        """Update post meta/custom fields"""
+        params = {'ID': post_id}
+        if key and value is not None:
+            params['key'] = key
+            params['value'] = value
+        elif meta:
+            params['meta'] = meta
+        return self.call_mcp_function('wp_update_post_meta', params)
+    
+    def delete_post_meta(self, post_id, key, value=None):
+        """Delete post meta/custom fields"""
+        params = {
+            'ID': post_id,
+            'key': key
+        }
+        if value is not None:
+            params['value'] = value
+        return self.call_mcp_function('wp_delete_post_meta', params)
+    
+    # Media Management - Missing Functions
+    def get_media(self, limit=20, search=None, after=None, before=None):
+        """Get media items"""
+        params = {'limit': limit}
+        if search:
+            params['search'] = search
+        if after:
+            params['after'] = after
+        if before:
+            params['before'] = before
+        return self.call_mcp_function('wp_get_media', params)
+    
+    def update_media(self, media_id, title=None, alt=None, caption=None, description=None):
+        """Update media/attachment"""
+        params = {'ID': media_id}
+        if title:
+            params['title'] = title
+        if alt:
+            params['alt'] = alt
+        if caption:
+            params['caption'] = caption
+        if description:
+            params['description'] = description
+        return self.call_mcp_function('wp_update_media', params)
+    
+    def delete_media(self, media_id, force=True):
+        """Delete media/attachment"""
+        return self.call_mcp_function('wp_delete_media', {
+            'ID': media_id,
+            'force': force
+        })
+    
+    def set_featured_image(self, post_id, media_id=None):
+        """Set or remove featured image"""
+        params = {'post_id': post_id}
+        if media_id:
+            params['media_id'] = media_id
+        return self.call_mcp_function('wp_set_featured_image', params)
+    
+    def count_media(self, after=None, before=None):
+        """Count media attachments"""
+        params = {}
+        if after:
+            params['after'] = after
+        if before:
+            params['before'] = before
+        return self.call_mcp_function('wp_count_media', params)
+    
+    # Taxonomies (Categories & Tags)
+    def get_taxonomies(self, post_type=None):
+        """Get taxonomies for post type"""
+        params = {}
+        if post_type:
+            params['post_type'] = post_type
+        return self.call_mcp_function('wp_get_taxonomies', params)
+    
+    def get_terms(self, taxonomy, limit=50, parent=None, search=None):
+        """Get terms from taxonomy"""
+        params = {'taxonomy': taxonomy}
+        if limit:
+            params['limit'] = limit
+        if parent is not None:
+            params['parent'] = parent
+        if search:
+            params['search'] = search
+        return self.call_mcp_function('wp_get_terms', params)
+    
+    def create_term(self, taxonomy, term_name, description=None, parent=None, slug=None):
+        """Create taxonomy term"""
+        params = {
+            'taxonomy': taxonomy,
+            'term_name': term_name
+        }
+        if description:
+            params['description'] = description
+        if parent is not None:
+            params['parent'] = parent
+        if slug:
+            params['slug'] = slug
+        return self.call_mcp_function('wp_create_term', params)
+    
+    def update_term(self, term_id, taxonomy, name=None, description=None, parent=None, slug=None):
+        """Update taxonomy term"""
+        params = {
+            'term_id': term_id,
+            'taxonomy': taxonomy
+        }
+        if name:
+            params['name'] = name
+        if description:
+            params['description'] = description
+        if parent is not None:
+            params['parent'] = parent
+        if slug:
+            params['slug'] = slug
+        return self.call_mcp_function('wp_update_term', params)
+    
+    def delete_term(self, term_id, taxonomy):
+        """Delete taxonomy term"""
+        return self.call_mcp_function('wp_delete_term', {
+            'term_id': term_id,
+            'taxonomy': taxonomy
+        })
+    
+    def get_post_terms(self, post_id, taxonomy=None):
+        """Get terms attached to post"""
+        params = {'ID': post_id}
+        if taxonomy:
+            params['taxonomy'] = taxonomy
+        return self.call_mcp_function('wp_get_post_terms', params)
+    
+    def add_post_terms(self, post_id, terms, taxonomy=None, append=True):
+        """Add terms to post"""
+        params = {
+            'ID': post_id,
+            'terms': terms,
+            'append': append
+        }
+        if taxonomy:
+            params['taxonomy'] = taxonomy
+        return self.call_mcp_function('wp_add_post_terms', params)
+    
+    def count_terms(self, taxonomy):
+        """Count terms in taxonomy"""
+        return self.call_mcp_function('wp_count_terms', {'taxonomy': taxonomy})
+    
+    # Comments
+    def get_comments(self, limit=20, post_id=None, status=None, search=None, offset=None, paged=None):
+        """Get comments"""
+        params = {'limit': limit}
+        if post_id:
+            params['post_id'] = post_id
+        if status:
+            params['status'] = status
+        if search:
+            params['search'] = search
+        if offset:
+            params['offset'] = offset
+        if paged:
+            params['paged'] = paged
+        return self.call_mcp_function('wp_get_comments', params)
+    
+    def create_comment(self, post_id, comment_content, comment_author=None, comment_author_email=None, 
+                      comment_author_url=None, comment_approved='1'):
+        """Create comment"""
+        params = {
+            'post_id': post_id,
+            'comment_content': comment_content
+        }
+        if comment_author:
+            params['comment_author'] = comment_author
+        if comment_author_email:
+            params['comment_author_email'] = comment_author_email
+        if comment_author_url:
+            params['comment_author_url'] = comment_author_url
+        if comment_approved:
+            params['comment_approved'] = comment_approved
+        return self.call_mcp_function('wp_create_comment', params)
+    
+    def update_comment(self, comment_id, fields):
+        """Update comment"""
+        return self.call_mcp_function('wp_update_comment', {
+            'comment_ID': comment_id,
+            'fields': fields
+        })
+    
+    def delete_comment(self, comment_id, force=True):
+        """Delete comment"""
+        return self.call_mcp_function('wp_delete_comment', {
+            'comment_ID': comment_id,
+            'force': force
+        })
+    
+    # Site Options
+    def get_option(self, key):
+        """Get WordPress option"""
+        return self.call_mcp_function('wp_get_option', {'key': key})
+    
+    def update_option(self, key, value):
+        """Update WordPress option"""
+        return self.call_mcp_function('wp_update_option', {
+            'key': key,
+            'value': value
+        })
+    
+    # Post Types
+    def get_post_types(self):
+        """Get public post types"""
+        return self.call_mcp_function('wp_get_post_types')
+
+class WordPressMCPClient(WordPressTools):
+    """
+    Direct MCP client for WordPress AIWU plugin
+    
+    Results of read-only tools are kept in a read-through TTL cache
+    (cache_size entries, 0 disables it); write tools invalidate the cached
+    reads they affect. Identical read calls made from several threads while
+    one is in flight share that single request.
+    
+    A single client is safe to share between Flask threads: every request
+    gets a unique id, responses are checked against it, and all threads
+    share one pool of up to max_connections keep-alive connections. How many
+    of those are used at once is set by an adaptive (AIMD) limiter that backs
+    off when WordPress answers 429/5xx or times out. After repeated connection
+    failures or timeouts a circuit breaker makes calls fail immediately
+    (CircuitOpenError) until a probe call gets through again.
+    """
+    
+    def __init__(self, wordpress_url, access_token, cache_size=512, cache_ttls=None, metrics=None,
+                 max_connections=10, limiter=None, breaker=None):
+        self.wordpress_url = wordpress_url
+        self.access_token = access_token
+        self.session = requests.Session()
+        # Threads wait for a free pooled connection instead of opening throwaway ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': 'Standalone-WordPress-MCP/1.0'
+        })
+        self.timeout = 30
+        # None until the first batch tells us whether the server accepts JSON-RPC batches
+        self.batch_supported = None
+        self.cache = MCPResponseCache(cache_size, cache_ttls) if cache_size else None
+        self.single_flight = SingleFlight()
+        self.metrics = metrics or MCPMetrics()
+        self.limiter = limiter or AIMDLimiter(max_limit=max_connections)
+        self.breaker = breaker or CircuitBreaker()
+        
+    def _post(self, body, timeout=None, judge_latency=True):
+        """
+        POST an encoded JSON-RPC payload (single request or batch array) to WordPress
+        
+        Fails fast while the circuit breaker is open. Otherwise waits for a
+        slot from the concurrency limiter and reports back whether WordPress
+        looked overloaded (429/5xx, timeout, connection failure).
+        """
+        self.breaker.before_call()
+        try:
+            with self.limiter.slot(self.timeout) as slot:
+                start = time.perf_counter()
+                try:
+                    response = self.session.post(self._endpoint_url(), data=body, timeout=timeout or self.timeout)
+                except requests.exceptions.Timeout:
+                    slot.outcome = OVERLOAD
+                    self.breaker.record_failure()
+                    raise MCPTimeoutError("Request timed out")
+                except requests.exceptions.ConnectionError:
+                    slot.outcome = OVERLOAD
+                    self.breaker.record_failure()
+                    raise Exception("Connection failed - check WordPress site and MCP plugin")
+                
+                self.breaker.record_success()
+                if response.status_code == 429 or response.status_code >= 500:
+                    slot.outcome = OVERLOAD
+                elif judge_latency:
+                    slot.latency = time.perf_counter() - start
+                return response
+        except Exception:
+            self.breaker.abandon()
+            raise
+    
+    def call_mcp_function(self, method, params=None, use_cache=True):
+        """Call WordPress MCP function, serving read-only tools from the cache when possible"""
+        if use_cache:
+            hit, cached = self._cache_lookup(method, params)
+            if hit:
+                logger.info(f"MCP cache hit: {method}")
+                return cached
+        
+        if method in READ_TOOLS:
+            key = MCPResponseCache.make_key(method, params)
+            return self.single_flight.do(key, self._fetch, method, params)
+        return self._fetch(method, params)
+    
+    def _fetch(self, method, params):
+        """Send a call and update the cache with its outcome"""
+        try:
+            result = self._send(method, params)
+        except Exception as e:
+            self._cache_result(method, params, e)
+            raise
+        
+        self._cache_result(method, params, result)
+        return result
+    
+    def _send(self, method, params=None):
+        """Send one tools/call request to WordPress, bypassing the cache"""
+        # Create MCP request
+        mcp_request = self._build_request(method, params)
+        body = dumps(mcp_request)
+        response = None
+        error = None
+        start = time.perf_counter()
+        
+        try:
+            # Make request to WordPress MCP endpoint
+            logger.info(f"Calling MCP function: {method}")
+            response = self._post(body)
+            
+            if response.status_code == 200:
+                return self._unwrap_response(method, loads(response.content), mcp_request['id'])
+            else:
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
+                
+        except Exception as e:
+            error = e
+            logger.error(f"MCP call failed: {str(e)}")
+            raise
+        finally:
+            self.metrics.record(method, time.perf_counter() - start, len(body),
+                                len(response.content) if response is not None else 0,
+                                error=error is not None, timeout=isinstance(error, MCPTimeoutError))
+    
+    def _cache_lookup(self, method, params):
+        if self.cache is None:
+            return False, None
+        return self.cache.lookup(method, params)
+    
+    def _cache_result(self, method, params, result):
+        """Store a successful read, or invalidate what a write (even a failed one) may have changed"""
+        if self.cache is None:
+            return
+        if not self.cache.is_cacheable(method):
+            self.cache.invalidate_for(method)
+        elif not isinstance(result, Exception):
+            self.cache.store(method, params, result)
+    
+    def call_many(self, calls, return_exceptions=False):
+        """
+        Call several MCP functions in one JSON-RPC batch request
+        
+        All calls are packed into a single batch array and sent in one POST;
+        responses are matched back to their calls by id. If the server rejects
+        batches (JSON-RPC -32600, or a 200 reply that is not an array), the
+        calls are sent one after another over the same keep-alive session
+        instead and batching is not attempted again. A batch that fails for
+        any other reason (5xx, a malformed reply, a timeout) may already have
+        run on the server, so it is not sent again: every call in it gets
+        the error, and batching is tried again next time. Cached reads are
+        answered locally and left out of the request.
+        
+        Args:
+            calls: List of (method, params) tuples
+            return_exceptions: Put failed calls' exceptions in the result list
+                instead of raising the first one
+            
+        Returns:
+            List of results in the same order as calls
+        """
+        calls = [(method, params or {}) for method, params in calls]
+        if not calls:
+            return []
+        
+        results = [None] * len(calls)
+        pending = []
+        for i, (method, params) in enumerate(calls):
+            hit, cached = self._cache_lookup(method, params)
+            if hit:
+                results[i] = cached
+            else:
+                pending.append(i)
+        
+        if pending:
+            to_send = [calls[i] for i in pending]
+            if self.batch_supported is False or len(to_send) == 1:
+                sent = self._call_pipelined(to_send)
+            else:
+                sent = self._call_batch(to_send)
+                if sent is None:
+                    sent = self._call_pipelined(to_send)
+            
+            for i, result in zip(pending, sent):
+                results[i] = result
+                self._cache_result(*calls[i], result)
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    def _call_batch(self, calls):
+        """Send calls as one batch array; returns None if the server rejects batches"""
+        batch = [self._build_request(method, params) for method, params in calls]
+        encoded = [dumps(request_item) for request_item in batch]
+        
+        logger.info(f"Calling {len(calls)} MCP functions in one batch: {', '.join(sorted(set(m for m, _ in calls)))}")
+        start = time.perf_counter()
+        try:
+            response = self._post(b'[' + b','.join(encoded) + b']', timeout=self.timeout + len(calls),
+                                  judge_latency=False)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            for (method, _), request_body in zip(calls, encoded):
+                self.metrics.record(method, elapsed, len(request_body), 0,
+                                    error=True, timeout=isinstance(e, MCPTimeoutError))
+            logger.error(f"MCP batch call failed: {e}")
+            return [e] * len(calls)
+        elapsed = time.perf_counter() - start
+        
+        try:
+            payload = loads(response.content)
+        except ValueError:
+            payload = None
+        
+        if not isinstance(payload, list):
+            error = payload.get('error') if isinstance(payload, dict) else None
+            invalid_request = isinstance(error, dict) and error.get('code') == -32600
+            if invalid_request or (response.status_code == 200 and payload is not None):
+                # A definite answer: this server does not take batch arrays
+                logger.warning(f"WordPress MCP endpoint rejected batch request (HTTP {response.status_code}), "
+                               f"falling back to single calls")
+                self.batch_supported = False
+                return None
+            # 5xx or an unreadable reply: the batch may have run, so its calls are not re-sent
+            error = Exception(f"HTTP {response.status_code}: {response.text}")
+            logger.error(f"MCP batch call failed: {error}")
+            for (method, _), request_body in zip(calls, encoded):
+                self.metrics.record(method, elapsed, len(request_body), len(response.content) // len(calls),
+                                    error=True)
+            return [error] * len(calls)
+        
+        self.batch_supported = True
+        responses_by_id = {item.get('id'): item for item in payload if isinstance(item, dict)}
+        
+        results = []
+        for request_item, (method, _) in zip(batch, calls):
+            item = responses_by_id.get(request_item['id'])
+            if item is None:
+                results.append(Exception(f"MCP Error: no response for {method} (id {request_item['id']})"))
+                continue
+            try:
+                results.append(self._unwrap_response(method, item))
+            except Exception as e:
+                logger.error(f"MCP call failed: {str(e)}")
+                results.append(e)
+        
+        # Every call in the batch shares its latency; response bytes are split evenly
+        response_share = len(response.content) // len(calls)
+        for (method, _), request_body, result in zip(calls, encoded, results):
+            self.metrics.record(method, elapsed, len(request_body), response_share,
+                                error=isinstance(result, Exception))
+        return results
+    
+    def _call_pipelined(self, calls):
+        """Send calls back-to-back over the keep-alive session"""
+        results = []
+        for method, params in calls:
+            try:
+                results.append(self._send(method, params))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def create_post_full(self, title, content, status='draft', meta=None, featured_media_id=None,
+                         excerpt=None, post_type='post'):
+        """
+        Create a post together with its meta fields and featured image
+        
+        The meta is sent as meta_input on wp_create_post. Meta the server did not
+        echo back and the featured image are then written in one batch, so a post
+        takes two round-trips instead of one call per meta key.
+        
+        Returns:
+            Dictionary with post_id, wordpress_post (raw create result),
+            mcp_calls and round_trips
+        """
+        created = self.create_post_with_meta(title, content, status=status, meta=meta,
+                                             excerpt=excerpt, post_type=post_type)
+        finished = self.finish_post(created['post_id'], created['wordpress_post'], meta, featured_media_id)
+        return {
+            'post_id': created['post_id'],
+            'wordpress_post': created['wordpress_post'],
+            'mcp_calls': 1 + finished['mcp_calls'],
+            'round_trips': 1 + finished['round_trips']
+        }
+    
+    def create_post_with_meta(self, title, content, status='draft', meta=None, excerpt=None, post_type='post'):
+        """
+        First half of create_post_full: wp_create_post with meta_input
+        
+        Returns:
+            Dictionary with post_id and wordpress_post (raw create result)
+        """
+        params = self._create_post_params(title, content, excerpt, status, post_type, meta)
+        wp_result = self.call_mcp_function('wp_create_post', params)
+        return {'post_id': self.extract_post_id(wp_result), 'wordpress_post': wp_result}
+    
+    def finish_post(self, post_id, wp_result, meta=None, featured_media_id=None):
+        """
+        Second half of create_post_full: write meta the create call did not
+        store and the featured image, batched into one request
+        
+        Returns:
+            Dictionary with mcp_calls and round_trips used, and the tool
+            names of follow-up calls that failed
+        """
+        follow_up = self._post_follow_up_calls(post_id, wp_result, meta, featured_media_id)
+        if not follow_up:
+            return {'mcp_calls': 0, 'round_trips': 0, 'failed': []}
+        
+        failed = []
+        results = self.call_many(follow_up, return_exceptions=True)
+        for (method, _), result in zip(follow_up, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{method} failed for post {post_id}: {result}")
+                failed.append(method)
+        return {
+            'mcp_calls': len(follow_up),
+            'round_trips': 1 if len(follow_up) == 1 or self.batch_supported else len(follow_up),
+            'failed': failed
+        }
+    
+    def iter_posts(self, page_size=50, post_status=None, search=None, max_items=None, **filters):
+        """
+        Iterate over WordPress posts, fetching pages on demand
+        
+        Args:
+            page_size: Posts requested per wp_get_posts call
+            post_status: Optional status filter ('publish', 'draft', 'any', ...)
+            search: Optional search term
+            max_items: Stop after this many posts (default: all)
+            **filters: Other wp_get_posts arguments (post_type, include, ...)
+            
+        Yields:
+            Post dictionaries
+        """
+        params = dict(filters)
+        if post_status:
+            params['post_status'] = post_status
+        if search:
+            params['search'] = search
+        return self._iter_pages('wp_get_posts', params, page_size, max_items)
+    
+    def iter_media(self, page_size=50, search=None, after=None, before=None, max_items=None):
+        """Iterate over media items, fetching pages on demand"""
+        params = {}
+        if search:
+            params['search'] = search
+        if after:
+            params['after'] = after
+        if before:
+            params['before'] = before
+        return self._iter_pages('wp_get_media', params, page_size, max_items)
+    
+    def iter_comments(self, page_size=50, post_id=None, status=None, search=None, max_items=None):
+        """Iterate over comments, fetching pages on demand"""
+        params = {}
+        if post_id:
+            params['post_id'] = post_id
+        if status:
+            params['status'] = status
+        if search:
+            params['search'] = search
+        return self._iter_pages('wp_get_comments', params, page_size, max_items)
+    
+    def _iter_pages(self, method, params, page_size, max_items=None):
+        """
+        Page through a list tool with limit/offset
+        
+        The next page is requested on a background thread while the caller
+        consumes the current one, so at most two pages are held in memory.
+        Pages bypass the response cache: a full listing would otherwise fill
+        it with pages (and a sync could be served stale ones).
+        
+        Stops after max_items or at the first short or empty page. A reply
+        that is not a list, or a page repeating the previous one (the server
+        ignored the offset), raises instead: the listing would be incomplete,
+        and callers such as PostTracker.sync_with_wordpress must be able to
+        tell that apart from reaching the end.
+        
+        Raises:
+            Exception: A page was not a list, or the server ignored the offset
+        """
+        def fetch(offset):
+            limit = page_size if max_items is None else min(page_size, max_items - offset)
+            page_params = dict(params, limit=limit)
+            if offset:
+                page_params['offset'] = offset
+            return self._send(method, page_params)
+        
+        def has_more(offset, page):
+            if max_items is not None and offset >= max_items:
+                return False
+            return len(page) >= page_size
+        
+        if max_items is not None and max_items <= 0:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mcp-prefetch')
+        try:
+            offset = 0
+            previous_first = None
+            future = executor.submit(fetch, offset)
+            while future is not None:
+                page = future.result()
+                if not isinstance(page, list):
+                    raise MCPResponseFormatError(
+                        f"{method} returned {type(page).__name__} instead of a list at offset {offset}")
+                if not page:
+                    return
+                
+                if offset and page[0] == previous_first:
+                    raise Exception(f"{method} ignored offset {offset} and repeated a page, listing is incomplete")
+                previous_first = page[0]
+                
+                offset += len(page)
+                future = executor.submit(fetch, offset) if has_more(offset, page) else None
+                yield from page
+                page = None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,164 @@
+"""
+Adaptive concurrency control for WordPress calls
+AIMD limiter: parallelism grows by one while WordPress stays fast and
+healthy, and is cut multiplicatively on 429/5xx responses and timeouts
+"""
+
+import threading
+import time
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Outcomes reported when a call finishes
+OK = 'ok'
+OVERLOAD = 'overload'
+
+class AIMDLimiter:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight calls
+
+    The limit grows by `increase` after a full window of healthy calls (as many
+    calls as the current limit, all below latency_target) and is multiplied by
+    decrease_factor on an overload signal. Calls that started before the last
+    decrease cannot trigger another one, so a burst of failures from the same
+    window only cuts the limit once.
+    """
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 16,
+                 increase: int = 1, decrease_factor: float = 0.5, latency_target: float = 2.0,
+                 history_size: int = 50):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.in_flight = 0
+        self._healthy_in_window = 0
+        self._last_decrease = 0.0
+        self._history = deque(maxlen=history_size)
+        self._stats = {'acquired': 0, 'waited': 0, 'increases': 0, 'decreases': 0, 'overloads': 0}
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait for a free slot
+
+        Returns:
+            Token (start time) to hand back to release()
+
+        Raises:
+            Exception: No slot became free within timeout
+        """
+        with self._cond:
+            if self.in_flight >= self.limit:
+                self._stats['waited'] += 1
+                if not self._cond.wait_for(lambda: self.in_flight < self.limit, timeout):
+                    raise Exception(f"Timed out waiting for a WordPress call slot (limit {self.limit})")
+            self.in_flight += 1
+            self._stats['acquired'] += 1
+            return time.monotonic()
+
+    def release(self, token: float, outcome: str = OK, latency: Optional[float] = None):
+        """
+        Free a slot and adapt the limit
+
+        Args:
+            token: Value returned by acquire()
+            outcome: OK, or OVERLOAD for 429/5xx/timeouts
+            latency: Call duration in seconds; None skips the latency check
+                (e.g. for batches, whose duration grows with their size)
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if outcome == OVERLOAD:
+                self._stats['overloads'] += 1
+                if token >= self._last_decrease:
+                    self._decrease('overload')
+            elif latency is not None and latency > self.latency_target:
+                if token >= self._last_decrease:
+                    self._decrease(f'latency {latency:.2f}s')
+            else:
+                self._healthy_in_window += 1
+                if self._healthy_in_window >= self.limit and self.limit < self.max_limit:
+                    self._change(min(self.max_limit, self.limit + self.increase), 'increase', 'healthy window')
+                    self._stats['increases'] += 1
+            self._cond.notify_all()
+
+    def abandon(self, token: float):
+        """Free a slot whose call was never made (e.g. the caller was cancelled), leaving the limit as it is"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def _decrease(self, reason: str):
+        new_limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        self._last_decrease = time.monotonic()
+        self._stats['decreases'] += 1
+        if new_limit != self.limit:
+            logger.warning(f"⚠️ WordPress concurrency limit {self.limit} -> {new_limit} ({reason})")
+        self._change(new_limit, 'decrease', reason)
+
+    def _change(self, new_limit: int, action: str, reason: str):
+        self._history.append({
+            'time': time.time(),
+            'action': action,
+            'from': self.limit,
+            'to': new_limit,
+            'reason': reason
+        })
+        self.limit = new_limit
+        self._healthy_in_window = 0
+
+    def slot(self, timeout: Optional[float] = None) -> 'LimiterSlot':
+        """Context manager around acquire/release; set slot.outcome and slot.latency inside"""
+        return LimiterSlot(self, timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current limit, in-flight count, counters and recent decisions"""
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self.in_flight,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                **self._stats,
+                'history': list(self._history)
+            }
+
+    def to_prometheus(self, prefix: str = 'mcp') -> str:
+        """Render the limiter state in Prometheus text exposition format"""
+        stats = self.get_stats()
+        lines = [
+            f'# HELP {prefix}_concurrency_limit Current adaptive concurrency limit',
+            f'# TYPE {prefix}_concurrency_limit gauge',
+            f'{prefix}_concurrency_limit {stats["limit"]}',
+            f'# HELP {prefix}_concurrency_in_flight WordPress calls currently in flight',
+            f'# TYPE {prefix}_concurrency_in_flight gauge',
+            f'{prefix}_concurrency_in_flight {stats["in_flight"]}'
+        ]
+        for name in ('increases', 'decreases', 'overloads'):
+            lines.append(f'# TYPE {prefix}_concurrency_{name}_total counter')
+            lines.append(f'{prefix}_concurrency_{name}_total {stats[name]}')
+        return '\n'.join(lines) + '\n'
+
+class LimiterSlot:
+    """One acquired AIMDLimiter slot"""
+
+    def __init__(self, limiter: AIMDLimiter, timeout: Optional[float] = None):
+        self.limiter = limiter
+        self.timeout = timeout
+        self.outcome = OK
+        self.latency = None
+        self._token = None
+
+    def __enter__(self):
+        self._token = self.limiter.acquire(self.timeout)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.limiter.release(self._token, self.outcome, self.latency)
+        return False
@@ -0,0 +1,198 @@
+"""
+Read-through response cache for WordPress MCP tools
+Caches read-only tool results with per-tool TTLs in a bounded LRU and drops
+the affected tool families whenever a write tool runs
+"""
+
+import copy
+import json
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools that may be cached, with their time-to-live in seconds
+DEFAULT_TOOL_TTLS = {
+    'wp_get_posts': 30,
+    'wp_get_post': 30,
+    'wp_count_posts': 60,
+    'wp_get_post_meta': 60,
+    'wp_get_post_terms': 60,
+    'wp_get_media': 60,
+    'wp_count_media': 60,
+    'wp_get_comments': 30,
+    'wp_get_users': 300,
+    'wp_get_terms': 300,
+    'wp_count_terms': 300,
+    'wp_get_option': 300,
+    'wp_list_plugins': 600,
+    'wp_get_taxonomies': 3600,
+    'wp_get_post_types': 3600
+}
+
+# Read tools that must always go to WordPress
+UNCACHED_READS = {'mcp_ping'}
+
+# Every read-only tool; identical concurrent calls to these can share one request
+READ_TOOLS = frozenset(DEFAULT_TOOL_TTLS) | UNCACHED_READS
+
+# Tool families: read tools whose results change together
+TOOL_FAMILIES = {
+    'posts': {'wp_get_posts', 'wp_get_post', 'wp_count_posts', 'wp_get_post_meta', 'wp_get_post_terms'},
+    'media': {'wp_get_media', 'wp_count_media'},
+    'comments': {'wp_get_comments'},
+    'users': {'wp_get_users'},
+    'terms': {'wp_get_terms', 'wp_count_terms', 'wp_get_post_terms', 'wp_get_taxonomies'},
+    'options': {'wp_get_option'},
+    'plugins': {'wp_list_plugins'},
+    'post_types': {'wp_get_post_types'}
+}
+
+# Write tools and the families they invalidate
+WRITE_INVALIDATIONS = {
+    'wp_create_post': ('posts',),
+    'wp_update_post': ('posts',),
+    'wp_delete_post': ('posts', 'comments'),
+    'wp_update_post_meta': ('posts',),
+    'wp_delete_post_meta': ('posts',),
+    'wp_set_featured_image': ('posts', 'media'),
+    'wp_upload_media': ('media',),
+    'wp_update_media': ('media',),
+    'wp_delete_media': ('media', 'posts'),
+    'aiwu_image': ('media',),
+    'wp_create_term': ('terms',),
+    'wp_update_term': ('terms',),
+    'wp_delete_term': ('terms', 'posts'),
+    'wp_add_post_terms': ('terms', 'posts'),
+    'wp_update_option': ('options',),
+    'wp_create_user': ('users',),
+    'wp_update_user': ('users',),
+    'wp_create_comment': ('comments',),
+    'wp_update_comment': ('comments',),
+    'wp_delete_comment': ('comments',)
+}
+
+class MCPResponseCache:
+    """
+    Bounded LRU cache for read-only MCP tool results
+
+    Keys are the tool name plus its arguments serialized with sorted keys, so
+    argument order does not matter. Unknown tools are treated as writes and
+    clear the whole cache.
+    """
+
+    def __init__(self, max_entries: int = 512, tool_ttls: Optional[Dict[str, float]] = None):
+        self.max_entries = max_entries
+        self.tool_ttls = dict(DEFAULT_TOOL_TTLS)
+        if tool_ttls:
+            self.tool_ttls.update(tool_ttls)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0, 'invalidations': 0}
+        self._tool_stats = {}
+
+    @staticmethod
+    def make_key(method: str, params: Optional[Dict]) -> str:
+        """Build a cache key from the tool name and normalized arguments"""
+        return method + ':' + json.dumps(params or {}, sort_keys=True, separators=(',', ':'), default=str)
+
+    def is_cacheable(self, method: str) -> bool:
+        return self.tool_ttls.get(method, 0) > 0
+
+    def lookup(self, method: str, params: Optional[Dict]) -> Tuple[bool, Any]:
+        """
+        Look up a cached result
+
+        Returns:
+            (hit, value) - value is a copy so callers can modify it freely
+        """
+        if not self.is_cacheable(method):
+            return False, None
+
+        key = self.make_key(method, params)
+        now = time.monotonic()
+        with self._lock:
+            tool_stats = self._tool_stats.setdefault(method, {'hits': 0, 'misses': 0})
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                tool_stats['hits'] += 1
+                value = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                    self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                tool_stats['misses'] += 1
+                return False, None
+
+        return True, copy.deepcopy(value)
+
+    def store(self, method: str, params: Optional[Dict], value: Any):
+        """Remember a read result until its tool's TTL runs out"""
+        if not self.is_cacheable(method) or self.max_entries <= 0:
+            return
+
+        key = self.make_key(method, params)
+        expires_at = time.monotonic() + self.tool_ttls[method]
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate_for(self, method: str) -> int:
+        """
+        Drop cached reads that a call to method may have made stale
+
+        Returns:
+            Number of entries removed
+        """
+        if self.is_cacheable(method) or method in UNCACHED_READS:
+            return 0
+
+        families = WRITE_INVALIDATIONS.get(method)
+        if families is None:
+            logger.debug(f"Unknown MCP tool {method} - clearing the whole response cache")
+            return self.clear()
+
+        tools = set()
+        for family in families:
+            tools |= TOOL_FAMILIES[family]
+        prefixes = tuple(f"{tool}:" for tool in tools)
+
+        with self._lock:
+            stale = [key for key in self._entries if key.startswith(prefixes)]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+
+        if stale:
+            logger.debug(f"{method} invalidated {len(stale)} cached MCP responses ({', '.join(families)})")
+        return len(stale)
+
+    def clear(self) -> int:
+        """Remove all cached entries"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._stats['invalidations'] += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'hit_rate': round(self._stats['hits'] / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'by_tool': {tool: dict(stats) for tool, stats in self._tool_stats.items()}
+            }
@@ -0,0 +1,148 @@
+"""
+Per-tool instrumentation for MCP calls
+Fixed-bucket latency histograms, payload sizes, errors and timeouts per AIWU
+tool, cheap enough to leave on in production
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+# Histogram bucket upper bounds in seconds; the last bucket is +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class ToolStats:
+    """Counters for one tool"""
+
+    __slots__ = ('buckets', 'calls', 'latency_sum', 'latency_max', 'errors', 'timeouts',
+                 'request_bytes', 'response_bytes')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.calls = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.errors = 0
+        self.timeouts = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def percentile(self, q: float) -> float:
+        """Estimate a latency percentile in seconds by interpolating inside its bucket"""
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        cumulative = 0
+        for i, count in enumerate(self.buckets):
+            if count and cumulative + count >= rank:
+                lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+                upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.latency_max
+                upper = min(upper, self.latency_max)
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.latency_max
+
+class MCPMetrics:
+    """Thread-safe registry of per-tool MCP call statistics"""
+
+    def __init__(self):
+        self._tools = {}
+        self._lock = threading.Lock()
+
+    def record(self, tool: str, duration: float, request_bytes: int = 0, response_bytes: int = 0,
+               error: bool = False, timeout: bool = False):
+        """
+        Record one MCP call
+
+        Args:
+            tool: Tool name (wp_get_posts, ...)
+            duration: Wall time in seconds
+            request_bytes: Size of the JSON-RPC request body
+            response_bytes: Size of the response body
+            error: The call failed (HTTP, transport or MCP error)
+            timeout: The call timed out (also counted as an error)
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = self._tools[tool] = ToolStats()
+            stats.buckets[bucket] += 1
+            stats.calls += 1
+            stats.latency_sum += duration
+            if duration > stats.latency_max:
+                stats.latency_max = duration
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            if error or timeout:
+                stats.errors += 1
+            if timeout:
+                stats.timeouts += 1
+
+    def reset(self):
+        with self._lock:
+            self._tools.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get per-tool statistics with latencies in milliseconds"""
+        with self._lock:
+            tools = {}
+            for tool, stats in sorted(self._tools.items()):
+                tools[tool] = {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'timeouts': stats.timeouts,
+                    'latency_ms': {
+                        'p50': round(stats.percentile(0.50) * 1000, 1),
+                        'p95': round(stats.percentile(0.95) * 1000, 1),
+                        'p99': round(stats.percentile(0.99) * 1000, 1),
+                        'mean': round(stats.latency_sum / stats.calls * 1000, 1),
+                        'max': round(stats.latency_max * 1000, 1)
+                    },
+                    'bytes': {
+                        'request_total': stats.request_bytes,
+                        'response_total': stats.response_bytes,
+                        'response_mean': stats.response_bytes // stats.calls
+                    }
+                }
+            return {
+                'total_calls': sum(t['calls'] for t in tools.values()),
+                'tools': tools
+            }
+
+    def to_prometheus(self, prefix: str = 'mcp') -> str:
+        """Render the statistics in Prometheus text exposition format"""
+        lines: List[str] = [
+            f'# HELP {prefix}_tool_latency_seconds MCP tools/call latency by tool',
+            f'# TYPE {prefix}_tool_latency_seconds histogram'
+        ]
+        counters = {
+            'errors_total': ('MCP calls that failed', 'errors'),
+            'timeouts_total': ('MCP calls that timed out', 'timeouts'),
+            'request_bytes_total': ('JSON-RPC request bytes sent', 'request_bytes'),
+            'response_bytes_total': ('JSON-RPC response bytes received', 'response_bytes')
+        }
+        counter_lines: Dict[str, List[str]] = {name: [] for name in counters}
+
+        with self._lock:
+            for tool, stats in sorted(self._tools.items()):
+                label = f'tool="{_escape_label(tool)}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (None,), stats.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound is None else repr(bound)
+                    lines.append(f'{prefix}_tool_latency_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_tool_latency_seconds_sum{{{label}}} {stats.latency_sum:.6f}')
+                lines.append(f'{prefix}_tool_latency_seconds_count{{{label}}} {stats.calls}')
+                for name, (_, attribute) in counters.items():
+                    counter_lines[name].append(f'{prefix}_tool_{name}{{{label}}} {getattr(stats, attribute)}')
+
+        for name, (help_text, _) in counters.items():
+            lines.append(f'# HELP {prefix}_tool_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_tool_{name} counter')
+            lines.extend(counter_lines[name])
+
+        return '\n'.join(lines) + '\n'
+
+def _escape_label(value: Optional[str]) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
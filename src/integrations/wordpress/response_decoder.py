@@ -0,0 +1,100 @@
+"""
+AIWU MCP response decoding
+Turns JSON-RPC envelopes and the text of AIWU content items into Python
+values without regex scanning, using orjson when it is installed
+"""
+
+import json
+import re
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    JSON_BACKEND = 'orjson'
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    JSON_BACKEND = 'json'
+    _loads = json.loads
+    _dumps = None
+
+POST_CREATED_ID_RE = re.compile(r'Post created ID (\d+)')
+
+# First characters of text that can be a complete JSON document
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+_raw_decoder = json.JSONDecoder()
+
+def loads(data) -> Any:
+    """Parse JSON from str or bytes with the fastest available backend"""
+    return _loads(data)
+
+def dumps(value) -> bytes:
+    """Serialize a JSON-RPC payload to compact UTF-8 bytes"""
+    if _dumps is not None:
+        try:
+            return _dumps(value)
+        except TypeError:
+            # orjson rejects values json can still encode (non-str keys, huge ints)
+            pass
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+def extract_json_object(text: str) -> Optional[Any]:
+    """
+    Decode the JSON object embedded in text like "Ping successful: {...}"
+
+    Decodes from each '{' in turn and stops at the end of the first complete
+    object, so trailing text is ignored and nothing is scanned twice.
+
+    Returns:
+        The decoded object, or None if the text contains none
+    """
+    start = text.find('{')
+    while start != -1:
+        try:
+            value, _ = _raw_decoder.raw_decode(text, start)
+            return value
+        except ValueError:
+            start = text.find('{', start + 1)
+    return None
+
+def decode_text(text: str) -> Any:
+    """
+    Decode the text of an AIWU content item
+
+    Returns:
+        Parsed JSON if the text is JSON, the embedded object if the text has
+        a prefix such as "Ping successful: ", otherwise the text itself
+    """
+    head = text.lstrip()[:1]
+    if head in _JSON_START_CHARS:
+        try:
+            return _loads(text)
+        except ValueError:
+            pass
+
+    embedded = extract_json_object(text)
+    return text if embedded is None else embedded
+
+def unwrap_result(mcp_result: Any) -> Any:
+    """Extract the tool result from a JSON-RPC result's nested content[0].text"""
+    if isinstance(mcp_result, dict):
+        content = mcp_result.get('content')
+        if isinstance(content, list) and content:
+            first_content = content[0]
+            if isinstance(first_content, dict) and 'text' in first_content:
+                return decode_text(first_content['text'])
+    return mcp_result
+
+def extract_post_id(wp_result: Any) -> Optional[int]:
+    """Parse the post ID from a wp_create_post result (dict or "Post created ID 32" text)"""
+    if isinstance(wp_result, dict) and 'ID' in wp_result:
+        return wp_result['ID']
+    if isinstance(wp_result, str):
+        match = POST_CREATED_ID_RE.search(wp_result)
+        if match:
+            return int(match.group(1))
+    return None
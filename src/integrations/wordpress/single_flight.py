@@ -0,0 +1,56 @@
+"""
+Single-flight request coalescing
+Identical calls made while one is already in flight wait for its result
+instead of issuing their own request
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key across threads
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive before it finishes block on the same future and get a copy of its
+    result, or the same exception.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {'executed': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) unless a call with the same key is already running"""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self._stats['executed'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get executed/coalesced counters and the number of calls in flight"""
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._inflight)}
@@ -5,12 +5,13 @@ Uses Apify's Instagram Post Scraper and image download capabilities
 
 import requests
 import json
-import time
 import base64
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
 
+from .apify_runs import wait_for_run
+
 logger = logging.getLogger(__name__)
 
 class ApifyImageDownloader:
@@ -332,37 +333,15 @@ class ApifyImageDownloader:
         return response.json()
     
     def _wait_for_completion(self, run_id: str, timeout: int = 300) -> List[Dict]:
-        """Wait for actor run to complete and return results"""
-        start_time = time.time()
+        """Wait for actor run to complete (long-polling, see wait_for_run) and return results"""
+        wait_for_run(self.session, self.base_url, run_id, timeout, metric='image_downloader')
         
-        while time.time() - start_time < timeout:
-            # Check run status
-            status_url = f"{self.base_url}/actor-runs/{run_id}"
-            status_response = self.session.get(status_url)
-            status_response.raise_for_status()
-            
-            run_data = status_response.json()['data']
-            status = run_data['status']
-            
-            logger.info(f"🔄 Run {run_id} status: {status}")
-            
-            if status == 'SUCCEEDED':
-                # Get results
-                results_url = f"{self.base_url}/actor-runs/{run_id}/dataset/items"
-                results_response = self.session.get(results_url)
-                results_response.raise_for_status()
-                
-                return results_response.json()
-            
-            elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
-                error_msg = f"Actor run {status.lower()}: {run_data.get('statusMessage', 'Unknown error')}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            
-            # Wait before checking again
-            time.sleep(10)
+        # Get results
+        results_url = f"{self.base_url}/actor-runs/{run_id}/dataset/items"
+        results_response = self.session.get(results_url)
+        results_response.raise_for_status()
         
-        raise Exception(f"Actor run timed out after {timeout} seconds")
+        return results_response.json()
     
     def _get_images_from_kvs(self, kvs_id: str) -> List[Optional[str]]:
         """
@@ -0,0 +1,179 @@
+"""
+Apify actor run completion
+Shared by the Instagram scraper and the image downloader. Status requests
+long-poll with Apify's waitForFinish, so a run's results are fetched the
+moment it ends instead of on the next fixed polling tick, or are read page
+by page while the run is still producing them
+"""
+import time
+from typing import Any, Dict, Iterator
+import logging
+
+from ..integrations.wordpress.mcp_metrics import MCPMetrics
+
+logger = logging.getLogger(__name__)
+
+FAILED_STATUSES = ('FAILED', 'ABORTED', 'TIMED-OUT')
+# Longest waitForFinish Apify honours per request, in seconds
+MAX_WAIT_FOR_FINISH = 60
+
+# Time from starting to wait until each run's outcome was known, by caller
+apify_metrics = MCPMetrics()
+
+
+def wait_for_run(session, base_url: str, run_id: str, timeout: int = 300, metric: str = 'apify_run',
+                 wait_for_finish: int = MAX_WAIT_FOR_FINISH, min_interval: float = 0.25,
+                 max_interval: float = 5.0) -> Dict[str, Any]:
+    """
+    Wait for an actor run to succeed
+
+    Each status request asks Apify to hold the response for up to
+    wait_for_finish seconds, returning as soon as the run ends. When a
+    response comes back early with the run still going (a proxy cut the
+    request short, or the server ignores waitForFinish), the next request is
+    delayed by an interval that starts at min_interval and doubles up to
+    max_interval, so short runs are still noticed within a fraction of a
+    second without hammering the API.
+
+    Args:
+        session: requests.Session with the Apify Authorization header
+        base_url: Apify API base URL (https://api.apify.com/v2)
+        run_id: Apify run ID
+        timeout: Maximum wait time in seconds
+        metric: Name the time-to-result is recorded under in apify_metrics
+        wait_for_finish: Seconds each status request may be held (0 polls)
+
+    Returns:
+        The finished run's data
+
+    Raises:
+        Exception: The run failed, was aborted or timed out, or timeout passed
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    interval = min_interval
+    status_requests = 0
+    succeeded = False
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise Exception(f"Actor run timed out after {timeout} seconds")
+
+            # waitForFinish takes whole seconds
+            wait = int(min(wait_for_finish, remaining))
+            request_start = time.perf_counter()
+            status_response = session.get(f"{base_url}/actor-runs/{run_id}", params={'waitForFinish': wait},
+                                          timeout=wait + 30)
+            status_response.raise_for_status()
+            status_requests += 1
+
+            run_data = status_response.json()['data']
+            status = run_data['status']
+            logger.info(f"Run {run_id} status: {status}")
+
+            if status == 'SUCCEEDED':
+                succeeded = True
+                return run_data
+
+            if status in FAILED_STATUSES:
+                error_msg = f"Actor run {status.lower()}: {run_data.get('statusMessage', 'Unknown error')}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+
+            # Answered well before the long-poll was up: back off instead of asking again at once
+            if time.perf_counter() - request_start < wait / 2 or not wait:
+                time.sleep(max(0.0, min(interval, deadline - time.perf_counter())))
+                interval = min(interval * 2, max_interval)
+            else:
+                interval = min_interval
+    finally:
+        elapsed = time.perf_counter() - start
+        apify_metrics.record(metric, elapsed, error=not succeeded)
+        logger.info(f"⏱️ Run {run_id} {'finished' if succeeded else 'gave up'} after {elapsed:.2f}s "
+                    f"({status_requests} status request(s))")
+
+
+def iter_run_items(session, base_url: str, run_id: str, timeout: int = 300, page_size: int = 100,
+                   poll_wait: int = 1, metric: str = 'apify_run') -> Iterator[Dict[str, Any]]:
+    """
+    Yield a run's dataset items as the run produces them
+
+    The dataset is paged with offset/limit while the run is still RUNNING.
+    Once a page comes back short (caught up with the run), the run's status
+    is long-polled for up to poll_wait seconds - returning early if it
+    finishes - before the next page is asked for. Once the run ends the
+    remaining items are read and the generator ends; a run that failed, was
+    aborted or timed out raises after all the items it wrote have been
+    yielded.
+
+    Only time spent waiting on Apify counts toward timeout, not the time
+    the generator sits suspended while the consumer handles an item, and
+    the run's status is always checked before giving up, so a slow consumer
+    never turns a finished run into a timeout. Time to the first item is
+    recorded under f'{metric}_first_item' and time until the run was seen
+    finished under metric; both include the consumer's time.
+
+    Args:
+        session: requests.Session with the Apify Authorization header
+        base_url: Apify API base URL (https://api.apify.com/v2)
+        run_id: Apify run ID
+        timeout: Maximum seconds spent waiting on Apify for the run to finish
+        page_size: Items per dataset request
+        poll_wait: Seconds to wait for the run before checking for new items again
+        metric: Name the timings are recorded under in apify_metrics
+
+    Yields:
+        Raw dataset items, in dataset order
+    """
+    start = time.perf_counter()
+    waited = 0.0
+    items_url = f"{base_url}/actor-runs/{run_id}/dataset/items"
+    offset = 0
+    finished = False
+    run_error = None
+    try:
+        while True:
+            request_start = time.perf_counter()
+            response = session.get(items_url, params={'offset': offset, 'limit': page_size}, timeout=30)
+            response.raise_for_status()
+            items = response.json()
+            waited += time.perf_counter() - request_start
+            if items and not offset:
+                apify_metrics.record(f'{metric}_first_item', time.perf_counter() - start)
+            offset += len(items)
+            yield from items
+            if len(items) == page_size:
+                # A full page: there may be more already
+                continue
+            if finished:
+                if run_error:
+                    raise Exception(run_error)
+                return
+
+            request_start = time.perf_counter()
+            status_response = session.get(f"{base_url}/actor-runs/{run_id}", params={'waitForFinish': poll_wait},
+                                          timeout=poll_wait + 30)
+            status_response.raise_for_status()
+            run_data = status_response.json()['data']
+            status = run_data['status']
+
+            if status not in FAILED_STATUSES + ('SUCCEEDED',) and time.perf_counter() - request_start < poll_wait / 2:
+                # Answered without holding the request: wait here instead of re-reading the dataset at once
+                time.sleep(poll_wait)
+            waited += time.perf_counter() - request_start
+            if status in FAILED_STATUSES:
+                run_error = f"Actor run {status.lower()}: {run_data.get('statusMessage', 'Unknown error')}"
+                logger.error(run_error)
+            if status == 'SUCCEEDED' or run_error:
+                # Read whatever the run wrote since the last page, then stop
+                finished = True
+                elapsed = time.perf_counter() - start
+                apify_metrics.record(metric, elapsed, error=bool(run_error))
+                logger.info(f"⏱️ Run {run_id} {'finished' if not run_error else 'failed'} after {elapsed:.2f}s, "
+                            f"{offset} item(s) read while running")
+            elif waited >= timeout:
+                raise Exception(f"Actor run timed out after {timeout} seconds")
+    finally:
+        if not finished:
+            apify_metrics.record(metric, time.perf_counter() - start, error=True)
@@ -4,14 +4,14 @@ Image Cache System for Instagram Images
 Uses our breakthrough download method to cache Instagram images locally
 """
 
-import os
 import hashlib
-import requests
 import logging
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse
 
+from .instagram_cdn import get_cdn_client
+
 logger = logging.getLogger(__name__)
 
 class InstagramImageCache:
@@ -22,17 +22,15 @@ class InstagramImageCache:
     def __init__(self, cache_dir: str = "static/cached_images"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Setup session with Instagram-friendly headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Referer': 'https://www.instagram.com/',
-            'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'DNT': '1',
-            'Connection': 'keep-alive'
-        })
+    
+    @property
+    def cdn(self):
+        """Shared pooled CDN client; Instagram cookies are refreshed once per TTL, not per image"""
+        return get_cdn_client()
+    
+    @property
+    def session(self):
+        return self.cdn.session
     
     def _get_cache_filename(self, instagram_url: str) -> str:
         """Generate a cache filename from Instagram URL"""
@@ -59,30 +57,17 @@ class InstagramImageCache:
         """
         Download Instagram image using our breakthrough method
         """
-        try:
-            # Get Instagram homepage for cookies (helps with success rate)
-            self.session.get('https://www.instagram.com/', timeout=10)
-            
-            # Download the image
-            response = self.session.get(instagram_url, timeout=30)
-            response.raise_for_status()
-            
-            if response.status_code == 200:
-                logger.info(f"✅ Successfully downloaded {len(response.content)} bytes from Instagram")
-                return True, response.content, None
-            else:
-                error_msg = f"HTTP {response.status_code}"
-                logger.warning(f"⚠️ Download failed: {error_msg}")
-                return False, None, error_msg
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request failed: {str(e)}"
-            logger.error(f"❌ Download error: {error_msg}")
-            return False, None, error_msg
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(f"❌ Unexpected error: {error_msg}")
-            return False, None, error_msg
+        success, image_data, error = self.cdn.download(instagram_url)
+        if success:
+            logger.info(f"✅ Successfully downloaded {len(image_data)} bytes from Instagram")
+        else:
+            logger.error(f"❌ Download error: {error}")
+        return success, image_data, error
+    
+    def get_cached_path(self, instagram_url: str) -> Optional[Path]:
+        """Local file for an already cached image, or None (never downloads)"""
+        cache_path = self.cache_dir / self._get_cache_filename(instagram_url)
+        return cache_path if cache_path.exists() else None
     
     def get_cached_image_url(self, instagram_url: str, force_refresh: bool = False) -> Optional[str]:
         """
@@ -0,0 +1,182 @@
+"""
+Per-post import checkpoints
+Records how far each post of an import job got (images fetched, media
+uploaded, post created, meta written, featured image set) so a failed or
+interrupted job can be resumed without duplicating posts
+"""
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FIELDS = ('image_fetched', 'media_id', 'media', 'post_id', 'title', 'meta_written', 'featured_set', 'done',
+                     'error')
+
+
+class ImportCheckpoints:
+    """SQLite store of per-post import progress, keyed by job ID and post position"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            data_dir = project_root / "data"
+            data_dir.mkdir(exist_ok=True)
+            db_path = data_dir / "jobs.db"
+
+        self.db_path = str(db_path)
+        self._init_database()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS import_checkpoints (
+                    job_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    shortcode TEXT,
+                    post TEXT NOT NULL,
+                    image_fetched INTEGER DEFAULT 0,
+                    media_id INTEGER,
+                    media TEXT,
+                    post_id INTEGER,
+                    title TEXT,
+                    meta_written INTEGER DEFAULT 0,
+                    featured_set INTEGER DEFAULT 0,
+                    done INTEGER DEFAULT 0,
+                    error TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (job_id, position)
+                )
+            ''')
+            # Databases created before carousel support lack the media column
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(import_checkpoints)')}
+            if 'media' not in columns:
+                conn.execute('ALTER TABLE import_checkpoints ADD COLUMN media TEXT')
+            # Whether a job read all of its posts, for jobs whose posts arrive as a stream
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS import_feeds (
+                    job_id TEXT PRIMARY KEY,
+                    complete INTEGER DEFAULT 0,
+                    updated_at TEXT
+                )
+            ''')
+            conn.commit()
+
+    def start(self, job_id: str, posts: List[Dict[str, Any]]):
+        """Record the posts a job is about to import, before any work starts"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM import_checkpoints WHERE job_id = ?', (job_id,))
+            conn.execute('INSERT OR REPLACE INTO import_feeds (job_id, complete, updated_at) VALUES (?, 0, ?)',
+                         (job_id, datetime.now().isoformat()))
+            conn.commit()
+        self.append(job_id, 0, posts)
+
+    def append(self, job_id: str, first_position: int, posts: List[Dict[str, Any]]):
+        """Record further posts of a job whose posts arrive in batches, from first_position on"""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany('''
+                INSERT INTO import_checkpoints (job_id, position, shortcode, post, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [(job_id, position, post.get('shortcode'),
+                   json.dumps({k: v for k, v in post.items() if k != 'raw_data'}, default=str), now)
+                  for position, post in enumerate(posts, first_position)])
+            conn.commit()
+
+    def finish_feed(self, job_id: str):
+        """Record that a job has read (and checkpointed) all of its posts"""
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO import_feeds (job_id, complete, updated_at) VALUES (?, 1, ?)',
+                         (job_id, datetime.now().isoformat()))
+            conn.commit()
+
+    def feed_complete(self, job_id: str) -> bool:
+        """
+        Whether a job read all of its posts before it stopped
+
+        Jobs checkpointed before feeds were tracked were always given their
+        posts up front, so they count as complete.
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT complete FROM import_feeds WHERE job_id = ?', (job_id,)).fetchone()
+        return row is None or bool(row['complete'])
+
+    def shortcodes(self, job_id: str) -> Set[str]:
+        """Shortcodes of the posts a job has recorded"""
+        with self._connect() as conn:
+            return {row[0] for row in conn.execute(
+                'SELECT shortcode FROM import_checkpoints WHERE job_id = ? AND shortcode IS NOT NULL', (job_id,))}
+
+    def has_job(self, job_id: str) -> bool:
+        """Whether checkpoints were recorded for job_id"""
+        with self._connect() as conn:
+            return conn.execute('SELECT 1 FROM import_checkpoints WHERE job_id = ? LIMIT 1',
+                                (job_id,)).fetchone() is not None
+
+    def load(self, job_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a job's checkpoints in post order
+
+        Returns:
+            List of {'position', 'post', 'image_fetched', 'media_id', 'media', 'post_id',
+            'title', 'meta_written', 'featured_set', 'done', 'error'}; media is
+            the list of uploaded assets ([] until the upload stage finished)
+        """
+        return list(self.iter_checkpoints(job_id))
+
+    def iter_checkpoints(self, job_id: str, batch_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield a job's checkpoints in post order (as load), reading batch_size rows at a time"""
+        position = -1
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute('SELECT * FROM import_checkpoints WHERE job_id = ? AND position > ? '
+                                    'ORDER BY position LIMIT ?', (job_id, position, batch_size)).fetchall()
+            for row in rows:
+                yield self._row_to_checkpoint(row)
+            if len(rows) < batch_size:
+                return
+            position = rows[-1]['position']
+
+    @staticmethod
+    def _row_to_checkpoint(row) -> Dict[str, Any]:
+        checkpoint = {'position': row['position'], 'post': json.loads(row['post'])}
+        for field in CHECKPOINT_FIELDS:
+            checkpoint[field] = row[field]
+        for flag in ('image_fetched', 'meta_written', 'featured_set', 'done'):
+            checkpoint[flag] = bool(checkpoint[flag])
+        checkpoint['media'] = json.loads(checkpoint['media']) if checkpoint['media'] else []
+        return checkpoint
+
+    def update(self, job_id: str, position: int, **fields):
+        """Persist the stages a post has completed"""
+        unknown = set(fields) - set(CHECKPOINT_FIELDS)
+        if unknown:
+            raise Exception(f"Unknown checkpoint fields: {', '.join(sorted(unknown))}")
+        if 'media' in fields:
+            fields['media'] = json.dumps(fields['media'])
+        assignments = ', '.join(f'{field} = ?' for field in fields)
+        with self._connect() as conn:
+            conn.execute(f'UPDATE import_checkpoints SET {assignments}, updated_at = ? WHERE job_id = ? AND position = ?',
+                         (*fields.values(), datetime.now().isoformat(), job_id, position))
+            conn.commit()
+
+    def summary(self, job_id: str) -> Dict[str, int]:
+        """Count a job's posts by the furthest stage they reached"""
+        with self._connect() as conn:
+            row = conn.execute('''
+                SELECT COUNT(*) AS posts,
+                       COUNT(CASE WHEN image_fetched THEN 1 END) AS image_fetched,
+                       COUNT(media_id) AS media_uploaded,
+                       COUNT(post_id) AS created,
+                       COUNT(CASE WHEN done THEN 1 END) AS done
+                FROM import_checkpoints WHERE job_id = ?
+            ''', (job_id,)).fetchone()
+        return dict(row)
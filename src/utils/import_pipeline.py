@@ -0,0 +1,178 @@
+"""
+Staged import pipeline
+Runs each item through a fixed sequence of stages (e.g. image fetch ->
+media upload -> post create -> meta/featured image) with a worker pool per
+stage and bounded queues between them, so different posts occupy different
+stages at the same time
+"""
+
+import queue
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class PipelineStage:
+    """One pipeline stage: fn(job) runs on `workers` threads"""
+
+    def __init__(self, name: str, fn: Callable[[Dict[str, Any]], None], workers: int = 1):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+
+
+class ImportPipeline:
+    """
+    Push items through stages concurrently, returning jobs in input order
+
+    Each item becomes a job dictionary ({'index', 'item', 'error',
+    'failed_stage', 'timings'}) that stage functions read and add results to.
+    A stage that raises marks the job failed; the remaining stages skip it
+    but it still comes out of the pipeline in its input position.
+    """
+
+    def __init__(self, stages: List[PipelineStage], queue_size: Optional[int] = None):
+        """
+        Args:
+            stages: Stages in the order every job passes through them
+            queue_size: Capacity of each queue between stages
+                        (default: twice the workers of the stage reading it)
+        """
+        if not stages:
+            raise Exception("ImportPipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats = {}
+
+    def run(self, items: Iterable[Any], on_job_done: Callable[[Dict[str, Any], int], None] = None) -> List[Dict[str, Any]]:
+        """
+        Run every item through all stages
+
+        Args:
+            items: Items to process
+            on_job_done: Called from the calling thread with (job, completed_count)
+                         as each job leaves the last stage, in completion order
+
+        Returns:
+            Job dictionaries in the same order as items
+        """
+        items = list(items)
+        results = [None] * len(items)
+
+        def collect(job, completed):
+            results[job['index']] = job
+            if on_job_done:
+                on_job_done(job, completed)
+
+        self.stream(items, collect)
+        return results
+
+    def stream(self, items: Iterable[Any], on_job_done: Callable[[Dict[str, Any], int], None]) -> int:
+        """
+        Run items through all stages without keeping the finished jobs
+
+        items is read lazily on a feeder thread, and only as fast as the
+        first stage takes jobs (the queues between stages are bounded), so a
+        generator of any length is never held in memory. Each job is dropped
+        once on_job_done has seen it. An exception raised by items itself is
+        re-raised here after the jobs already read have finished.
+
+        Args:
+            items: Items to process (any iterable, e.g. a generator)
+            on_job_done: Called from the calling thread with (job, completed_count)
+                         as each job leaves the last stage, in completion order
+
+        Returns:
+            Number of jobs completed
+        """
+        self.stats = {stage.name: {'workers': stage.workers, 'processed': 0, 'failed': 0, 'busy_seconds': 0.0}
+                      for stage in self.stages}
+        queues = [queue.Queue(maxsize=self.queue_size or stage.workers * 2) for stage in self.stages]
+        done_queue = queue.Queue()
+        stats_lock = threading.Lock()
+        threads = []
+
+        for position, stage in enumerate(self.stages):
+            outbox = queues[position + 1] if position + 1 < len(self.stages) else done_queue
+            next_workers = self.stages[position + 1].workers if position + 1 < len(self.stages) else 1
+            remaining = [stage.workers]
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(stage, queues[position], outbox, next_workers, remaining, stats_lock),
+                    name=f"import-{stage.name}-{n}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        feed_error = []
+        feeder = threading.Thread(target=self._feed, args=(items, queues[0], self.stages[0].workers, feed_error),
+                                  name="import-feed", daemon=True)
+        feeder.start()
+
+        completed = 0
+        while True:
+            job = done_queue.get()
+            if job is _DONE:
+                break
+            completed += 1
+            try:
+                on_job_done(job, completed)
+            except Exception as e:
+                logger.warning(f"⚠️ Pipeline progress callback failed: {e}")
+
+        feeder.join()
+        for thread in threads:
+            thread.join()
+        if feed_error:
+            raise feed_error[0]
+        return completed
+
+    @staticmethod
+    def _feed(items, inbox, workers, feed_error):
+        try:
+            for index, item in enumerate(items):
+                inbox.put({'index': index, 'item': item, 'error': None, 'failed_stage': None, 'timings': {}})
+        except Exception as e:
+            logger.error(f"❌ Reading pipeline items failed: {e}")
+            feed_error.append(e)
+        finally:
+            for _ in range(workers):
+                inbox.put(_DONE)
+
+    def _worker(self, stage, inbox, outbox, next_workers, remaining, stats_lock):
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                break
+            if job['error'] is None:
+                start = time.perf_counter()
+                try:
+                    stage.fn(job)
+                except Exception as e:
+                    job['error'] = str(e)
+                    job['failed_stage'] = stage.name
+                    logger.warning(f"⚠️ Import stage '{stage.name}' failed for item {job['index']}: {e}")
+                elapsed = time.perf_counter() - start
+                job['timings'][stage.name] = elapsed
+                with stats_lock:
+                    stage_stats = self.stats[stage.name]
+                    stage_stats['processed'] += 1
+                    stage_stats['busy_seconds'] += elapsed
+                    if job['failed_stage'] == stage.name:
+                        stage_stats['failed'] += 1
+            outbox.put(job)
+
+        # The last worker of a stage to finish closes the next stage's queue
+        with stats_lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(next_workers):
+                outbox.put(_DONE)
@@ -0,0 +1,191 @@
+"""
+Shared Instagram CDN download client
+One pooled requests.Session for every image download in the process, with the
+Instagram cookie warm-up done once per TTL instead of before every image, and
+the cookie jar persisted across restarts
+"""
+import os
+import threading
+import time
+from http.cookiejar import LWPCookieJar
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .media_stream import stream_download, stream_download_ranges
+
+logger = logging.getLogger(__name__)
+
+INSTAGRAM_HOME = 'https://www.instagram.com/'
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Referer': 'https://www.instagram.com/',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Connection': 'keep-alive'
+}
+
+
+class InstagramCDNClient:
+    """
+    Pooled, thread-safe downloader for Instagram CDN URLs
+
+    The homepage GET that gives the session Instagram cookies (which helps
+    CDN success rates) runs before the first download and then again only
+    once the TTL has passed. A failed warm-up is retried after
+    retry_interval rather than on every download.
+    """
+
+    def __init__(self, pool_size: int = 16, warmup_ttl: float = 6 * 3600, warmup_url: str = INSTAGRAM_HOME,
+                 cookie_path: Optional[str] = None, retry_interval: float = 60.0):
+        """
+        Args:
+            pool_size: Connections kept per CDN host (match the download concurrency)
+            warmup_ttl: Seconds a cookie warm-up stays valid
+            warmup_url: Page fetched for cookies
+            cookie_path: LWP cookie file (default: data/instagram_cookies.txt)
+            retry_interval: Seconds before retrying a failed warm-up
+        """
+        if cookie_path is None:
+            cookie_path = Path(__file__).parent.parent.parent / "data" / "instagram_cookies.txt"
+
+        self.pool_size = pool_size
+        self.warmup_ttl = warmup_ttl
+        self.warmup_url = warmup_url
+        self.cookie_path = str(cookie_path)
+        self.retry_interval = retry_interval
+
+        self.session = requests.Session()
+        # Threads wait for a free pooled connection instead of opening throwaway ones
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.cookies = LWPCookieJar(self.cookie_path)
+
+        self._warmup_lock = threading.Lock()
+        self._next_warmup = 0.0
+        self._last_warmup = None
+        self._stats = {'warmups': 0, 'warmup_failures': 0, 'downloads': 0, 'download_errors': 0}
+        self._stats_lock = threading.Lock()
+        self._load_cookies()
+
+    def _load_cookies(self):
+        """Reuse cookies from a warm-up that is still within the TTL"""
+        try:
+            warmed_at = os.path.getmtime(self.cookie_path)
+            self.session.cookies.load(ignore_discard=True)
+        except (OSError, ValueError):
+            return
+        if time.time() - warmed_at < self.warmup_ttl:
+            self._last_warmup = warmed_at
+            self._next_warmup = warmed_at + self.warmup_ttl
+            logger.info(f"🍪 Loaded Instagram cookies from {self.cookie_path}")
+
+    def warm_up(self, force: bool = False) -> bool:
+        """
+        Fetch Instagram cookies if the last warm-up expired
+
+        Only one thread warms up; the others carry on with the cookies they
+        have. Returns whether a warm-up request was made.
+        """
+        if not force and time.time() < self._next_warmup:
+            return False
+        if not self._warmup_lock.acquire(blocking=False):
+            return False
+        try:
+            if not force and time.time() < self._next_warmup:
+                return False
+            try:
+                self.session.get(self.warmup_url, timeout=10)
+                now = time.time()
+                self._last_warmup = now
+                self._next_warmup = now + self.warmup_ttl
+                self._count('warmups')
+                self._save_cookies()
+                logger.info("🍪 Refreshed Instagram cookies")
+            except requests.exceptions.RequestException as e:
+                self._next_warmup = time.time() + self.retry_interval
+                self._count('warmup_failures')
+                logger.warning(f"⚠️ Instagram cookie warm-up failed: {e}")
+            return True
+        finally:
+            self._warmup_lock.release()
+
+    def _save_cookies(self):
+        try:
+            Path(self.cookie_path).parent.mkdir(parents=True, exist_ok=True)
+            self.session.cookies.save(ignore_discard=True)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save Instagram cookies: {e}")
+
+    def download(self, url: str, timeout: int = 30) -> Tuple[bool, Optional[bytes], Optional[str]]:
+        """
+        Download a CDN URL into memory
+
+        Returns:
+            (success, data, error_message)
+        """
+        self.warm_up()
+        try:
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            self._count('downloads')
+            return True, response.content, None
+        except requests.exceptions.RequestException as e:
+            self._count('download_errors')
+            return False, None, f"Request failed: {str(e)}"
+
+    def download_to_file(self, url: str, dest_path, timeout: int = 30, range_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Stream a CDN URL to disk (see stream_download), raising on failure
+
+        With range_size the file is fetched in Range requests of that many
+        bytes (see stream_download_ranges), which suits large videos.
+        """
+        self.warm_up()
+        try:
+            if range_size:
+                result = stream_download_ranges(self.session, url, dest_path, range_size=range_size, timeout=timeout)
+            else:
+                result = stream_download(self.session, url, dest_path, timeout=timeout)
+        except requests.exceptions.RequestException:
+            self._count('download_errors')
+            raise
+        self._count('downloads')
+        return result
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Download and warm-up counters"""
+        with self._stats_lock:
+            return {**self._stats, 'pool_size': self.pool_size, 'warmup_ttl': self.warmup_ttl,
+                    'last_warmup': self._last_warmup}
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def configure_cdn_client(**kwargs) -> InstagramCDNClient:
+    """Replace the process-wide client, e.g. with pool size and TTL from the environment"""
+    global _shared_client
+    with _shared_lock:
+        _shared_client = InstagramCDNClient(**kwargs)
+        return _shared_client
+
+
+def get_cdn_client() -> InstagramCDNClient:
+    """Process-wide InstagramCDNClient"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = InstagramCDNClient()
+        return _shared_client
@@ -14,6 +14,10 @@ import os
 from typing import Optional, Tuple
 import logging
 
+from .media_index import MediaIndex, get_media_index, rest_media_exists
+from .instagram_cdn import get_cdn_client
+from .media_stream import RANGE_SIZE, stream_upload
+
 logger = logging.getLogger(__name__)
 
 class InstagramImageDownloader:
@@ -24,16 +28,12 @@ class InstagramImageDownloader:
     with standard HTTP requests - no special infrastructure needed!
     """
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Referer': 'https://www.instagram.com/',
-            'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'DNT': '1',
-            'Connection': 'keep-alive'
-        })
+    def __init__(self, media_index=None, cdn_client=None):
+        # Resolved on first upload, so download-only use never opens the index
+        self.media_index = media_index
+        # Downloads share one pooled session and cookie warm-up across the process
+        self.cdn = cdn_client or get_cdn_client()
+        self.session = self.cdn.session
     
     def download_image(self, instagram_url: str) -> Tuple[bool, Optional[bytes], Optional[str]]:
         """
@@ -45,21 +45,28 @@ class InstagramImageDownloader:
         Returns:
             (success, image_data, error_message)
         """
-        try:
-            # Get Instagram homepage for cookies (helps with success rate)
-            self.session.get('https://www.instagram.com/', timeout=10)
-            
-            # Download the image
-            response = self.session.get(instagram_url, timeout=30)
-            response.raise_for_status()
+        success, image_data, error = self.cdn.download(instagram_url)
+        if success:
+            logger.info(f"✅ Successfully downloaded {len(image_data)} bytes")
+        else:
+            logger.error(f"❌ Download error: {error}")
+        return success, image_data, error
+    
+    def download_image_to_file(self, instagram_url: str, dest_path) -> Tuple[bool, Optional[dict], Optional[str]]:
+        """
+        Download Instagram image from CDN URL straight to disk
+        
+        Args:
+            instagram_url: Instagram CDN URL (from Apify scraper)
+            dest_path: File to write the image to
             
-            if response.status_code == 200:
-                logger.info(f"✅ Successfully downloaded {len(response.content)} bytes")
-                return True, response.content, None
-            else:
-                error_msg = f"HTTP {response.status_code}"
-                logger.warning(f"⚠️ Download failed: {error_msg}")
-                return False, None, error_msg
+        Returns:
+            (success, {'path', 'size', 'sha256', 'content_type'}, error_message)
+        """
+        try:
+            image_file = self.cdn.download_to_file(instagram_url, dest_path)
+            logger.info(f"✅ Successfully downloaded {image_file['size']} bytes to {dest_path}")
+            return True, image_file, None
                 
         except requests.exceptions.RequestException as e:
             error_msg = f"Request failed: {str(e)}"
@@ -70,11 +77,40 @@ class InstagramImageDownloader:
             logger.error(f"❌ Unexpected error: {error_msg}")
             return False, None, error_msg
     
+    def download_video_to_file(self, instagram_url: str, dest_path,
+                               range_size: int = RANGE_SIZE) -> Tuple[bool, Optional[dict], Optional[str]]:
+        """
+        Download an Instagram video from its CDN URL to disk in Range requests
+        
+        Args:
+            instagram_url: Instagram CDN video URL (from Apify scraper)
+            dest_path: File to write the video to
+            range_size: Bytes per Range request
+            
+        Returns:
+            (success, {'path', 'size', 'sha256', 'content_type'}, error_message)
+        """
+        try:
+            video_file = self.cdn.download_to_file(instagram_url, dest_path, timeout=60, range_size=range_size)
+            logger.info(f"✅ Successfully downloaded {video_file['size']} byte video to {dest_path}")
+            return True, video_file, None
+                
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request failed: {str(e)}"
+            logger.error(f"❌ Video download error: {error_msg}")
+            return False, None, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            logger.error(f"❌ Unexpected error: {error_msg}")
+            return False, None, error_msg
+    
     def upload_to_wordpress(self, image_data: bytes, filename: str, 
                           wp_url: str, username: str, password: str) -> Tuple[bool, Optional[int], Optional[str]]:
         """
         Upload image to WordPress via REST API
         
+        Bytes already uploaded to this site reuse the existing attachment.
+        
         Args:
             image_data: Raw image bytes
             filename: Filename for the upload
@@ -85,28 +121,67 @@ class InstagramImageDownloader:
         Returns:
             (success, media_id, error_message)
         """
+        def send(upload_url, headers):
+            # Raw body instead of multipart, so the bytes are not copied into a form body
+            headers = {**headers, 'Content-Type': 'image/jpeg',
+                       'Content-Disposition': f'attachment; filename="{filename}"'}
+            return requests.post(upload_url, data=image_data, headers=headers, timeout=60)
+        
+        return self._upload(send, lambda: MediaIndex.hash_bytes(image_data), filename, len(image_data),
+                            wp_url, username, password)
+    
+    def upload_file_to_wordpress(self, path, filename: str, wp_url: str, username: str, password: str,
+                                 sha256: Optional[str] = None) -> Tuple[bool, Optional[int], Optional[str]]:
+        """
+        Upload an image file to WordPress, streaming it from disk
+        
+        Args:
+            path: Image file
+            filename: Filename for the upload
+            wp_url: WordPress base URL (without /wp-json)
+            username: WordPress username
+            password: WordPress password or app password
+            sha256: Hash of the file if already known (e.g. from download_image_to_file)
+            
+        Returns:
+            (success, media_id, error_message)
+        """
+        def send(upload_url, headers):
+            return stream_upload(requests, upload_url, path, filename, 'image/jpeg', headers)
+        
+        return self._upload(send, lambda: sha256 or MediaIndex.hash_file(path), filename,
+                            os.path.getsize(path), wp_url, username, password)
+    
+    def _upload(self, send, image_hash, filename: str, size: int, wp_url: str, username: str,
+                password: str) -> Tuple[bool, Optional[int], Optional[str]]:
+        """Reuse an identical attachment from the media index, else send(upload_url, headers) and record it"""
         try:
             upload_url = f"{wp_url}/wp-json/wp/v2/media"
             
             # Create basic auth header
             credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
             
-            # Prepare file upload
-            files = {
-                'file': (filename, image_data, 'image/jpeg')
-            }
-            
             headers = {
                 'Authorization': f'Basic {credentials}'
             }
             
+            if self.media_index is None:
+                self.media_index = get_media_index()
+            image_hash = image_hash()
+            existing = self.media_index.find_existing(
+                image_hash, wp_url, exists=lambda media_id: rest_media_exists(wp_url, media_id, headers))
+            if existing:
+                logger.info(f"♻️ Reusing media {existing['media_id']} for {filename} (identical image)")
+                return True, existing['media_id'], None
+            
             # Upload to WordPress
-            response = requests.post(upload_url, files=files, headers=headers, timeout=60)
+            response = send(upload_url, headers)
             
             if response.status_code == 201:
                 media_data = response.json()
                 media_id = media_data['id']
                 logger.info(f"✅ WordPress upload successful: Media ID {media_id}")
+                self.media_index.record(image_hash, wp_url, media_id, media_data.get('source_url'), filename, size)
                 return True, media_id, None
             else:
                 error_msg = f"WordPress upload failed: {response.status_code} - {response.text[:200]}"
@@ -123,6 +198,8 @@ class InstagramImageDownloader:
         """
         Complete workflow: Download from Instagram and upload to WordPress
         
+        The image goes through a temporary file rather than memory.
+        
         Args:
             instagram_url: Instagram CDN URL
             post_data: Instagram post data (for filename generation)
@@ -133,19 +210,21 @@ class InstagramImageDownloader:
         Returns:
             (success, media_id, error_message)
         """
-        # Step 1: Download from Instagram
-        success, image_data, error = self.download_image(instagram_url)
-        
-        if not success:
-            return False, None, f"Download failed: {error}"
-        
-        # Step 2: Generate filename
+        # Step 1: Generate filename
         shortcode = post_data.get('shortcode', 'unknown')
         username_ig = post_data.get('username', 'instagram')
         filename = f"instagram_{username_ig}_{shortcode}.jpg"
         
-        # Step 3: Upload to WordPress
-        return self.upload_to_wordpress(image_data, filename, wp_url, username, password)
+        with tempfile.TemporaryDirectory(prefix='instagram_') as tmp_dir:
+            # Step 2: Download from Instagram
+            success, image_file, error = self.download_image_to_file(instagram_url, os.path.join(tmp_dir, filename))
+            
+            if not success:
+                return False, None, f"Download failed: {error}"
+            
+            # Step 3: Upload to WordPress
+            return self.upload_file_to_wordpress(image_file['path'], filename, wp_url, username, password,
+                                                 sha256=image_file['sha256'])
 
 def test_instagram_download():
     """
@@ -0,0 +1,452 @@
+"""
+Persistent background job queue
+Long-running work (bulk imports) is stored in SQLite and executed by a pool of
+worker threads, so HTTP requests can return a job ID immediately
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETE = 'complete'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+INTERRUPTED = 'interrupted'
+
+FINISHED_STATUSES = (COMPLETE, FAILED, CANCELLED, INTERRUPTED)
+RESUMABLE_STATUSES = (COMPLETE, FAILED, INTERRUPTED)
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue with per-site and per-username concurrency caps
+
+    Jobs are dispatched to handlers registered by job type. A handler receives
+    the job dictionary and returns a JSON-serialisable result; a result with
+    success False, or an exception, marks the job failed.
+
+    Several queues (one per gunicorn worker) may share a database. Each
+    claimed job records the queue that owns it, and a running queue
+    refreshes its jobs' heartbeat; a running job is only marked interrupted
+    once its owner is gone - its heartbeat went stale, or its process on
+    this host has exited - so starting a queue never interrupts jobs that
+    another live queue is running.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, workers: int = 2, max_per_site: int = 2,
+                 max_per_username: int = 1, poll_interval: float = 1.0, heartbeat_interval: float = 10.0):
+        """
+        Args:
+            db_path: SQLite file (default: data/jobs.db next to post_tracker.db)
+            workers: Worker threads executing jobs
+            max_per_site: Jobs allowed to run at once against one WordPress site
+            max_per_username: Jobs allowed to run at once for one Instagram username
+            poll_interval: Seconds idle workers wait before re-checking the queue
+            heartbeat_interval: Seconds between heartbeats of running jobs; a job whose
+                                heartbeat is three intervals old is taken to be orphaned
+        """
+        if db_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            data_dir = project_root / "data"
+            data_dir.mkdir(exist_ok=True)
+            db_path = data_dir / "jobs.db"
+
+        self.db_path = str(db_path)
+        self.workers = workers
+        self.max_per_site = max_per_site
+        self.max_per_username = max_per_username
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        # host:pid:instance, so a queue can tell its own jobs and dead processes' jobs apart
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.handlers = {}
+        self._claim_lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stop = threading.Event()
+        self._threads = []
+        self._init_database()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create the jobs table and mark jobs orphaned by a restart as interrupted"""
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    site TEXT,
+                    username TEXT,
+                    params TEXT NOT NULL,
+                    progress_session_id TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT,
+                    heartbeat_at TEXT
+                )
+            ''')
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'owner' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN owner TEXT')
+                conn.execute('ALTER TABLE jobs ADD COLUMN heartbeat_at TEXT')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)')
+            # Per-item results of large jobs, written as they finish and read back a page at a time
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS job_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    outcome TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_job_results_job ON job_results (job_id, outcome, id)')
+            conn.commit()
+        self._interrupt_orphans()
+
+    def _interrupt_orphans(self) -> int:
+        """Mark running jobs whose owning queue is gone as interrupted"""
+        stale_before = datetime.now() - timedelta(seconds=3 * self.heartbeat_interval)
+        with self._connect() as conn:
+            orphans = [row for row in conn.execute('SELECT id, owner, heartbeat_at FROM jobs WHERE status = ?',
+                                                   (RUNNING,))
+                       if self._owner_gone(row['owner'], row['heartbeat_at'], stale_before)]
+            orphaned = 0
+            for row in orphans:
+                # Only if the owner did not heartbeat (or finish) since it was read
+                orphaned += conn.execute(
+                    'UPDATE jobs SET status = ?, error = ?, finished_at = ? '
+                    'WHERE id = ? AND status = ? AND heartbeat_at IS ?',
+                    (INTERRUPTED, 'Interrupted by server restart', datetime.now().isoformat(), row['id'], RUNNING,
+                     row['heartbeat_at'])
+                ).rowcount
+            conn.commit()
+        if orphaned:
+            logger.warning(f"⚠️ Marked {orphaned} job(s) interrupted: the worker running them stopped")
+        return orphaned
+
+    def _owner_gone(self, owner: Optional[str], heartbeat_at: Optional[str], stale_before: datetime) -> bool:
+        if owner == self.owner:
+            return False
+        if not owner or not heartbeat_at or datetime.fromisoformat(heartbeat_at) < stale_before:
+            return True
+        host, pid = owner.split(':')[:2]
+        if host != socket.gethostname() or os.name != 'posix':
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except (OSError, ValueError):
+            pass
+        return False
+
+    def register(self, job_type: str, handler: Callable[[Dict[str, Any]], Any]):
+        """Register the handler that executes jobs of job_type"""
+        self.handlers[job_type] = handler
+
+    def submit(self, job_type: str, params: Dict[str, Any], site: str = None, username: str = None,
+               progress_session_id: str = None) -> Dict[str, Any]:
+        """
+        Queue a job
+
+        Args:
+            job_type: Registered job type
+            params: JSON-serialisable handler parameters
+            site: WordPress site the job writes to (for the per-site cap)
+            username: Instagram username the job works on (for the per-username cap)
+            progress_session_id: Progress session the job reports to
+
+        Returns:
+            The stored job dictionary
+        """
+        if job_type not in self.handlers:
+            raise Exception(f"Unknown job type: {job_type}")
+
+        job_id = str(uuid.uuid4())
+        with self._connect() as conn:
+            conn.execute('''
+                INSERT INTO jobs (id, job_type, status, site, username, params, progress_session_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (job_id, job_type, QUEUED, site, username, json.dumps(params), progress_session_id,
+                  datetime.now().isoformat()))
+            conn.commit()
+
+        ahead = self.count(QUEUED) - 1 + self.count(RUNNING)
+        self._report_progress(progress_session_id, step=1,
+                              message=f"⏳ Queued behind {ahead} job(s)..." if ahead else "⏳ Queued...")
+        logger.info(f"📥 Queued {job_type} job {job_id}")
+        with self._wakeup:
+            self._wakeup.notify()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, status: str = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """List the most recent jobs, optionally filtered by status"""
+        query = 'SELECT * FROM jobs'
+        args = []
+        if status:
+            query += ' WHERE status = ?'
+            args.append(status)
+        query += ' ORDER BY created_at DESC LIMIT ?'
+        args.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(query, args).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def count(self, status: str) -> int:
+        """Number of jobs in a status"""
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM jobs WHERE status = ?', (status,)).fetchone()[0]
+
+    def add_results(self, job_id: str, outcome: str, records: List[Dict[str, Any]]):
+        """Store per-item results of a job (e.g. outcome 'imported' with one record per post)"""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany('INSERT INTO job_results (job_id, outcome, data, created_at) VALUES (?, ?, ?, ?)',
+                             [(job_id, outcome, json.dumps(record, default=str), now) for record in records])
+            conn.commit()
+
+    def get_results(self, job_id: str, outcome: str = None, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """
+        Page through a job's stored results in the order they were recorded
+
+        Args:
+            job_id: Job whose results to read
+            outcome: Only results with this outcome
+            offset: Results to skip
+            limit: Results to return
+
+        Returns:
+            {'results', 'total', 'offset', 'limit', 'counts'}; each result is its record plus
+            'outcome', total counts the results matching outcome, counts is per outcome
+        """
+        where = 'WHERE job_id = ?'
+        args = [job_id]
+        if outcome:
+            where += ' AND outcome = ?'
+            args.append(outcome)
+        with self._connect() as conn:
+            rows = conn.execute(f'SELECT outcome, data FROM job_results {where} ORDER BY id LIMIT ? OFFSET ?',
+                                (*args, limit, offset)).fetchall()
+            counts = {row[0]: row[1] for row in conn.execute(
+                'SELECT outcome, COUNT(*) FROM job_results WHERE job_id = ? GROUP BY outcome', (job_id,))}
+        return {
+            'results': [{'outcome': row['outcome'], **json.loads(row['data'])} for row in rows],
+            'total': counts.get(outcome, 0) if outcome else sum(counts.values()),
+            'offset': offset,
+            'limit': limit,
+            'counts': counts
+        }
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet"""
+        with self._claim_lock, self._connect() as conn:
+            cancelled = conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?',
+                (CANCELLED, datetime.now().isoformat(), job_id, QUEUED)
+            ).rowcount
+            conn.commit()
+        if cancelled:
+            job = self.get(job_id)
+            self._report_progress(job['progress_session_id'], status='cancelled',
+                                  message='Operation cancelled by user')
+        return bool(cancelled)
+
+    def resume_job(self, job_id: str, progress_session_id: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Queue a finished job to run again under the same ID
+
+        Handlers that checkpoint their work by job ID (see ImportCheckpoints)
+        continue where the earlier attempt stopped, so failed or interrupted
+        jobs - and completed ones where some items failed - can be finished.
+
+        Args:
+            job_id: Job to resume
+            progress_session_id: New progress session to report to (default: keep the old one)
+
+        Returns:
+            The re-queued job, or None if the job is still queued/running or was cancelled
+        """
+        with self._claim_lock, self._connect() as conn:
+            resumed = conn.execute('''
+                UPDATE jobs SET status = ?, result = NULL, error = NULL, started_at = NULL, finished_at = NULL,
+                                owner = NULL, heartbeat_at = NULL,
+                                progress_session_id = COALESCE(?, progress_session_id)
+                WHERE id = ? AND status IN (?, ?, ?)
+            ''', (QUEUED, progress_session_id, job_id, *RESUMABLE_STATUSES)).rowcount
+            if resumed:
+                # The resumed run reports every post it continues again; skips are not re-checked
+                conn.execute("DELETE FROM job_results WHERE job_id = ? AND outcome != 'skipped'", (job_id,))
+            conn.commit()
+        if not resumed:
+            return None
+
+        job = self.get(job_id)
+        self._report_progress(job['progress_session_id'], step=1, message="⏳ Queued to resume...")
+        logger.info(f"♻️ Re-queued {job['job_type']} job {job_id}")
+        with self._wakeup:
+            self._wakeup.notify()
+        return job
+
+    def start(self):
+        """Start the worker threads and the heartbeat"""
+        if self._threads:
+            return
+        self._stop.clear()
+        for n in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat, name='job-heartbeat', daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+        logger.info(f"✅ Job queue started with {self.workers} worker(s): {self.db_path}")
+
+    def stop(self, timeout: float = None):
+        """Stop the workers after their current jobs"""
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Job counts by status plus the configured limits"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {
+            'workers': self.workers,
+            'max_per_site': self.max_per_site,
+            'max_per_username': self.max_per_username,
+            'jobs': {row[0]: row[1] for row in rows}
+        }
+
+    def _heartbeat(self):
+        """Keep this queue's running jobs owned, and pick up jobs whose owners died"""
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                with self._connect() as conn:
+                    conn.execute('UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = ?',
+                                 (datetime.now().isoformat(), self.owner, RUNNING))
+                    conn.commit()
+                self._interrupt_orphans()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Job heartbeat failed: {e}")
+
+    def _worker(self):
+        while not self._stop.is_set():
+            job = self._claim_next()
+            if job is None:
+                with self._wakeup:
+                    self._wakeup.wait(self.poll_interval)
+                continue
+            self._run(job)
+            with self._wakeup:
+                self._wakeup.notify_all()
+
+    def _claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Mark the oldest queued job whose site and username are under their caps as running
+
+        The caps are read and the job claimed in one BEGIN IMMEDIATE
+        transaction, and the claim only takes while the row is still queued,
+        so queues in other processes sharing the database (one per gunicorn
+        worker) never run the same job twice.
+        """
+        with self._claim_lock, self._connect() as conn:
+            # Take the write lock before reading, so no other process claims in between
+            conn.execute('BEGIN IMMEDIATE')
+            running = conn.execute('SELECT site, username FROM jobs WHERE status = ?', (RUNNING,)).fetchall()
+            site_counts = {}
+            username_counts = {}
+            for row in running:
+                site_counts[row['site']] = site_counts.get(row['site'], 0) + 1
+                username_counts[row['username']] = username_counts.get(row['username'], 0) + 1
+
+            for row in conn.execute('SELECT * FROM jobs WHERE status = ? ORDER BY created_at', (QUEUED,)).fetchall():
+                if row['site'] and site_counts.get(row['site'], 0) >= self.max_per_site:
+                    continue
+                if row['username'] and username_counts.get(row['username'], 0) >= self.max_per_username:
+                    continue
+                now = datetime.now().isoformat()
+                claimed = conn.execute(
+                    'UPDATE jobs SET status = ?, started_at = ?, owner = ?, heartbeat_at = ? '
+                    'WHERE id = ? AND status = ?',
+                    (RUNNING, now, self.owner, now, row['id'], QUEUED)
+                ).rowcount
+                if not claimed:
+                    # Lost the claim to another queue
+                    continue
+                conn.commit()
+                return self.get(row['id'])
+        return None
+
+    def _run(self, job: Dict[str, Any]):
+        logger.info(f"🚀 Running {job['job_type']} job {job['id']}")
+        try:
+            result = self.handlers[job['job_type']](job)
+            error = None
+            if isinstance(result, dict) and result.get('success') is False:
+                error = result.get('error') or result.get('message') or 'Job failed'
+        except Exception as e:
+            logger.error(f"❌ Job {job['id']} failed: {e}")
+            result = None
+            error = str(e)
+
+        with self._connect() as conn:
+            # Unless the job was re-queued (resumed) after being taken for orphaned
+            conn.execute('UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? '
+                         'WHERE id = ? AND owner = ?',
+                         (FAILED if error else COMPLETE, json.dumps(result) if result is not None else None,
+                          error, datetime.now().isoformat(), job['id'], self.owner))
+            conn.commit()
+
+        if error:
+            self._report_progress(job['progress_session_id'], status='error', message=f"❌ {error}")
+        else:
+            self._report_progress(job['progress_session_id'], complete=True,
+                                  message=result.get('message') if isinstance(result, dict) else None)
+
+    @staticmethod
+    def _report_progress(progress_session_id, complete=False, **kwargs):
+        if not progress_session_id:
+            return
+        try:
+            from ..api.progress_routes import update_progress, complete_progress
+            if complete:
+                complete_progress(progress_session_id, kwargs.get('message'))
+            else:
+                update_progress(progress_session_id, **kwargs)
+        except ImportError:
+            pass
+
+    @staticmethod
+    def _row_to_job(row) -> Dict[str, Any]:
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
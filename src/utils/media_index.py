@@ -0,0 +1,153 @@
+"""
+Content-addressed index of uploaded WordPress media
+Maps the SHA-256 of image bytes to the attachment already created for them,
+so identical images are not uploaded to the media library again
+"""
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+class MediaIndex:
+    """SHA-256 -> WordPress media ID, per WordPress site"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            data_dir = project_root / "data"
+            data_dir.mkdir(exist_ok=True)
+            db_path = data_dir / "media_index.db"
+
+        self.db_path = str(db_path)
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0}
+        self._stats_lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS media_hashes (
+                    sha256 TEXT NOT NULL,
+                    site TEXT NOT NULL,
+                    media_id INTEGER NOT NULL,
+                    source_url TEXT,
+                    filename TEXT,
+                    size INTEGER,
+                    created_at TEXT,
+                    PRIMARY KEY (sha256, site)
+                )
+            ''')
+            conn.commit()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """SHA-256 hex digest of in-memory bytes"""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def hash_file(path) -> str:
+        """SHA-256 hex digest of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def lookup(self, sha256: str, site: str) -> Optional[Dict[str, Any]]:
+        """Get the recorded attachment for a hash on a site"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute('''
+                SELECT media_id, source_url, filename, size FROM media_hashes WHERE sha256 = ? AND site = ?
+            ''', (sha256, site)).fetchone()
+        if not row:
+            return None
+        return {'media_id': row[0], 'source_url': row[1], 'filename': row[2], 'size': row[3]}
+
+    def find_existing(self, sha256: str, site: str,
+                      exists: Callable[[int], bool] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the attachment to reuse for a hash, if any
+
+        Args:
+            sha256: Hash of the image bytes
+            site: WordPress site the attachment must belong to
+            exists: Optional check that the attachment was not deleted in
+                    WordPress since it was recorded; stale entries are dropped
+
+        Returns:
+            The recorded entry, or None when the bytes must be uploaded
+        """
+        entry = self.lookup(sha256, site)
+        if entry and exists is not None and not exists(entry['media_id']):
+            logger.info(f"🗑️ Media {entry['media_id']} no longer exists on {site}, uploading again")
+            self.forget(sha256, site)
+            self._count('stale')
+            entry = None
+        self._count('hits' if entry else 'misses')
+        return entry
+
+    def record(self, sha256: str, site: str, media_id: int, source_url: str = None,
+               filename: str = None, size: int = None):
+        """Remember the attachment created for a hash"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO media_hashes (sha256, site, media_id, source_url, filename, size, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (sha256, site, media_id, source_url, filename, size, datetime.now().isoformat()))
+            conn.commit()
+
+    def forget(self, sha256: str, site: str):
+        """Drop the entry for a hash"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM media_hashes WHERE sha256 = ? AND site = ?', (sha256, site))
+            conn.commit()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count plus reuse counters since startup"""
+        with sqlite3.connect(self.db_path) as conn:
+            entries = conn.execute('SELECT COUNT(*) FROM media_hashes').fetchone()[0]
+        with self._stats_lock:
+            return {'entries': entries, **self._stats}
+
+
+def rest_media_exists(wp_url: str, media_id: int, headers: Dict[str, str] = None, session=None) -> bool:
+    """
+    Whether a media library item still exists, via a minimal REST request
+
+    Only a definite 404/410 counts as deleted; other failures assume the item
+    is still there rather than forcing a re-upload.
+    """
+    try:
+        response = (session or requests).get(f"{wp_url}/wp-json/wp/v2/media/{media_id}",
+                                             params={'_fields': 'id'}, headers=headers, timeout=10)
+        return response.status_code not in (404, 410)
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"⚠️ Could not verify media {media_id}: {e}")
+        return True
+
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+
+def get_media_index() -> MediaIndex:
+    """Process-wide MediaIndex in data/media_index.db"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = MediaIndex()
+        return _shared_index
@@ -0,0 +1,143 @@
+"""
+Streaming media transfer helpers
+Images and videos move between the Instagram CDN, local disk and the
+WordPress REST API in fixed-size chunks, so memory per transfer stays at one
+buffer regardless of file size
+"""
+import hashlib
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+# Bytes requested per Range request when downloading videos
+RANGE_SIZE = 4 * 1024 * 1024
+
+
+def stream_download(session, url: str, dest_path, timeout: int = 30,
+                    chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Download a URL to a file, hashing it on the way
+
+    Args:
+        session: requests.Session (or the requests module) to download with
+        url: URL to fetch
+        dest_path: File to write
+        timeout: Request timeout in seconds
+
+    Returns:
+        {'path', 'size', 'sha256', 'content_type'}
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with session.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        with open(dest_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        content_type = response.headers.get('Content-Type')
+    return {'path': str(dest_path), 'size': size, 'sha256': digest.hexdigest(), 'content_type': content_type}
+
+
+def stream_download_ranges(session, url: str, dest_path, range_size: int = RANGE_SIZE, timeout: int = 30,
+                           retries: int = 2, chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Download a large file (e.g. a video) to disk in consecutive Range requests
+
+    Each request asks for at most range_size bytes, so a dropped connection
+    only costs the rest of the current range: the next attempt resumes at
+    the last byte written. A server that ignores Range and answers 200 is
+    streamed in one go.
+
+    Args:
+        session: requests.Session (or the requests module) to download with
+        url: URL to fetch
+        dest_path: File to write
+        range_size: Bytes per Range request
+        timeout: Request timeout in seconds
+        retries: Attempts per range after a failed request
+
+    Returns:
+        {'path', 'size', 'sha256', 'content_type'}
+    """
+    digest = hashlib.sha256()
+    offset = 0
+    total = None
+    content_type = None
+    failures = 0
+    with open(dest_path, 'wb') as f:
+        while total is None or offset < total:
+            headers = {'Range': f'bytes={offset}-{offset + range_size - 1}'}
+            try:
+                with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                    if response.status_code == 416 and offset:
+                        # The previous range ended exactly at the end of the file
+                        break
+                    response.raise_for_status()
+                    content_type = content_type or response.headers.get('Content-Type')
+                    whole = response.status_code != 206
+                    if whole and offset:
+                        # Range ignored part way through: start over with the full body
+                        f.seek(0)
+                        f.truncate()
+                        digest = hashlib.sha256()
+                        offset = 0
+                    received = 0
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        offset += len(chunk)
+                        received += len(chunk)
+                    if whole:
+                        break
+                    total = _content_range_total(response.headers.get('Content-Range')) or total
+                    if total is None and received < range_size:
+                        total = offset
+                failures = 0
+            except requests.exceptions.RequestException:
+                failures += 1
+                if failures > retries:
+                    raise
+                logger.warning(f"⚠️ Range request for {url} failed at byte {offset}, resuming")
+    return {'path': str(dest_path), 'size': offset, 'sha256': digest.hexdigest(), 'content_type': content_type}
+
+
+def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Total size from a 'bytes start-end/total' Content-Range header (None if unknown)"""
+    match = re.match(r'bytes \d+-\d+/(\d+)', content_range or '')
+    return int(match.group(1)) if match else None
+
+
+def stream_upload(session, upload_url: str, path, filename: Optional[str] = None, mime_type: Optional[str] = None,
+                  headers: Dict[str, str] = None, timeout: int = 60) -> requests.Response:
+    """
+    POST a file to the WordPress media endpoint straight from disk
+
+    The body is the raw file with Content-Disposition naming it (which
+    /wp/v2/media accepts as an alternative to multipart), sent from the open
+    file handle so it is never loaded into memory. Content-Length comes from
+    the file size rather than using chunked transfer encoding, which many
+    PHP/FastCGI setups reject for request bodies.
+    """
+    path = Path(path)
+    filename = filename or path.name
+    if not mime_type:
+        mime_type = mimetypes.guess_type(filename)[0] or 'image/jpeg'
+
+    upload_headers = dict(headers or {})
+    upload_headers.update({
+        'Content-Type': mime_type,
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Content-Length': str(os.path.getsize(path))
+    })
+    with open(path, 'rb') as f:
+        return session.post(upload_url, data=f, headers=upload_headers, timeout=timeout)
@@ -4,7 +4,7 @@ SQLite database for tracking Instagram to WordPress post relationships
 import sqlite3
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 import logging
 
@@ -191,6 +191,61 @@ class PostTracker:
                 }
             return None
     
+    def get_imported_shortcodes(self, shortcodes: List[str]) -> Dict[str, int]:
+        """Map each already-imported shortcode in shortcodes to its WordPress post ID"""
+        imported = {}
+        shortcodes = [s for s in dict.fromkeys(shortcodes) if s]
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(shortcodes), 500):
+                chunk = shortcodes[start:start + 500]
+                cursor.execute(f'''
+                    SELECT i.instagram_shortcode, w.wordpress_post_id
+                    FROM instagram_posts i
+                    JOIN post_mappings m ON i.id = m.instagram_post_id
+                    JOIN wordpress_posts w ON m.wordpress_post_id = w.id
+                    WHERE i.instagram_shortcode IN ({','.join('?' * len(chunk))})
+                ''', chunk)
+                imported.update(cursor.fetchall())
+        return imported
+    
+    def filter_new_posts(self, posts: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split posts into ones still to import and ones already imported
+        
+        One batched lookup for the whole list; repeated shortcodes within
+        posts are also skipped. Posts without a shortcode are always new.
+        
+        Returns:
+            (new_posts, skipped) where skipped holds shortcode and wordpress_post_id
+        """
+        imported = self.get_imported_shortcodes([post.get('shortcode') for post in posts])
+        new_posts = []
+        skipped = []
+        seen = set()
+        for post in posts:
+            shortcode = post.get('shortcode')
+            if shortcode in imported:
+                skipped.append({'shortcode': shortcode, 'wordpress_post_id': imported[shortcode]})
+            elif shortcode and shortcode in seen:
+                skipped.append({'shortcode': shortcode, 'wordpress_post_id': None})
+            else:
+                new_posts.append(post)
+            if shortcode:
+                seen.add(shortcode)
+        return new_posts, skipped
+    
+    def record_import(self, post_data: Dict[str, Any], wordpress_id: int, title: str, status: str,
+                      import_method: str = 'manual') -> bool:
+        """Record an imported post and its Instagram -> WordPress mapping"""
+        if not post_data.get('shortcode'):
+            return False
+        self.add_instagram_post({**post_data, 'username': post_data.get('username') or 'unknown'})
+        self.add_wordpress_post(wordpress_id, title, status)
+        return self.create_mapping(post_data['shortcode'], wordpress_id, import_method)
+    
     def get_imported_posts(self, username: str = None) -> List[Dict[str, Any]]:
         """Get all imported posts, optionally filtered by username"""
         with sqlite3.connect(self.db_path) as conn:
@@ -281,38 +336,40 @@ class PostTracker:
             ''')
             
             mappings = cursor.fetchall()
+            if not mappings:
+                return {'removed_mappings': 0, 'updated_posts': 0}
+            
+            # Page through the mapped posts that still exist instead of one call per mapping
+            mapped_ids = sorted({wp_post_id for _, wp_post_id, _ in mappings})
+            existing_ids = set()
+            try:
+                for wp_post in mcp_client.iter_posts(post_status='any', include=mapped_ids):
+                    wp_post_id = int(wp_post.get('ID', 0))
+                    existing_ids.add(wp_post_id)
+                    cursor.execute('''
+                        UPDATE wordpress_posts 
+                        SET wordpress_title = ?, wordpress_status = ?, wordpress_permalink = ?, updated_at = CURRENT_TIMESTAMP
+                        WHERE wordpress_post_id = ?
+                    ''', (
+                        wp_post.get('post_title', ''),
+                        wp_post.get('post_status', ''),
+                        wp_post.get('permalink', ''),
+                        wp_post_id
+                    ))
+                    updated_posts += 1
+            except Exception as e:
+                # Without a complete listing (an error, or pagination that could not finish) we cannot
+                # tell deleted posts apart from unlisted ones: keep every mapping
+                logger.warning(f"Error fetching WordPress posts for sync, no mappings removed: {e}")
+                conn.commit()
+                return {'removed_mappings': 0, 'updated_posts': updated_posts}
             
             for mapping_id, wp_post_id, shortcode in mappings:
-                try:
-                    # Check if WordPress post still exists
-                    wp_posts = mcp_client.call_mcp_function('wp_get_posts', {
-                        'include': [wp_post_id],
-                        'post_status': 'any'
-                    })
-                    
-                    if not wp_posts or len(wp_posts) == 0:
-                        # Post was deleted, remove mapping
-                        cursor.execute('DELETE FROM post_mappings WHERE id = ?', (mapping_id,))
-                        removed_mappings += 1
-                        logger.info(f"Removed mapping for deleted WP post {wp_post_id} (Instagram: {shortcode})")
-                    else:
-                        # Post exists, update its info
-                        wp_post = wp_posts[0]
-                        cursor.execute('''
-                            UPDATE wordpress_posts 
-                            SET wordpress_title = ?, wordpress_status = ?, wordpress_permalink = ?, updated_at = CURRENT_TIMESTAMP
-                            WHERE wordpress_post_id = ?
-                        ''', (
-                            wp_post.get('post_title', ''),
-                            wp_post.get('post_status', ''),
-                            wp_post.get('permalink', ''),
-                            wp_post_id
-                        ))
-                        updated_posts += 1
-                        
-                except Exception as e:
-                    logger.warning(f"Error checking WordPress post {wp_post_id}: {e}")
-                    continue
+                if wp_post_id not in existing_ids:
+                    # Post was deleted, remove mapping
+                    cursor.execute('DELETE FROM post_mappings WHERE id = ?', (mapping_id,))
+                    removed_mappings += 1
+                    logger.info(f"Removed mapping for deleted WP post {wp_post_id} (Instagram: {shortcode})")
             
             conn.commit()
             
@@ -8,12 +8,16 @@ from typing import Optional, Dict, Any
 import requests
 import json
 
+from .media_index import get_media_index, rest_media_exists
+from .media_stream import stream_upload
+
 class WordPressMediaUploader:
-    def __init__(self, wordpress_url: str, username: str, password: str):
+    def __init__(self, wordpress_url: str, username: str, password: str, media_index=None):
         self.wordpress_url = wordpress_url.rstrip('/')
         self.username = username
         self.password = password
         self.auth_header = self._create_auth_header()
+        self.media_index = media_index or get_media_index()
     
     def _create_auth_header(self) -> str:
         """Create basic auth header for WordPress API"""
@@ -30,6 +34,9 @@ class WordPressMediaUploader:
         """
         Upload a cached image to WordPress media library
         
+        Images whose bytes were already uploaded to this site reuse the
+        existing attachment ('reused': True) instead of being uploaded again.
+        
         Args:
             cache_path: Path to cached image file
             filename: Custom filename (optional, uses cache filename if not provided)
@@ -55,16 +62,23 @@ class WordPressMediaUploader:
             if not mime_type:
                 mime_type = 'image/jpeg'
             
-            # Read image data
-            with open(cache_path, 'rb') as f:
-                image_data = f.read()
+            image_hash = self.media_index.hash_file(cache_path)
+            existing = self.media_index.find_existing(
+                image_hash, self.wordpress_url,
+                exists=lambda media_id: rest_media_exists(self.wordpress_url, media_id,
+                                                          {'Authorization': self.auth_header}))
+            if existing:
+                print(f"♻️ Reusing media {existing['media_id']} for {cache_path.name} (identical image)")
+                return {
+                    'success': True,
+                    'media_id': existing['media_id'],
+                    'url': existing['source_url'],
+                    'filename': existing['filename'] or filename,
+                    'mime_type': mime_type,
+                    'reused': True
+                }
             
-            # Prepare headers
-            headers = {
-                'Authorization': self.auth_header,
-                'Content-Type': mime_type,
-                'Content-Disposition': f'attachment; filename="{filename}"'
-            }
+            image_size = cache_path.stat().st_size
             
             # Upload to WordPress
             upload_url = f"{self.wordpress_url}/wp-json/wp/v2/media"
@@ -73,15 +87,18 @@ class WordPressMediaUploader:
             print(f"🔄 Uploading to: {upload_url}")
             print(f"🔄 Filename: {filename}")
             print(f"🔄 Content-Type: {mime_type}")
-            print(f"🔄 Image size: {len(image_data)} bytes")
+            print(f"🔄 Image size: {image_size} bytes")
             
-            response = requests.post(
+            # Stream the file from disk instead of reading it into memory
+            response = stream_upload(
+                requests,
                 upload_url,
-                headers=headers,
-                data=image_data,
+                cache_path,
+                filename,
+                mime_type,
+                headers={'Authorization': self.auth_header},
                 timeout=30
             )
-            
             print(f"🔄 Upload response status: {response.status_code}")
             if response.status_code != 201:
                 print(f"❌ Upload failed response: {response.text}")
@@ -91,6 +108,8 @@ class WordPressMediaUploader:
             if response.status_code == 201:
                 media_data = response.json()
                 media_id = media_data['id']
+                self.media_index.record(image_hash, self.wordpress_url, media_id, media_data.get('source_url'),
+                                        filename, image_size)
                 
                 # Update media metadata if provided
                 if alt_text or caption or description:
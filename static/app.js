@@ -908,6 +908,9 @@ async function handleComplexAction(action) {
             case 'apify_bulk_import':
                 await bulkImportInstagramUser(action.username, action.limit || 10);
                 break;
+            case 'import_plan':
+                await planInstagramImport(action.username, action.limit || 20);
+                break;
             case 'apify_scrape_urls':
                 await scrapeInstagramUrls(action.urls);
                 break;
@@ -1198,6 +1201,45 @@ async function importApifyPostsToWordPress(posts) {
     }
 }
 
+async function planInstagramImport(username, limit = 20) {
+    try {
+        addChatMessage('system', `🧮 Planning import of ${limit} posts from @${username}...`);
+        
+        const response = await apiCall('/api/instagram/import/plan', {
+            method: 'POST',
+            body: JSON.stringify({ 
+                username: username,
+                limit: limit 
+            })
+        });
+        
+        if (response.success) {
+            const plan = response.plan;
+            const minutes = Math.floor(plan.estimate.seconds / 60);
+            const seconds = plan.estimate.seconds % 60;
+            let message = `🧮 Import plan for @${username}`;
+            if (plan.source === 'estimate') {
+                message += ' (not scraped yet, assuming new single-image posts)';
+            }
+            message += `:\n`;
+            message += `• New posts: ${plan.posts.new} (${plan.posts.already_imported} already imported)\n`;
+            message += `• Media: ${plan.media.images} images, ${plan.media.videos} videos, ${plan.media.carousels} carousels\n`;
+            message += `• Already available: ${plan.media.in_local_cache} cached locally, ${plan.media.in_media_library} in the media library\n`;
+            message += `• Calls: ${plan.calls.mcp.total} MCP (${plan.calls.mcp.round_trips} round trips), ${plan.calls.rest.media_upload} REST uploads, ${plan.calls.cdn_downloads} CDN downloads\n`;
+            if (plan.apify) {
+                message += `• Apify: ${plan.apify.cached ? 'cached result, no charge' : '$' + plan.apify.estimated_cost_usd.toFixed(2)}\n`;
+            }
+            message += `• Estimated time: ${minutes ? minutes + 'm ' : ''}${seconds}s (bottleneck: ${plan.estimate.bottleneck})`;
+            
+            addChatMessage('system', message);
+        } else {
+            addChatMessage('system', `❌ Import planning failed: ${response.error}`);
+        }
+    } catch (error) {
+        addChatMessage('system', `❌ Import planning failed: ${error.message}`);
+    }
+}
+
 async function getInstagramProfile(username) {
     try {
         addChatMessage('system', `👤 Getting profile info for @${username}...`);
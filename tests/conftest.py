@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.fixtures.fake_aiwu_server import FakeAIWUServer
+
+
+@pytest.fixture
+def fake_aiwu():
+    """Fake AIWU MCP endpoint on a free local port, with no injected latency"""
+    with FakeAIWUServer(seed=1234) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_aiwu_client(fake_aiwu):
+    """WordPressMCPClient pointed at the fake AIWU endpoint"""
+    from src.integrations.wordpress.client import WordPressMCPClient
+
+    client = WordPressMCPClient(fake_aiwu.mcp_url, fake_aiwu.token)
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def fake_cdn(fake_aiwu, monkeypatch, tmp_path):
+    """Process-wide Instagram CDN client that warms up against the fake server instead of instagram.com"""
+    from src.utils import instagram_cdn
+
+    client = instagram_cdn.InstagramCDNClient(pool_size=4, warmup_url=fake_aiwu.base_url + '/',
+                                              cookie_path=str(tmp_path / 'instagram_cookies.txt'))
+    monkeypatch.setattr(instagram_cdn, '_shared_client', client)
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def fake_apify():
+    """Fake Apify API on a free local port; runs finish after 0.3s"""
+    from tests.fixtures.fake_apify_server import FakeApifyServer
+
+    with FakeApifyServer(run_seconds=0.3) as server:
+        yield server
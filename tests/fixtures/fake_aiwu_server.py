@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Fake AIWU MCP endpoint for offline tests and benchmarks
+
+Speaks the same tools/call JSON-RPC envelope as the AIWU plugin (tool output
+as text in result.content[0]) and keeps posts, meta, media, terms and
+comments in memory. Latency, jitter and error rate are configurable so
+client changes can be measured without a live WordPress site.
+
+Usage:
+    with FakeAIWUServer(latency=0.02, jitter=0.01) as server:
+        client = WordPressMCPClient(server.mcp_url, server.token)
+"""
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MCP_PATH = '/wp-json/mcp/v1/sse'
+MEDIA_REST_PATH = '/wp-json/wp/v2/media'
+
+class ToolError(Exception):
+    """Raised by tool handlers; becomes a JSON-RPC error object"""
+
+    def __init__(self, message, code=-32602):
+        super().__init__(message)
+        self.code = code
+
+class FakeWordPress:
+    """In-memory WordPress content and the AIWU tools that operate on it"""
+
+    def __init__(self, site_url):
+        self.site_url = site_url
+        self.posts = {}
+        self.meta = {}
+        self.media = {}
+        self.terms = {}
+        self.post_terms = {}
+        self.comments = {}
+        self.options = {'blogname': 'Fake AIWU Site', 'blogdescription': 'Offline benchmark site'}
+        self.terms_by_name = {}
+        self._next_id = 1
+        self.lock = threading.RLock()
+        self._insert_term('category', 'Uncategorized')
+
+    def _new_id(self):
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+
+    def call(self, name, args):
+        handler = getattr(self, 'tool_' + name, None)
+        if handler is None:
+            raise ToolError(f"Unknown tool: {name}", code=-32601)
+        with self.lock:
+            return handler(**args)
+
+    # Site
+
+    def tool_mcp_ping(self):
+        info = {'name': self.options['blogname'], 'url': self.site_url,
+                'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'version': '6.4.2'}
+        return 'Ping successful: ' + json.dumps(info)
+
+    def tool_wp_list_plugins(self, **_):
+        return [{'Name': 'AI Engine', 'Version': '2.1.0', 'active': True}]
+
+    def tool_wp_get_post_types(self, **_):
+        return [{'name': 'post', 'label': 'Posts'}, {'name': 'page', 'label': 'Pages'}]
+
+    def tool_wp_get_taxonomies(self, post_type=None):
+        return [{'name': 'category', 'label': 'Categories'}, {'name': 'post_tag', 'label': 'Tags'}]
+
+    def tool_wp_get_option(self, key):
+        return self.options.get(key)
+
+    def tool_wp_update_option(self, key, value):
+        self.options[key] = value
+        return f"Option {key} updated"
+
+    def tool_wp_get_users(self, limit=10, **_):
+        return [{'ID': 1, 'user_login': 'admin', 'display_name': 'Admin'}][:limit]
+
+    # Posts
+
+    def _post(self, post_id):
+        post = self.posts.get(int(post_id))
+        if post is None:
+            raise ToolError(f"Post {post_id} not found")
+        return post
+
+    def _summary(self, post):
+        return {key: post[key] for key in ('ID', 'post_title', 'post_status', 'post_type', 'post_date',
+                                           'post_excerpt', 'permalink')}
+
+    def tool_wp_get_posts(self, limit=20, offset=0, post_status=None, post_type='post', search=None,
+                          include=None, paged=None, **_):
+        posts = sorted(self.posts.values(), key=lambda p: p['ID'], reverse=True)
+        if include:
+            wanted = {int(i) for i in include}
+            posts = [p for p in posts if p['ID'] in wanted]
+        if post_status and post_status != 'any':
+            posts = [p for p in posts if p['post_status'] == post_status]
+        elif not post_status and not include:
+            posts = [p for p in posts if p['post_status'] == 'publish']
+        if post_type and post_type != 'any':
+            posts = [p for p in posts if p['post_type'] == post_type]
+        if search:
+            needle = search.lower()
+            posts = [p for p in posts if needle in p['post_title'].lower() or needle in p['post_content'].lower()]
+        if paged and not offset:
+            offset = (int(paged) - 1) * limit
+        return [self._summary(p) for p in posts[offset:offset + limit]]
+
+    def tool_wp_get_post(self, ID):
+        post = self._post(ID)
+        return dict(post, meta=dict(self.meta.get(post['ID'], {})))
+
+    def tool_wp_count_posts(self, post_type='post'):
+        counts = {}
+        for post in self.posts.values():
+            if post['post_type'] == post_type:
+                counts[post['post_status']] = counts.get(post['post_status'], 0) + 1
+        return counts
+
+    def tool_wp_create_post(self, post_title, post_content='', post_status='draft', post_type='post',
+                            post_excerpt='', meta_input=None, **_):
+        post_id = self._new_id()
+        slug = '-'.join(post_title.lower().split())[:60] or f'post-{post_id}'
+        self.posts[post_id] = {
+            'ID': post_id,
+            'post_title': post_title,
+            'post_content': post_content,
+            'post_excerpt': post_excerpt,
+            'post_status': post_status,
+            'post_type': post_type,
+            'post_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'permalink': f"{self.site_url}/{slug}/",
+            'featured_media': 0
+        }
+        self.meta[post_id] = dict(meta_input or {})
+        return f"Post created ID {post_id}"
+
+    def tool_wp_update_post(self, ID, fields=None):
+        post = self._post(ID)
+        for key, value in (fields or {}).items():
+            if key in post and key != 'ID':
+                post[key] = value
+        return f"Post {ID} updated"
+
+    def tool_wp_delete_post(self, ID, force=True):
+        self._post(ID)
+        if force:
+            del self.posts[int(ID)]
+            self.meta.pop(int(ID), None)
+            self.post_terms.pop(int(ID), None)
+        else:
+            self.posts[int(ID)]['post_status'] = 'trash'
+        return f"Post {ID} deleted"
+
+    def tool_wp_get_post_meta(self, ID, key=None):
+        self._post(ID)
+        meta = self.meta.get(int(ID), {})
+        return meta.get(key) if key else dict(meta)
+
+    def tool_wp_update_post_meta(self, ID, key=None, value=None, meta=None):
+        self._post(ID)
+        post_meta = self.meta.setdefault(int(ID), {})
+        if meta:
+            post_meta.update(meta)
+        if key:
+            post_meta[key] = value
+        return f"Meta updated for post {ID}"
+
+    def tool_wp_delete_post_meta(self, ID, key, value=None):
+        self.meta.get(int(ID), {}).pop(key, None)
+        return f"Meta {key} deleted for post {ID}"
+
+    def tool_wp_set_featured_image(self, post_id, media_id=None):
+        post = self._post(post_id)
+        if media_id and int(media_id) not in self.media:
+            raise ToolError(f"Media {media_id} not found")
+        post['featured_media'] = int(media_id or 0)
+        return f"Featured image set for post {post_id}"
+
+    # Media
+
+    def add_media(self, filename, size, title=None, source=None):
+        media_id = self._new_id()
+        self.media[media_id] = {
+            'ID': media_id,
+            'title': title or filename,
+            'filename': filename,
+            'filesize': size,
+            'source': source,
+            'url': f"{self.site_url}/wp-content/uploads/{filename}",
+            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'alt': '',
+            'caption': ''
+        }
+        return self.media[media_id]
+
+    def tool_wp_get_media(self, limit=20, offset=0, search=None, **_):
+        items = sorted(self.media.values(), key=lambda m: m['ID'], reverse=True)
+        if search:
+            items = [m for m in items if search.lower() in m['title'].lower()]
+        return items[offset:offset + limit]
+
+    def tool_wp_count_media(self, **_):
+        return {'total': len(self.media)}
+
+    def tool_wp_upload_media(self, url, title=None, alt=None):
+        filename = url.rstrip('/').rsplit('/', 1)[-1].split('?')[0] or 'upload.jpg'
+        item = self.add_media(filename, 0, title=title, source=url)
+        item['alt'] = alt or ''
+        return {'id': item['ID'], 'url': item['url']}
+
+    def tool_wp_update_media(self, ID, **fields):
+        item = self.media.get(int(ID))
+        if item is None:
+            raise ToolError(f"Media {ID} not found")
+        item.update({k: v for k, v in fields.items() if v is not None})
+        return f"Media {ID} updated"
+
+    def tool_wp_delete_media(self, ID, force=True):
+        if self.media.pop(int(ID), None) is None:
+            raise ToolError(f"Media {ID} not found")
+        return f"Media {ID} deleted"
+
+    # Terms
+
+    def _insert_term(self, taxonomy, name, description='', parent=0, slug=None):
+        term_id = self._new_id()
+        self.terms[term_id] = {'term_id': term_id, 'taxonomy': taxonomy, 'name': name,
+                               'slug': slug or name.lower().replace(' ', '-'),
+                               'description': description, 'parent': parent or 0}
+        self.terms_by_name[(taxonomy, name.lower())] = term_id
+        return self.terms[term_id]
+
+    def tool_wp_get_terms(self, taxonomy, limit=50, parent=None, search=None):
+        terms = [t for t in self.terms.values() if t['taxonomy'] == taxonomy]
+        if parent is not None:
+            terms = [t for t in terms if t['parent'] == int(parent)]
+        if search:
+            terms = [t for t in terms if search.lower() in t['name'].lower()]
+        return terms[:limit]
+
+    def tool_wp_count_terms(self, taxonomy):
+        return sum(1 for t in self.terms.values() if t['taxonomy'] == taxonomy)
+
+    def tool_wp_create_term(self, taxonomy, term_name, description=None, parent=None, slug=None):
+        if (taxonomy, term_name.lower()) in self.terms_by_name:
+            raise ToolError(f"Term {term_name} already exists")
+        term = self._insert_term(taxonomy, term_name, description or '', parent, slug)
+        return {'term_id': term['term_id']}
+
+    def tool_wp_update_term(self, term_id, taxonomy, **fields):
+        term = self.terms.get(int(term_id))
+        if term is None:
+            raise ToolError(f"Term {term_id} not found")
+        term.update({k: v for k, v in fields.items() if v is not None})
+        return f"Term {term_id} updated"
+
+    def tool_wp_delete_term(self, term_id, taxonomy):
+        term = self.terms.pop(int(term_id), None)
+        if term is None:
+            raise ToolError(f"Term {term_id} not found")
+        self.terms_by_name.pop((taxonomy, term['name'].lower()), None)
+        return f"Term {term_id} deleted"
+
+    def tool_wp_get_post_terms(self, ID, taxonomy=None):
+        term_ids = self.post_terms.get(int(ID), set())
+        terms = [self.terms[t] for t in sorted(term_ids) if t in self.terms]
+        return [t for t in terms if not taxonomy or t['taxonomy'] == taxonomy]
+
+    def tool_wp_add_post_terms(self, ID, terms, taxonomy='post_tag', append=True):
+        self._post(ID)
+        term_ids = set()
+        for term in terms:
+            if isinstance(term, int):
+                term_ids.add(term)
+            else:
+                existing = self.terms_by_name.get((taxonomy, str(term).lower()))
+                term_ids.add(existing or self._insert_term(taxonomy, str(term))['term_id'])
+        current = self.post_terms.setdefault(int(ID), set())
+        if not append:
+            current.clear()
+        current.update(term_ids)
+        return f"Terms added to post {ID}"
+
+    # Comments
+
+    def tool_wp_get_comments(self, limit=20, offset=0, post_id=None, status=None, search=None, paged=None):
+        comments = sorted(self.comments.values(), key=lambda c: c['comment_ID'], reverse=True)
+        if post_id:
+            comments = [c for c in comments if c['comment_post_ID'] == int(post_id)]
+        if status:
+            approved = {'approve': '1', 'hold': '0'}.get(status, status)
+            comments = [c for c in comments if c['comment_approved'] == approved]
+        if search:
+            comments = [c for c in comments if search.lower() in c['comment_content'].lower()]
+        if paged and not offset:
+            offset = (int(paged) - 1) * limit
+        return comments[offset:offset + limit]
+
+    def tool_wp_create_comment(self, post_id, comment_content, comment_author='Guest', comment_author_email='',
+                               comment_author_url='', comment_approved='1'):
+        self._post(post_id)
+        comment_id = self._new_id()
+        self.comments[comment_id] = {
+            'comment_ID': comment_id, 'comment_post_ID': int(post_id), 'comment_content': comment_content,
+            'comment_author': comment_author, 'comment_author_email': comment_author_email,
+            'comment_author_url': comment_author_url, 'comment_approved': str(comment_approved),
+            'comment_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        return {'comment_ID': comment_id}
+
+    def tool_wp_update_comment(self, comment_ID, fields=None):
+        comment = self.comments.get(int(comment_ID))
+        if comment is None:
+            raise ToolError(f"Comment {comment_ID} not found")
+        comment.update(fields or {})
+        return f"Comment {comment_ID} updated"
+
+    def tool_wp_delete_comment(self, comment_ID, force=False):
+        if self.comments.pop(int(comment_ID), None) is None:
+            raise ToolError(f"Comment {comment_ID} not found")
+        return f"Comment {comment_ID} deleted"
+
+class FakeAIWUServer:
+    """
+    Threaded HTTP server exposing a FakeWordPress over the AIWU MCP protocol
+
+    Args:
+        latency: Seconds added to every HTTP request
+        jitter: Random +/- seconds added on top of latency
+        error_rate: Fraction of HTTP requests answered with 503
+        accept_batches: Answer JSON-RPC batch arrays (otherwise HTTP 400)
+        image_bytes: Size of the images served under /images/
+        video_bytes: Size of the videos served under /videos/ (Range requests supported)
+        seed: Random seed for jitter and errors
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, accept_batches=True, image_bytes=200_000,
+                 video_bytes=1_000_000, token='fake-token', seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.accept_batches = accept_batches
+        self.image_bytes = image_bytes
+        self.video_bytes = video_bytes
+        self.token = token
+        self.random = random.Random(seed)
+        self.stats = {'http_requests': 0, 'batches': 0, 'tool_calls': {}, 'errors_injected': 0,
+                      'rest_uploads': 0, 'rest_media_lookups': 0, 'image_downloads': 0, 'video_requests': 0,
+                      'page_views': 0, 'peak_cdn_downloads': 0}
+        self._stats_lock = threading.Lock()
+        self._cdn_downloads = 0
+        self._server = None
+        self._thread = None
+        self.wordpress = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def mcp_url(self):
+        return self.base_url + MCP_PATH
+
+    def image_url(self, name):
+        """URL of a fake image the server serves with image_bytes of data"""
+        return f"{self.base_url}/images/{name}.jpg"
+
+    def video_url(self, name):
+        """URL of a fake video the server serves with video_bytes of data"""
+        return f"{self.base_url}/videos/{name}.mp4"
+
+    def video_data(self, name):
+        """The bytes served for video_url(name)"""
+        pattern = f'/videos/{name}.mp4'.encode() * 64
+        return (pattern * (self.video_bytes // len(pattern) + 1))[:self.video_bytes]
+
+    def start(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self.wordpress = FakeWordPress(self.base_url)
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name='fake-aiwu', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats.update({'http_requests': 0, 'batches': 0, 'tool_calls': {}, 'errors_injected': 0,
+                               'rest_uploads': 0, 'rest_media_lookups': 0, 'image_downloads': 0, 'video_requests': 0,
+                               'page_views': 0, 'peak_cdn_downloads': 0})
+
+    def tool_call_count(self, name=None):
+        with self._stats_lock:
+            if name:
+                return self.stats['tool_calls'].get(name, 0)
+            return sum(self.stats['tool_calls'].values())
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _count(self, key, tool=None):
+        with self._stats_lock:
+            if tool:
+                self.stats['tool_calls'][tool] = self.stats['tool_calls'].get(tool, 0) + 1
+            else:
+                self.stats[key] += 1
+
+    def _cdn_download(self, started):
+        """Track how many image/video downloads are being served at once"""
+        with self._stats_lock:
+            self._cdn_downloads += 1 if started else -1
+            self.stats['peak_cdn_downloads'] = max(self.stats['peak_cdn_downloads'], self._cdn_downloads)
+
+    def _delay(self):
+        delay = self.latency
+        if self.jitter:
+            delay += self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _inject_error(self):
+        return self.error_rate and self.random.random() < self.error_rate
+
+    def answer(self, request):
+        """Answer one JSON-RPC request object"""
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if request.get('method') != 'tools/call':
+                raise ToolError(f"Unsupported method: {request.get('method')}", code=-32601)
+            name = request['params']['name']
+            self._count(None, tool=name)
+            output = self.wordpress.call(name, request['params'].get('arguments') or {})
+        except ToolError as e:
+            return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': str(e)}}
+        except TypeError as e:
+            return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': -32602, 'message': f"Invalid params: {e}"}}
+
+        text = output if isinstance(output, str) else json.dumps(output)
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': {'content': [{'type': 'text', 'text': text}]}}
+
+def _make_handler(server):
+    """Build the request handler bound to a FakeAIWUServer"""
+
+    class FakeAIWUHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out in separate writes; don't let Nagle hold the body back
+        disable_nagle_algorithm = True
+
+        def _send(self, status, body, content_type='application/json', headers=None):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_body(self):
+            return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        def _drain_body(self):
+            """Read the request body in chunks, returning its size"""
+            remaining = int(self.headers.get('Content-Length', 0))
+            while remaining > 0:
+                chunk = self.rfile.read(min(remaining, 64 * 1024))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+            return int(self.headers.get('Content-Length', 0)) - remaining
+
+        def do_GET(self):
+            server._count('http_requests')
+            path = urlparse(self.path).path
+            if path.startswith(('/images/', '/videos/')):
+                server._cdn_download(True)
+                try:
+                    server._delay()
+                    return self._send_cdn_file(path)
+                finally:
+                    server._cdn_download(False)
+            server._delay()
+            if path.startswith(MEDIA_REST_PATH + '/'):
+                server._count('rest_media_lookups')
+                media_id = path.rsplit('/', 1)[1]
+                with server.wordpress.lock:
+                    item = server.wordpress.media.get(int(media_id)) if media_id.isdigit() else None
+                if not item:
+                    return self._send(404, {'code': 'rest_post_invalid_id', 'message': 'Invalid post ID.'})
+                return self._send(200, {'id': item['ID'], 'source_url': item['url']})
+            # The homepage hands out a cookie, like instagram.com does for CDN warm-ups
+            server._count('page_views')
+            self._send(200, b'<html><body>Fake AIWU site</body></html>', content_type='text/html',
+                       headers={'Set-Cookie': 'csrftoken=fake-token; Path=/; Max-Age=31536000'})
+
+        def _send_cdn_file(self, path):
+            """Fake Instagram CDN: images are sent whole, videos honour a single Range"""
+            if path.startswith('/images/'):
+                server._count('image_downloads')
+                data = (b'\xff\xd8\xff\xe0' + path.encode() * 64)[:server.image_bytes]
+                data += b'\0' * (server.image_bytes - len(data))
+                return self._send(200, data, content_type='image/jpeg')
+
+            server._count('video_requests')
+            data = server.video_data(path[len('/videos/'):].rsplit('.', 1)[0])
+            match = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range', ''))
+            if not match:
+                return self._send(200, data, content_type='video/mp4')
+            start = int(match.group(1))
+            end = min(int(match.group(2) or len(data) - 1), len(data) - 1)
+            if start >= len(data):
+                return self._send(416, b'', content_type='video/mp4', headers={'Content-Range': f'bytes */{len(data)}'})
+            return self._send(206, data[start:end + 1], content_type='video/mp4',
+                              headers={'Content-Range': f'bytes {start}-{end}/{len(data)}'})
+
+        def do_POST(self):
+            server._count('http_requests')
+            url = urlparse(self.path)
+            raw_upload = url.path == MEDIA_REST_PATH and not self.headers.get('Content-Type', '').startswith('multipart/')
+            # Raw uploads are consumed in chunks, like PHP spooling php://input to disk
+            body = self._drain_body() if raw_upload else self._read_body()
+            server._delay()
+
+            if server._inject_error():
+                server._count('errors_injected')
+                return self._send(503, {'error': 'Service Unavailable'})
+
+            if url.path == MEDIA_REST_PATH:
+                return self._upload_media(body)
+            if url.path != MCP_PATH:
+                return self._send(404, {'error': 'Not found'})
+            if server.token and parse_qs(url.query).get('token', [None])[0] != server.token:
+                return self._send(401, {'error': 'Invalid token'})
+
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                return self._send(400, {'jsonrpc': '2.0', 'id': None,
+                                        'error': {'code': -32700, 'message': 'Parse error'}})
+
+            if isinstance(payload, list):
+                if not server.accept_batches:
+                    return self._send(400, {'jsonrpc': '2.0', 'id': None,
+                                            'error': {'code': -32600, 'message': 'Invalid Request'}})
+                server._count('batches')
+                return self._send(200, [server.answer(item) for item in payload])
+            self._send(200, server.answer(payload))
+
+        def _upload_media(self, body):
+            """REST media upload: multipart 'file' field or a raw body (already drained to its size) with Content-Disposition"""
+            server._count('rest_uploads')
+            filename = 'upload.jpg'
+            size = body if isinstance(body, int) else len(body)
+            content_type = self.headers.get('Content-Type', '')
+            if content_type.startswith('multipart/form-data'):
+                message = BytesParser(policy=policy.HTTP).parsebytes(b'Content-Type: ' + content_type.encode() + b'\r\n\r\n' + body)
+                for part in message.iter_parts():
+                    if part.get_param('name', header='content-disposition') == 'file':
+                        filename = part.get_filename() or filename
+                        size = len(part.get_payload(decode=True) or b'')
+            elif 'filename=' in self.headers.get('Content-Disposition', ''):
+                filename = self.headers['Content-Disposition'].split('filename=', 1)[1].strip('"')
+
+            with server.wordpress.lock:
+                item = server.wordpress.add_media(filename, size)
+            self._send(201, {'id': item['ID'], 'source_url': item['url'], 'media_details': {'filesize': size}})
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeAIWUHandler
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run the fake AIWU MCP endpoint')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    with FakeAIWUServer(args.latency_ms / 1000, args.jitter_ms / 1000, args.error_rate) as fake:
+        print(f"🧪 Fake AIWU endpoint: {fake.mcp_url}?token={fake.token}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Fake Apify API for offline tests and benchmarks
+
+Serves the endpoints the Instagram scraper and image downloader use:
+starting an actor run, the run status (honouring waitForFinish like
+api.apify.com, unless told not to) and the run's dataset items with
+offset/limit paging. Each run finishes run_seconds after it starts and,
+like a real actor, writes its dataset items steadily while RUNNING, so a
+dataset read mid-run sees only the items produced so far.
+
+Usage:
+    with FakeApifyServer(run_seconds=0.5, items=[...]) as apify:
+        scraper = ApifyInstagramScraper('token')
+        scraper.base_url = apify.base_url
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeApifyServer:
+    """
+    Threaded HTTP server standing in for api.apify.com/v2
+
+    Args:
+        run_seconds: Seconds every actor run takes to finish
+        items: Dataset items every run produces, spread evenly over run_seconds
+        final_status: Status runs end in (SUCCEEDED, FAILED, ...)
+        honour_wait: Hold status requests for waitForFinish (otherwise answer at once)
+    """
+
+    def __init__(self, run_seconds=0.5, items=None, final_status='SUCCEEDED', honour_wait=True):
+        self.run_seconds = run_seconds
+        self.items = items or []
+        self.final_status = final_status
+        self.honour_wait = honour_wait
+        self.runs = {}
+        self.stats = {'runs_started': 0, 'status_requests': 0, 'dataset_requests': 0}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/v2"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name='fake-apify', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def start_run(self, actor_id, actor_input):
+        run_id = uuid.uuid4().hex[:17]
+        with self._lock:
+            self.stats['runs_started'] += 1
+            self.runs[run_id] = {'actor_id': actor_id, 'input': actor_input, 'started': time.monotonic(),
+                                 'items': list(self.items)}
+        return self.run_data(run_id)
+
+    def run_data(self, run_id):
+        run = self.runs[run_id]
+        finished = time.monotonic() - run['started'] >= self.run_seconds
+        return {'id': run_id, 'actId': run['actor_id'], 'status': self.final_status if finished else 'RUNNING',
+                'statusMessage': None if finished else 'Scraping'}
+
+    def dataset_items(self, run_id):
+        """Items the run has written so far"""
+        run = self.runs[run_id]
+        elapsed = time.monotonic() - run['started']
+        if elapsed >= self.run_seconds:
+            return run['items']
+        return run['items'][:int(len(run['items']) * elapsed / self.run_seconds)]
+
+    def wait_for_finish(self, run_id, seconds):
+        """Block a status request until the run ends or seconds pass, like waitForFinish"""
+        remaining = self.runs[run_id]['started'] + self.run_seconds - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(remaining, seconds))
+
+
+def _make_handler(server):
+    """Build the request handler bound to a FakeApifyServer"""
+
+    class FakeApifyHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body):
+            body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            parts = url.path.strip('/').split('/')
+            # /v2/acts/<actor_id>/runs
+            if len(parts) == 4 and parts[1] == 'acts' and parts[3] == 'runs':
+                return self._send(201, {'data': server.start_run(parts[2], json.loads(body or b'{}'))})
+            self._send(404, {'error': {'type': 'page-not-found'}})
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            parts = url.path.strip('/').split('/')
+            if len(parts) < 3 or parts[1] != 'actor-runs' or parts[2] not in server.runs:
+                return self._send(404, {'error': {'type': 'record-not-found'}})
+            run_id = parts[2]
+
+            # /v2/actor-runs/<run_id>[?waitForFinish=N]
+            if len(parts) == 3:
+                server._count('status_requests')
+                wait = int(query.get('waitForFinish', ['0'])[0])
+                if server.honour_wait and wait:
+                    server.wait_for_finish(run_id, min(wait, 60))
+                return self._send(200, {'data': server.run_data(run_id)})
+
+            # /v2/actor-runs/<run_id>/dataset/items[?offset=&limit=]
+            if parts[3:] == ['dataset', 'items']:
+                server._count('dataset_requests')
+                items = server.dataset_items(run_id)
+                offset = int(query.get('offset', ['0'])[0])
+                limit = int(query['limit'][0]) if 'limit' in query else len(items)
+                return self._send(200, items[offset:offset + limit])
+
+            self._send(404, {'error': {'type': 'page-not-found'}})
+
+    return FakeApifyHandler
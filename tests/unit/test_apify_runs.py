@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test waiting for and streaming Apify actor runs against the fake Apify API
+"""
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.instagram.apify_scraper import ApifyInstagramScraper
+from src.utils.apify_image_downloader import ApifyImageDownloader
+from src.utils.apify_runs import apify_metrics, iter_run_items
+
+
+def apify_items(count):
+    return [{'type': 'Image', 'shortCode': f'SC{i}', 'displayUrl': f'https://cdn.example/{i}.jpg',
+             'caption': f'Caption {i}'} for i in range(count)]
+
+
+def make_scraper(fake_apify):
+    scraper = ApifyInstagramScraper('token')
+    scraper.base_url = fake_apify.base_url
+    return scraper
+
+
+def test_long_poll_returns_as_soon_as_the_run_finishes(fake_apify):
+    fake_apify.items = apify_items(3)
+    apify_metrics.reset()
+
+    start = time.perf_counter()
+    posts = make_scraper(fake_apify).scrape_user_posts('example_user', limit=3)
+    elapsed = time.perf_counter() - start
+
+    assert [post['shortcode'] for post in posts] == ['SC0', 'SC1', 'SC2']
+    # The old loop slept 10s after the first RUNNING answer
+    assert elapsed < 1.5
+    assert fake_apify.stats['status_requests'] == 1
+    recorded = apify_metrics.snapshot()['tools']['instagram_scraper']
+    assert recorded['calls'] == 1 and recorded['errors'] == 0
+    assert 250 <= recorded['latency_ms']['mean'] < 1500
+
+
+def test_backs_off_when_the_server_does_not_hold_requests(fake_apify):
+    fake_apify.honour_wait = False
+    fake_apify.run_seconds = 0.5
+    fake_apify.items = apify_items(1)
+
+    start = time.perf_counter()
+    results = make_scraper(fake_apify)._wait_for_completion(fake_apify.start_run('actor', {})['id'])
+
+    assert len(results) == 1
+    assert time.perf_counter() - start < 2
+    # 0.25s, 0.5s, 1s... between requests rather than a tight loop
+    assert 2 <= fake_apify.stats['status_requests'] <= 4
+
+
+def test_failed_run_raises_and_is_recorded(fake_apify):
+    fake_apify.final_status = 'FAILED'
+    apify_metrics.reset()
+    downloader = ApifyImageDownloader('token')
+    downloader.base_url = fake_apify.base_url
+
+    with pytest.raises(Exception, match='Actor run failed'):
+        downloader._wait_for_completion(fake_apify.start_run('actor', {})['id'])
+
+    assert apify_metrics.snapshot()['tools']['image_downloader']['errors'] == 1
+
+
+def test_image_downloader_shares_the_long_poll(fake_apify):
+    fake_apify.items = [{'url': 'https://www.instagram.com/p/SC0/'}]
+    downloader = ApifyImageDownloader('token')
+    downloader.base_url = fake_apify.base_url
+
+    results = downloader._wait_for_completion(fake_apify.start_run('actor', {})['id'])
+
+    assert results == fake_apify.items
+    assert fake_apify.stats['status_requests'] == 1
+
+
+def test_iter_user_posts_pages_through_the_dataset(fake_apify):
+    fake_apify.items = apify_items(5)
+    scraper = make_scraper(fake_apify)
+    scraper.DATASET_PAGE_SIZE = 2
+
+    posts = list(scraper.iter_user_posts('example_user', limit=5))
+
+    assert [post['shortcode'] for post in posts] == [f'SC{i}' for i in range(5)]
+    # Full pages are followed up at once, short ones after a status check
+    assert fake_apify.stats['dataset_requests'] >= 3
+
+
+def test_iter_user_posts_yields_before_the_run_finishes(fake_apify):
+    fake_apify.run_seconds = 2
+    fake_apify.items = apify_items(10)
+    apify_metrics.reset()
+
+    start = time.perf_counter()
+    posts = make_scraper(fake_apify).iter_user_posts('example_user', limit=10)
+    first = next(posts)
+    first_after = time.perf_counter() - start
+    rest = list(posts)
+
+    assert [post['shortcode'] for post in [first] + rest] == [f'SC{i}' for i in range(10)]
+    assert first_after < 1.5
+    recorded = apify_metrics.snapshot()['tools']
+    assert recorded['instagram_scraper_first_item']['latency_ms']['mean'] < 1500
+    assert recorded['instagram_scraper']['calls'] == 1 and recorded['instagram_scraper']['errors'] == 0
+
+
+def test_failed_run_raises_after_yielding_the_items_it_wrote(fake_apify):
+    fake_apify.final_status = 'FAILED'
+    fake_apify.items = apify_items(4)
+    posts = []
+
+    with pytest.raises(Exception, match='Actor run failed'):
+        for post in make_scraper(fake_apify).iter_user_posts('example_user', limit=4):
+            posts.append(post['shortcode'])
+
+    assert posts == [f'SC{i}' for i in range(4)]
+
+
+def test_slow_consumer_does_not_time_out_a_finished_run(fake_apify):
+    fake_apify.run_seconds = 3
+    fake_apify.items = apify_items(60)
+    scraper = make_scraper(fake_apify)
+    run_id = fake_apify.start_run('actor', {})['id']
+    items = []
+
+    # Importing the items read while the run is going outlasts a 2s timeout for waiting on Apify
+    for item in iter_run_items(scraper.session, fake_apify.base_url, run_id, timeout=2):
+        time.sleep(0.1)
+        items.append(item['shortCode'])
+
+    assert items == [f'SC{i}' for i in range(60)]
+
+
+def test_streamed_import_starts_while_the_scrape_is_running(fake_apify, fake_aiwu, fake_aiwu_client, fake_cdn,
+                                                            monkeypatch, tmp_path):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    monkeypatch.chdir(tmp_path)
+    fake_apify.run_seconds = 2
+    fake_apify.items = [{**item, 'displayUrl': fake_aiwu.image_url(f"post_{item['shortCode']}")}
+                        for item in apify_items(6)]
+
+    manager = ApifyInstagramManager('token', fake_aiwu_client)
+    manager.scraper.scraper.base_url = fake_apify.base_url
+    imported_at = []
+    start = time.perf_counter()
+
+    result = manager.import_user_posts_to_wordpress(
+        'example_user', limit=6,
+        on_result=lambda outcome, record: imported_at.append(time.perf_counter() - start)
+        if outcome == 'imported' else None)
+
+    assert result['imported_count'] == 6 and result['failed_count'] == 0
+    # WordPress writes overlapped the scrape instead of waiting for it
+    assert imported_at[0] < fake_apify.run_seconds
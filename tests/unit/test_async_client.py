@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test AsyncWordPressMCPClient concurrency and the MCPFanout sync facade
+"""
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.async_client import AsyncWordPressMCPClient, MCPFanout
+from src.integrations.wordpress.concurrency import AIMDLimiter
+
+
+def make_transport(stats, delay=0.02):
+    """Mock AIWU endpoint that tracks how many requests are in flight"""
+
+    async def handler(request):
+        payload = json.loads(request.content)
+        stats['in_flight'] += 1
+        stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        await asyncio.sleep(delay)
+        stats['in_flight'] -= 1
+        text = json.dumps({'tool': payload['params']['name'], 'arguments': payload['params']['arguments']})
+        return httpx.Response(200, json={
+            'jsonrpc': '2.0',
+            'id': payload['id'],
+            'result': {'content': [{'type': 'text', 'text': text}]}
+        })
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(stats, max_concurrency=3):
+    return AsyncWordPressMCPClient('http://wordpress.test/wp-json/mcp/v1/sse', 'token',
+                                   max_concurrency=max_concurrency, transport=make_transport(stats))
+
+
+def test_call_many_is_bounded_by_semaphore():
+    stats = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def run():
+        async with make_client(stats, max_concurrency=3) as client:
+            return await client.call_many([('wp_get_post', {'ID': i}) for i in range(10)])
+
+    results = asyncio.run(run())
+    assert [r['arguments']['ID'] for r in results] == list(range(10))
+    assert stats['max_in_flight'] == 3
+
+
+def test_tool_methods_return_awaitables():
+    stats = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def run():
+        async with make_client(stats) as client:
+            return await client.get_posts(limit=5, post_status='draft')
+
+    result = asyncio.run(run())
+    assert result == {'tool': 'wp_get_posts', 'arguments': {'limit': 5, 'post_status': 'draft'}}
+
+
+def test_fanout_from_sync_code():
+    stats = {'in_flight': 0, 'max_in_flight': 0}
+    fanout = MCPFanout(make_client(stats, max_concurrency=4))
+    try:
+        results = fanout.gather([('wp_count_posts', {}), ('wp_list_plugins', {}), ('wp_get_post_types', {})])
+        assert [r['tool'] for r in results] == ['wp_count_posts', 'wp_list_plugins', 'wp_get_post_types']
+        assert fanout.call('mcp_ping')['tool'] == 'mcp_ping'
+    finally:
+        fanout.close()
+
+
+def test_cancelled_call_hands_its_limiter_slot_back():
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+    client = AsyncWordPressMCPClient('http://wordpress.test/wp-json/mcp/v1/sse', 'token', limiter=limiter,
+                                     transport=make_transport({'in_flight': 0, 'max_in_flight': 0}))
+    held = limiter.acquire()
+
+    async def run():
+        call = asyncio.create_task(client.call_mcp_function('wp_get_posts'))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        try:
+            await call
+        except asyncio.CancelledError:
+            pass
+        # The worker thread only gets the slot now, after the caller is gone
+        limiter.release(held, latency=0.0)
+        for _ in range(100):
+            if limiter.get_stats()['in_flight'] == 0 and limiter.get_stats()['acquired'] == 2:
+                break
+            await asyncio.sleep(0.01)
+        await client.aclose()
+
+    asyncio.run(run())
+
+    stats = limiter.get_stats()
+    assert (stats['in_flight'], stats['acquired'], stats['limit']) == (0, 2, 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the WordPress circuit breaker
+"""
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress import circuit_breaker
+from src.integrations.wordpress.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+from tests.unit.test_mcp_batch import FakeSession, make_client
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_failures_and_fails_fast(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', clock)
+
+    session = FakeSession()
+    client = make_client(session)
+    client.cache = None
+    client.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+    attempts = []
+
+    def refuse(url, data=None, timeout=None):
+        attempts.append(url)
+        raise requests.exceptions.ConnectionError("refused")
+    session.post = refuse
+
+    for _ in range(3):
+        try:
+            client.call_mcp_function('wp_get_post', {'ID': 1})
+        except Exception as e:
+            assert 'Connection failed' in str(e)
+    assert client.breaker.state == OPEN
+    assert len(attempts) == 3
+
+    try:
+        client.call_mcp_function('wp_get_post', {'ID': 1})
+    except CircuitOpenError as e:
+        assert 'retrying in 10s' in str(e)
+    else:
+        raise AssertionError("calls should fail fast while the circuit is open")
+    assert len(attempts) == 3
+    assert client.breaker.get_state()['rejected'] == 1
+    assert client.limiter.in_flight == 0
+
+
+def test_half_open_probe_closes_or_reopens(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    try:
+        breaker.before_call()
+    except CircuitOpenError:
+        pass
+    else:
+        raise AssertionError("a second call should not go out while the probe is in flight")
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.get_state()['retry_in'] == 10.0
+
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.get_state()['state'] == CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_abandoned_probe_frees_the_slot(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+
+    breaker.record_failure()
+    clock.now += 5
+    breaker.before_call()
+    breaker.abandon()
+    breaker.before_call()
+    assert breaker.get_state()['probes'] == 2
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the AIMD concurrency limiter
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.concurrency import AIMDLimiter, OVERLOAD
+from tests.unit.test_mcp_batch import FakeResponse, FakeSession, make_client
+
+
+def test_additive_increase_after_healthy_window():
+    limiter = AIMDLimiter(initial_limit=2, max_limit=3)
+
+    for _ in range(2):
+        limiter.release(limiter.acquire(), latency=0.1)
+    assert limiter.limit == 3
+
+    for _ in range(10):
+        limiter.release(limiter.acquire(), latency=0.1)
+    assert limiter.limit == 3
+
+
+def test_multiplicative_decrease_once_per_window():
+    limiter = AIMDLimiter(initial_limit=8, max_limit=8)
+    tokens = [limiter.acquire() for _ in range(4)]
+
+    for token in tokens:
+        limiter.release(token, OVERLOAD)
+    # The four failures started before the first cut, so only one cut happens
+    assert limiter.limit == 4
+
+    limiter.release(limiter.acquire(), latency=5.0)
+    assert limiter.limit == 2
+
+    stats = limiter.get_stats()
+    assert stats['overloads'] == 4
+    assert [entry['to'] for entry in stats['history']] == [4, 2]
+
+
+def test_acquire_blocks_at_the_limit():
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+    token = limiter.acquire()
+    acquired = threading.Event()
+
+    def waiter():
+        limiter.release(limiter.acquire(), latency=0.0)
+        acquired.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+
+    limiter.release(token, latency=0.0)
+    assert acquired.wait(1)
+    thread.join()
+
+    try:
+        limiter.acquire()
+        limiter.acquire(timeout=0.01)
+    except Exception as e:
+        assert 'Timed out waiting' in str(e)
+    else:
+        raise AssertionError("acquire should time out while the only slot is taken")
+
+
+def test_client_backs_off_on_server_errors():
+    session = FakeSession()
+    client = make_client(session)
+    client.cache = None
+    client.limiter = AIMDLimiter(initial_limit=4, max_limit=8)
+    session.post = lambda url, data=None, timeout=None: FakeResponse(503, {'error': 'Service Unavailable'})
+
+    try:
+        client.call_mcp_function('wp_get_post', {'n': 1})
+    except Exception as e:
+        assert 'HTTP 503' in str(e)
+
+    assert client.limiter.limit == 2
+    assert client.limiter.in_flight == 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the MCP client end to end against the fake AIWU endpoint
+"""
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.post_tracker import PostTracker
+
+
+def test_post_lifecycle(fake_aiwu, fake_aiwu_client):
+    client = fake_aiwu_client
+    assert client.ping()['name'] == 'Fake AIWU Site'
+
+    media = client.upload_media('https://cdn.example.com/photo.jpg', title='Photo')
+    created = client.create_post_full('Hello', 'Body', status='publish',
+                                      meta={'instagram_shortcode': 'ABC'}, featured_media_id=media['id'])
+    post_id = created['post_id']
+
+    post = client.get_post(post_id)
+    assert post['post_title'] == 'Hello'
+    assert post['meta'] == {'instagram_shortcode': 'ABC'}
+    assert post['featured_media'] == media['id']
+
+    client.add_post_terms(post_id, ['travel', 'sunset'])
+    assert {t['name'] for t in client.get_post_terms(post_id)} == {'travel', 'sunset'}
+
+    client.create_comment(post_id, 'Nice!')
+    assert [c['comment_content'] for c in client.iter_comments(post_id=post_id)] == ['Nice!']
+
+    assert fake_aiwu.tool_call_count('wp_create_post') == 1
+
+
+def test_listing_and_tracker_sync(fake_aiwu, fake_aiwu_client, tmp_path):
+    client = fake_aiwu_client
+    ids = [client.create_post_full(f'Post {i}', 'Body', status='publish')['post_id'] for i in range(12)]
+
+    assert [p['ID'] for p in client.iter_posts(page_size=5)] == sorted(ids, reverse=True)
+
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    for post_id in ids[:3]:
+        tracker.add_instagram_post({'shortcode': f'SC{post_id}', 'username': 'example_user'})
+        tracker.add_wordpress_post(post_id, 'Old title', 'draft')
+        tracker.create_mapping(f'SC{post_id}', post_id)
+    client.delete_post(ids[0])
+
+    assert tracker.sync_with_wordpress(client) == {'removed_mappings': 1, 'updated_posts': 2}
+
+
+def test_rest_media_upload_and_images(fake_aiwu):
+    image = requests.get(fake_aiwu.image_url('photo'), timeout=5)
+    assert len(image.content) == fake_aiwu.image_bytes
+
+    response = requests.post(fake_aiwu.base_url + '/wp-json/wp/v2/media',
+                             files={'file': ('photo.jpg', image.content, 'image/jpeg')}, timeout=5)
+    assert response.status_code == 201
+    assert response.json()['media_details']['filesize'] == fake_aiwu.image_bytes
+    assert fake_aiwu.wordpress.media[response.json()['id']]['filename'] == 'photo.jpg'
+
+
+def test_injected_errors(fake_aiwu, fake_aiwu_client):
+    fake_aiwu.error_rate = 1.0
+    try:
+        fake_aiwu_client.call_mcp_function('wp_get_posts', {'limit': 1}, use_cache=False)
+    except Exception as e:
+        assert 'HTTP 503' in str(e)
+    else:
+        raise AssertionError("an injected 503 should surface as an error")
+    assert fake_aiwu.stats['errors_injected'] == 1
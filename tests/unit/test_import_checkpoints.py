@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test per-post import checkpoints and resuming import jobs
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.import_checkpoints import ImportCheckpoints
+from src.utils.job_queue import JobQueue, COMPLETE, FAILED, QUEUED
+
+
+def make_manager(fake_aiwu, client, monkeypatch, tmp_path, posts):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    monkeypatch.chdir(tmp_path)
+    checkpoints = ImportCheckpoints(str(tmp_path / 'jobs.db'))
+    manager = ApifyInstagramManager('token', client, checkpoints=checkpoints)
+    scrapes = []
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts',
+                        lambda username, limit: scrapes.append(username) or posts)
+    return manager, checkpoints, scrapes
+
+
+def sample_posts(fake_aiwu, count):
+    return [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}',
+             'image_url': fake_aiwu.image_url(f'post_{i}'), 'raw_data': {'big': 'x' * 100}} for i in range(count)]
+
+
+def test_resume_finishes_failed_posts_without_duplicates(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    posts = sample_posts(fake_aiwu, 5)
+    manager, checkpoints, scrapes = make_manager(fake_aiwu, fake_aiwu_client, monkeypatch, tmp_path, posts)
+
+    create = fake_aiwu_client.create_post_with_meta
+    def flaky_create(title, content, **kwargs):
+        if kwargs['meta']['instagram_shortcode'] == 'SC3':
+            raise Exception("Request timed out")
+        return create(title, content, **kwargs)
+    monkeypatch.setattr(fake_aiwu_client, 'create_post_with_meta', flaky_create)
+
+    first = manager.import_user_posts_to_wordpress('example_user', limit=5, job_id='job-1')
+    assert first['imported_count'] == 4
+    assert first['failed_posts'][0]['shortcode'] == 'SC3'
+    assert checkpoints.summary('job-1') == {'posts': 5, 'image_fetched': 5, 'media_uploaded': 5,
+                                            'created': 4, 'done': 4}
+    assert 'raw_data' not in checkpoints.load('job-1')[0]['post']
+
+    monkeypatch.setattr(fake_aiwu_client, 'create_post_with_meta', create)
+    second = manager.import_user_posts_to_wordpress('example_user', limit=5, job_id='job-1')
+
+    assert second['resumed'] and second['imported_count'] == 5
+    assert [p['shortcode'] for p in second['imported_posts']] == [f'SC{i}' for i in range(5)]
+    assert [p['mcp_calls'] for p in second['imported_posts']] == [0, 0, 0, 3, 0]
+    assert scrapes == ['example_user']
+    assert fake_aiwu.tool_call_count('wp_create_post') == 5
+    assert len(fake_aiwu.wordpress.media) == 5
+    assert checkpoints.summary('job-1')['done'] == 5
+
+
+def test_create_without_a_post_id_fails_and_is_retried(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch,
+                                                         tmp_path):
+    posts = sample_posts(fake_aiwu, 3)
+    manager, checkpoints, _ = make_manager(fake_aiwu, fake_aiwu_client, monkeypatch, tmp_path, posts)
+
+    create = fake_aiwu_client.create_post_with_meta
+    def create_without_id(title, content, **kwargs):
+        if kwargs['meta']['instagram_shortcode'] == 'SC1':
+            return {'post_id': None, 'wordpress_post': {'message': 'Post created'}}
+        return create(title, content, **kwargs)
+    monkeypatch.setattr(fake_aiwu_client, 'create_post_with_meta', create_without_id)
+
+    first = manager.import_user_posts_to_wordpress('example_user', limit=3, job_id='job-n')
+    assert first['imported_count'] == 2
+    assert [(p['shortcode'], p['stage']) for p in first['failed_posts']] == [('SC1', 'create')]
+    assert checkpoints.summary('job-n')['created'] == 2
+    assert [c['post_id'] is None for c in checkpoints.load('job-n')] == [False, True, False]
+
+    monkeypatch.setattr(fake_aiwu_client, 'create_post_with_meta', create)
+    second = manager.import_user_posts_to_wordpress('example_user', limit=3, job_id='job-n')
+
+    assert second['resumed'] and second['imported_count'] == 3
+    assert checkpoints.summary('job-n')['done'] == 3
+
+
+def test_resume_after_crash_between_create_and_meta(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    posts = sample_posts(fake_aiwu, 2)
+    manager, checkpoints, _ = make_manager(fake_aiwu, fake_aiwu_client, monkeypatch, tmp_path, posts)
+
+    def crash(*args, **kwargs):
+        raise Exception("worker killed")
+    monkeypatch.setattr(fake_aiwu_client, 'finish_post', crash)
+    manager.import_user_posts_to_wordpress('example_user', limit=2, job_id='job-2')
+    assert [(c['post_id'] is not None, c['done']) for c in checkpoints.load('job-2')] == [(True, False)] * 2
+
+    monkeypatch.undo()
+    monkeypatch.chdir(tmp_path)
+    result = manager.import_user_posts_to_wordpress('example_user', limit=2, job_id='job-2')
+
+    assert result['imported_count'] == 2
+    assert fake_aiwu.tool_call_count('wp_create_post') == 2
+    for checkpoint in checkpoints.load('job-2'):
+        assert checkpoint['done'] and checkpoint['featured_set'] and checkpoint['meta_written']
+        assert fake_aiwu.wordpress.posts[checkpoint['post_id']]['featured_media'] == checkpoint['media_id']
+
+
+def test_resume_after_dying_mid_scrape_imports_the_rest(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch,
+                                                       tmp_path):
+    posts = sample_posts(fake_aiwu, 10)
+    manager, checkpoints, _ = make_manager(fake_aiwu, fake_aiwu_client, monkeypatch, tmp_path, posts)
+    scrapes = []
+
+    def dying_scrape(username, limit):
+        scrapes.append(username)
+        yield from posts[:4]
+        raise Exception("worker killed")
+
+    monkeypatch.setattr(manager.scraper, 'iter_user_posts', dying_scrape)
+    first = manager.import_user_posts_to_wordpress('example_user', limit=10, job_id='job-m',
+                                                   on_result=lambda outcome, record: None)
+    assert not first['success'] and first['error'] == 'worker killed'
+    # Posts of the batch being read when the scrape died were never recorded
+    assert 0 < checkpoints.summary('job-m')['done'] < 4
+    # The posts created before the error are still reported
+    assert first['imported_count'] == first['scraped_count'] == checkpoints.summary('job-m')['done']
+    assert first['failed_count'] == 0 and first['mcp_calls_total'] > 0
+    assert not checkpoints.feed_complete('job-m')
+
+    monkeypatch.setattr(manager.scraper, 'iter_user_posts',
+                        lambda username, limit: scrapes.append(username) or iter(posts))
+    results = []
+    second = manager.import_user_posts_to_wordpress('example_user', limit=10, job_id='job-m',
+                                                    on_result=lambda outcome, record: results.append(record))
+
+    assert second['resumed'] and second['imported_count'] == 10 and second['skipped_count'] == 0
+    assert sorted(r['shortcode'] for r in results) == sorted(f'SC{i}' for i in range(10))
+    assert fake_aiwu.tool_call_count('wp_create_post') == 10
+    assert checkpoints.summary('job-m')['done'] == 10 and checkpoints.feed_complete('job-m')
+
+    # Once the whole scrape was read, resuming needs no scrape at all
+    manager.import_user_posts_to_wordpress('example_user', limit=10, job_id='job-m',
+                                           on_result=lambda outcome, record: None)
+    assert scrapes == ['example_user'] * 2
+    assert fake_aiwu.tool_call_count('wp_create_post') == 10
+
+
+def test_job_queue_resume_job(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), poll_interval=0.05)
+    queue.register('import', lambda job: None)
+    job = queue.submit('import', {'username': 'example_user'})
+
+    assert queue.resume_job(job['id']) is None
+
+    with queue._connect() as conn:
+        conn.execute("UPDATE jobs SET status = ?, error = 'boom' WHERE id = ?", (FAILED, job['id']))
+    resumed = queue.resume_job(job['id'], progress_session_id='new-session')
+    assert resumed['status'] == QUEUED and resumed['error'] is None
+    assert resumed['progress_session_id'] == 'new-session'
+
+    queue.start()
+    try:
+        import time
+        deadline = time.time() + 5
+        while queue.get(job['id'])['status'] != COMPLETE and time.time() < deadline:
+            time.sleep(0.01)
+        assert queue.get(job['id'])['status'] == COMPLETE
+    finally:
+        queue.stop(1)
+
+
+def test_uploaded_media_list_survives_reload_and_old_databases(tmp_path):
+    import sqlite3
+    db_path = str(tmp_path / 'jobs.db')
+    with sqlite3.connect(db_path) as conn:
+        # Schema from before carousel support, without the media column
+        conn.execute('''CREATE TABLE import_checkpoints (job_id TEXT NOT NULL, position INTEGER NOT NULL,
+                        shortcode TEXT, post TEXT NOT NULL, image_fetched INTEGER DEFAULT 0, media_id INTEGER,
+                        post_id INTEGER, title TEXT, meta_written INTEGER DEFAULT 0, featured_set INTEGER DEFAULT 0,
+                        done INTEGER DEFAULT 0, error TEXT, updated_at TEXT, PRIMARY KEY (job_id, position))''')
+
+    checkpoints = ImportCheckpoints(db_path)
+    checkpoints.start('job-1', [{'shortcode': 'CAR'}])
+    assert checkpoints.load('job-1')[0]['media'] == []
+
+    media = [{'type': 'image', 'id': 7, 'source_url': 'https://example.com/a.jpg', 'thumbnail': False},
+             {'type': 'video', 'id': 8, 'source_url': 'https://example.com/b.mp4', 'thumbnail': False}]
+    checkpoints.update('job-1', 0, media_id=7, media=media)
+
+    assert checkpoints.load('job-1')[0]['media'] == media
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test the import engine shared by every Instagram -> WordPress import route
+"""
+import os
+import sys
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.instagram.apify_scraper import ApifyInstagramScraper
+from src.integrations.instagram.import_engine import ImportEngine, derive_post_title
+from src.utils.post_tracker import PostTracker
+
+
+def sample_posts(server, count):
+    return [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}\n#tag',
+             'hashtags': ['tag'], 'likes_count': i, 'comments_count': 0, 'post_url': '',
+             'extraction_method': 'csv_import', 'image_url': server.image_url(f'post_{i}')} for i in range(count)]
+
+
+def test_title_falls_back_when_caption_is_only_hashtags():
+    assert derive_post_title({'caption': 'Sunset\nmore'}) == 'Sunset'
+    assert derive_post_title({'caption': '#sunset #beach'}, 'example_user').startswith('Instagram Post from @example_user - ')
+    assert derive_post_title({}).startswith('Instagram Post - ')
+
+
+def test_import_posts_reports_progress_and_records_mappings(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    engine = ImportEngine(fake_aiwu_client, post_tracker=tracker)
+    progress = []
+
+    result = engine.import_posts(sample_posts(fake_aiwu, 4), on_progress=lambda *args: progress.append(args))
+
+    assert [p['shortcode'] for p in result['imported']] == ['SC0', 'SC1', 'SC2', 'SC3']
+    assert progress[-1] == (4, 4, 4, 0)
+    assert [completed for completed, _, _, _ in progress] == [1, 2, 3, 4]
+    meta = fake_aiwu.wordpress.meta[result['imported'][0]['post_id']]
+    assert meta['import_method'] == 'csv_import'
+    assert meta['instagram_username'] == 'example_user'
+    assert meta['instagram_likes_count'] == '0'
+    assert tracker.is_instagram_post_imported('SC0')['import_method'] == 'csv_import'
+
+    again = engine.import_posts(sample_posts(fake_aiwu, 5), import_method='apify_scraper')
+    assert [p['shortcode'] for p in again['imported']] == ['SC4']
+    assert len(again['skipped']) == 4
+    assert fake_aiwu.wordpress.meta[again['imported'][0]['post_id']]['import_method'] == 'apify_scraper'
+
+
+def test_falls_back_to_mcp_upload_without_rest_credentials(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch):
+    monkeypatch.delenv('WORDPRESS_PASSWORD', raising=False)
+    engine = ImportEngine(fake_aiwu_client)
+
+    result = engine.import_posts(sample_posts(fake_aiwu, 2))
+
+    assert all(p['media_id'] for p in result['imported'])
+    assert fake_aiwu.tool_call_count('wp_upload_media') == 2
+    assert fake_aiwu.stats['rest_uploads'] == 0
+
+
+def test_apify_route_imports_through_engine(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    from src.api.instagram_routes import instagram_bp
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+
+    app = Flask(__name__)
+    app.register_blueprint(instagram_bp)
+    app.config['import_engine'] = ImportEngine(fake_aiwu_client, post_tracker=PostTracker(str(tmp_path / 'tracker.db')))
+    app.config['WORDPRESS_URL'] = fake_aiwu.base_url
+
+    response = app.test_client().post('/api/instagram/apify/import-to-wordpress',
+                                      json={'posts': sample_posts(fake_aiwu, 3)})
+
+    data = response.get_json()
+    assert response.status_code == 200
+    assert (data['imported_count'], data['total_posts'], data['failed_posts']) == (3, 3, [])
+    assert data['drafts_url'].startswith(fake_aiwu.base_url)
+    assert fake_aiwu.stats['rest_uploads'] == 3
+    assert fake_aiwu.tool_call_count('wp_create_post') == 3
+
+
+def test_apify_sidecar_and_video_items_list_every_asset():
+    scraper = ApifyInstagramScraper('token')
+    sidecar = scraper._format_post_data({'type': 'Sidecar', 'shortCode': 'CAR', 'displayUrl': 'https://cdn/1.jpg',
+                                         'childPosts': [{'type': 'Image', 'displayUrl': 'https://cdn/1.jpg'},
+                                                        {'type': 'Video', 'displayUrl': 'https://cdn/2.jpg',
+                                                         'videoUrl': 'https://cdn/2.mp4'}]}, 'example_user')
+    video = scraper._format_post_data({'type': 'Video', 'shortCode': 'VID', 'displayUrl': 'https://cdn/thumb.jpg',
+                                       'videoUrl': 'https://cdn/clip.mp4'}, 'example_user')
+
+    assert sidecar['media'] == [{'type': 'image', 'url': 'https://cdn/1.jpg'},
+                                {'type': 'video', 'url': 'https://cdn/2.mp4', 'thumbnail_url': 'https://cdn/2.jpg'}]
+    assert video['media'] == [{'type': 'video', 'url': 'https://cdn/clip.mp4', 'thumbnail_url': 'https://cdn/thumb.jpg'}]
+    assert video['image_url'] == 'https://cdn/thumb.jpg'
+
+
+def test_carousel_and_video_posts_import_every_asset(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch):
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    fake_aiwu.latency = 0.03
+    carousel = {'shortcode': 'CAR', 'username': 'example_user', 'caption': 'Carousel',
+                'image_url': fake_aiwu.image_url('car_0'),
+                'media': [{'type': 'image', 'url': fake_aiwu.image_url(f'car_{i}')} for i in range(6)] +
+                         [{'type': 'video', 'url': fake_aiwu.video_url('car_clip')}]}
+    reel = {'shortcode': 'VID', 'username': 'example_user', 'caption': 'Reel', 'image_url': fake_aiwu.image_url('thumb'),
+            'media': [{'type': 'video', 'url': fake_aiwu.video_url('reel')}]}
+    engine = ImportEngine(fake_aiwu_client, workers={'fetch': 1}, asset_workers=3, video_range_size=400_000)
+
+    result = engine.import_posts([carousel, reel])
+
+    first, second = result['imported']
+    assert [m['type'] for m in first['media']] == ['image'] * 6 + ['video']
+    assert [m['type'] for m in second['media']] == ['image', 'video'] and second['media'][0]['thumbnail']
+    posts = fake_aiwu.wordpress.posts
+    assert posts[first['post_id']]['featured_media'] == first['media'][0]['id']
+    assert posts[second['post_id']]['featured_media'] == second['media'][0]['id']
+
+    gallery_ids = ','.join(str(m['id']) for m in first['media'][:6])
+    assert f'[gallery ids="{gallery_ids}" link="file"]' in posts[first['post_id']]['post_content']
+    assert f'[video src="{second["media"][1]["source_url"]}"]' in posts[second['post_id']]['post_content']
+    assert '[gallery' not in posts[second['post_id']]['post_content']
+
+    # Slides download in parallel, but never more than asset_workers for the one post being fetched
+    assert 2 <= fake_aiwu.stats['peak_cdn_downloads'] <= 3
+    assert fake_aiwu.stats['video_requests'] == 6
+    assert fake_aiwu.stats['rest_uploads'] == 9
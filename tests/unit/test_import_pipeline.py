@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test the staged import pipeline and the pipelined Apify bulk import
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.import_pipeline import ImportPipeline, PipelineStage
+
+
+def sleeping_stage(name, delay, active, peak, lock):
+    def fn(job):
+        with lock:
+            active[name] += 1
+            peak[name] = max(peak[name], active[name])
+        time.sleep(delay() if callable(delay) else delay)
+        job.setdefault('path', []).append(name)
+        with lock:
+            active[name] -= 1
+    return fn
+
+
+def test_order_preserved_and_workers_bounded():
+    rng = random.Random(7)
+    lock = threading.Lock()
+    active = {'a': 0, 'b': 0}
+    peak = {'a': 0, 'b': 0}
+    pipeline = ImportPipeline([
+        PipelineStage('a', sleeping_stage('a', lambda: rng.uniform(0, 0.01), active, peak, lock), workers=3),
+        PipelineStage('b', sleeping_stage('b', lambda: rng.uniform(0, 0.01), active, peak, lock), workers=2)
+    ])
+    completed = []
+
+    jobs = pipeline.run(range(20), on_job_done=lambda job, n: completed.append(n))
+
+    assert [job['item'] for job in jobs] == list(range(20))
+    assert all(job['path'] == ['a', 'b'] for job in jobs)
+    assert completed == list(range(1, 21))
+    assert peak['a'] <= 3 and peak['b'] <= 2
+    assert pipeline.stats['b']['processed'] == 20
+
+
+def test_failed_job_skips_later_stages():
+    def explode(job):
+        if job['item'] == 2:
+            raise Exception("upload rejected")
+        job['uploaded'] = True
+
+    pipeline = ImportPipeline([
+        PipelineStage('upload', explode),
+        PipelineStage('create', lambda job: job.__setitem__('created', True))
+    ])
+    jobs = pipeline.run(range(4))
+
+    assert jobs[2]['failed_stage'] == 'upload'
+    assert jobs[2]['error'] == 'upload rejected'
+    assert 'created' not in jobs[2]
+    assert all(jobs[i]['created'] for i in (0, 1, 3))
+    assert pipeline.stats['upload']['failed'] == 1
+    assert pipeline.stats['create']['processed'] == 3
+
+
+def test_stream_reads_items_lazily_and_reraises_feed_errors():
+    lock = threading.Lock()
+    read = [0]
+    ahead = []
+
+    def items():
+        for n in range(200):
+            with lock:
+                read[0] += 1
+            yield n
+        raise Exception("dataset page failed")
+
+    def record(job, completed):
+        with lock:
+            ahead.append(read[0] - completed)
+
+    pipeline = ImportPipeline([PipelineStage('a', lambda job: time.sleep(0.001), workers=2),
+                               PipelineStage('b', lambda job: None, workers=1)])
+    try:
+        pipeline.stream(items(), record)
+        raise AssertionError("feed error was swallowed")
+    except Exception as e:
+        assert str(e) == "dataset page failed"
+
+    # Items read ahead of the finished ones are bounded by the queues and workers, not the 200 items
+    assert len(ahead) == 200
+    assert max(ahead) <= 15
+
+
+def test_stages_overlap():
+    lock = threading.Lock()
+    names = ['fetch', 'upload', 'create', 'finalize']
+    active = dict.fromkeys(names, 0)
+    peak = dict.fromkeys(names, 0)
+    pipeline = ImportPipeline([PipelineStage(name, sleeping_stage(name, 0.02, active, peak, lock)) for name in names])
+
+    start = time.perf_counter()
+    pipeline.run(range(10))
+    elapsed = time.perf_counter() - start
+
+    # Sequential would take 10 posts * 4 stages * 20ms = 0.8s; pipelined ~ (10 + 3) * 20ms
+    assert elapsed < 0.5
+
+
+def test_manager_imports_through_pipeline(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    monkeypatch.chdir(tmp_path)
+
+    posts = [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}\n#tag',
+              'hashtags': ['tag'], 'likes_count': i, 'comments_count': 0, 'post_url': '',
+              'image_url': fake_aiwu.image_url(f'post_{i}')} for i in range(6)]
+    posts[3]['image_url'] = ''
+
+    manager = ApifyInstagramManager('token', fake_aiwu_client)
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts', lambda username, limit: posts)
+
+    result = manager.import_user_posts_to_wordpress('example_user', limit=6)
+
+    assert result['imported_count'] == 6
+    assert [p['shortcode'] for p in result['imported_posts']] == [f'SC{i}' for i in range(6)]
+    assert [p['title'] for p in result['imported_posts']] == [f'Caption {i}' for i in range(6)]
+    wp_posts = fake_aiwu.wordpress.posts
+    featured = [wp_posts[p['wordpress_id']].get('featured_media') for p in result['imported_posts']]
+    assert not featured[3]
+    assert all(featured[i] for i in (0, 1, 2, 4, 5))
+    assert fake_aiwu.wordpress.meta[result['imported_posts'][0]['wordpress_id']]['instagram_shortcode'] == 'SC0'
+
+
+def test_manager_skips_posts_already_imported(fake_aiwu, fake_aiwu_client, monkeypatch, tmp_path):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    from src.utils.post_tracker import PostTracker
+
+    monkeypatch.chdir(tmp_path)
+    posts = [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}'} for i in range(4)]
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    manager = ApifyInstagramManager('token', fake_aiwu_client, post_tracker=tracker)
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts', lambda username, limit: posts[:2])
+
+    first = manager.import_user_posts_to_wordpress('example_user', limit=2)
+    assert (first['imported_count'], first['skipped_count']) == (2, 0)
+
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts', lambda username, limit: posts)
+    second = manager.import_user_posts_to_wordpress('example_user', limit=4)
+
+    assert [p['shortcode'] for p in second['imported_posts']] == ['SC2', 'SC3']
+    assert second['skipped_posts'] == [{'shortcode': 'SC0', 'wordpress_post_id': first['imported_posts'][0]['wordpress_id']},
+                                       {'shortcode': 'SC1', 'wordpress_post_id': first['imported_posts'][1]['wordpress_id']}]
+    assert fake_aiwu.tool_call_count('wp_create_post') == 4
+
+    third = manager.import_user_posts_to_wordpress('example_user', limit=4)
+    assert third['success'] and third['imported_count'] == 0 and third['skipped_count'] == 4
+    assert fake_aiwu.tool_call_count('wp_create_post') == 4
+
+
+def test_manager_streams_results_instead_of_collecting_them(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch,
+                                                            tmp_path):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    from src.utils.import_checkpoints import ImportCheckpoints
+    from src.utils.post_tracker import PostTracker
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    monkeypatch.chdir(tmp_path)
+
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    checkpoints = ImportCheckpoints(str(tmp_path / 'jobs.db'))
+    manager = ApifyInstagramManager('token', fake_aiwu_client, post_tracker=tracker, checkpoints=checkpoints)
+    manager.engine.SKIP_BATCH_SIZE = 4
+    posts = [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}',
+              'image_url': fake_aiwu.image_url(f'post_{i}')} for i in range(30)]
+    tracker.record_import(posts[5], 500, 'Caption 5', 'draft')
+    posts[20]['shortcode'] = 'SC7'  # repeated in a later batch
+    monkeypatch.setattr(manager.scraper, 'iter_user_posts', lambda username, limit: iter(posts))
+
+    results = []
+    result = manager.import_user_posts_to_wordpress('example_user', limit=30, job_id='job-s',
+                                                    on_result=lambda outcome, record: results.append((outcome, record)))
+
+    assert (result['scraped_count'], result['imported_count'], result['skipped_count']) == (30, 28, 2)
+    assert 'imported_posts' not in result and 'skipped_posts' not in result
+    assert sorted(r['shortcode'] for o, r in results if o == 'skipped') == ['SC5', 'SC7']
+    imported = [r for o, r in results if o == 'imported']
+    assert len(imported) == 28 and all(r['post_id'] and 'instagram_post' not in r for r in imported)
+    assert checkpoints.summary('job-s') == {'posts': 28, 'image_fetched': 28, 'media_uploaded': 28,
+                                            'created': 28, 'done': 28}
+    assert fake_aiwu.tool_call_count('wp_create_post') == 28
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test the import planner's dry-run counts and estimates
+"""
+import os
+import sys
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.instagram.import_engine import ImportEngine
+from src.integrations.instagram.import_planner import ImportPlanner
+from src.utils.image_cache import InstagramImageCache
+from src.utils.media_index import MediaIndex
+from src.utils.post_tracker import PostTracker
+
+
+class FakeScraper:
+    def __init__(self, cached=None):
+        self.cached = cached
+        self.scraped = []
+
+    def get_cached_user_posts(self, username, limit=50, include_stories=False):
+        return self.cached
+
+    def estimate_cost(self, operation_type='user_posts', count=10):
+        return {'operation_type': operation_type, 'results': count, 'estimated_cost_usd': count * 0.0023}
+
+    def scrape_user_posts(self, username, limit=50):
+        self.scraped.append((username, limit))
+        return []
+
+
+def sample_posts(server, count):
+    return [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}',
+             'image_url': server.image_url(f'post_{i}')} for i in range(count)]
+
+
+def test_plan_counts_tracked_posts_and_known_media_without_importing(fake_aiwu, fake_aiwu_client, monkeypatch,
+                                                                   tmp_path):
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    media_index = MediaIndex(str(tmp_path / 'media.db'))
+    engine = ImportEngine(fake_aiwu_client, post_tracker=tracker, media_index=media_index)
+    image_cache = InstagramImageCache(str(tmp_path / 'cache'))
+    posts = sample_posts(fake_aiwu, 4)
+    posts[3]['media'] = [{'type': 'image', 'url': fake_aiwu.image_url(f'car_{i}')} for i in range(2)] + \
+                        [{'type': 'video', 'url': fake_aiwu.video_url('car_clip')}]
+
+    tracker.record_import(posts[0], 101, 'Caption 0', 'draft', 'csv_import')
+    # Post 1's image is cached locally and was uploaded before; post 2's is only cached
+    for name, uploaded in (('post_1', True), ('post_2', False)):
+        cached = image_cache.cache_dir / image_cache._get_cache_filename(fake_aiwu.image_url(name))
+        cached.write_bytes(name.encode() * 100)
+        if uploaded:
+            media_index.record(media_index.hash_file(cached), engine.site_url, 55)
+
+    plan = ImportPlanner(engine, image_cache=image_cache).plan(posts=posts)
+
+    assert plan['source'] == 'request'
+    assert (plan['posts']['total'], plan['posts']['new'], plan['posts']['already_imported']) == (4, 3, 1)
+    assert plan['media'] == {'images': 4, 'videos': 1, 'carousels': 1, 'in_local_cache': 2,
+                             'in_media_library': 1, 'to_upload': 4}
+    assert plan['calls']['rest'] == {'media_upload': 4, 'media_lookup': 1}
+    assert plan['calls']['mcp']['wp_create_post'] == 3
+    assert plan['calls']['mcp']['wp_upload_media'] == 0
+    assert plan['estimate']['seconds'] > 0
+    assert set(plan['estimate']['latency_source'].values()) == {'default'}
+    # A dry run: nothing reached WordPress or the CDN
+    assert fake_aiwu.stats['rest_uploads'] == 0
+    assert fake_aiwu.tool_call_count('wp_create_post') == 0
+    assert fake_aiwu.stats['video_requests'] == 0
+
+
+def test_estimates_use_recorded_latencies_after_an_import(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch,
+                                                         tmp_path):
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    engine = ImportEngine(fake_aiwu_client)
+    planner = ImportPlanner(engine, image_cache=InstagramImageCache(str(tmp_path / 'cache')))
+    engine.import_posts(sample_posts(fake_aiwu, 2))
+
+    estimate = planner.plan(posts=sample_posts(fake_aiwu, 4))['estimate']
+
+    for name in ('cdn_image_download', 'rest_media_upload', 'wp_create_post', 'finish_post'):
+        assert estimate['latency_source'][name] == 'recorded'
+    assert estimate['latency_source']['cdn_video_download'] == 'default'
+    assert estimate['bottleneck'] in estimate['stages']
+
+
+def test_username_plan_estimates_without_scraping_unless_asked(fake_aiwu_client):
+    scraper = FakeScraper()
+    planner = ImportPlanner(ImportEngine(fake_aiwu_client), scraper=scraper)
+
+    plan = planner.plan(username='example_user', limit=500)
+
+    assert plan['source'] == 'estimate'
+    assert plan['posts']['new'] == 500
+    assert plan['apify']['cached'] is False and plan['apify']['results'] == 500
+    assert scraper.scraped == []
+
+    scraper.cached = [{'shortcode': 'SC0', 'username': 'example_user'}]
+    cached = planner.plan(username='example_user', limit=500)
+    assert cached['source'] == 'apify_cache' and cached['apify']['cached'] is True
+    assert cached['apify']['estimated_cost_usd'] == 0
+
+
+def test_plan_route_requires_posts_or_username(fake_aiwu_client):
+    from src.api.instagram_routes import instagram_bp
+
+    app = Flask(__name__)
+    app.register_blueprint(instagram_bp)
+    app.config['import_planner'] = ImportPlanner(ImportEngine(fake_aiwu_client))
+    client = app.test_client()
+
+    assert client.post('/api/instagram/import/plan', json={}).status_code == 400
+    assert client.post('/api/instagram/import/plan', json={'username': 'example_user'}).status_code == 400
+    response = client.post('/api/instagram/import/plan', json={'posts': []})
+    assert response.status_code == 200
+    assert response.get_json()['plan']['posts']['new'] == 0
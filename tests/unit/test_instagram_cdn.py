@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test the shared Instagram CDN download client and its cookie warm-up
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.instagram_cdn import InstagramCDNClient
+
+
+def test_warm_up_once_for_concurrent_downloads(fake_aiwu, tmp_path):
+    cdn = InstagramCDNClient(pool_size=4, warmup_url=fake_aiwu.base_url + '/',
+                             cookie_path=str(tmp_path / 'cookies.txt'))
+    urls = [fake_aiwu.image_url(f'post_{i}') for i in range(24)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(cdn.download, urls))
+
+    assert all(success for success, _, _ in results)
+    assert fake_aiwu.stats['image_downloads'] == 24
+    assert fake_aiwu.stats['page_views'] == 1
+    assert cdn.get_stats()['warmups'] == 1
+    assert 'csrftoken' in {cookie.name for cookie in cdn.session.cookies}
+
+
+def test_cookies_persist_until_ttl_expires(fake_aiwu, tmp_path):
+    cookie_path = str(tmp_path / 'cookies.txt')
+    first = InstagramCDNClient(warmup_url=fake_aiwu.base_url + '/', cookie_path=cookie_path)
+    first.download(fake_aiwu.image_url('a'))
+
+    # A restarted process reuses the saved cookies without a new warm-up
+    second = InstagramCDNClient(warmup_url=fake_aiwu.base_url + '/', cookie_path=cookie_path)
+    assert 'csrftoken' in {cookie.name for cookie in second.session.cookies}
+    second.download(fake_aiwu.image_url('b'))
+    assert fake_aiwu.stats['page_views'] == 1
+
+    # Once the TTL has passed the next download refreshes them
+    os.utime(cookie_path, (time.time() - 120, time.time() - 120))
+    expired = InstagramCDNClient(warmup_ttl=60, warmup_url=fake_aiwu.base_url + '/', cookie_path=cookie_path)
+    expired.download(fake_aiwu.image_url('c'))
+    assert fake_aiwu.stats['page_views'] == 2
+
+
+def test_failed_warm_up_does_not_block_downloads(fake_aiwu, tmp_path):
+    cdn = InstagramCDNClient(warmup_url='http://127.0.0.1:9/', cookie_path=str(tmp_path / 'cookies.txt'),
+                             retry_interval=60)
+
+    assert cdn.download(fake_aiwu.image_url('a'))[0]
+    assert cdn.download(fake_aiwu.image_url('b'))[0]
+    assert cdn.get_stats()['warmup_failures'] == 1
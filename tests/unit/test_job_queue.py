@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test the persistent background job queue
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api import progress_routes
+from src.utils.job_queue import JobQueue, COMPLETE, FAILED, QUEUED, RUNNING, CANCELLED, INTERRUPTED
+
+
+def wait_for(queue, job_id, statuses, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} stuck in {queue.get(job_id)['status']}")
+
+
+def make_queue(tmp_path, **kwargs):
+    return JobQueue(str(tmp_path / 'jobs.db'), poll_interval=0.05, **kwargs)
+
+
+def test_job_runs_in_background_and_drives_progress(tmp_path):
+    queue = make_queue(tmp_path)
+    release = threading.Event()
+
+    def handler(job):
+        release.wait(5)
+        return {'success': True, 'message': f"Imported @{job['params']['username']}"}
+
+    queue.register('import', handler)
+    session_id = progress_routes.create_progress_session('Bulk Import', 100)
+    try:
+        job = queue.submit('import', {'username': 'example_user'}, site='site', username='example_user',
+                           progress_session_id=session_id)
+        assert job['status'] == QUEUED
+        queue.start()
+        wait_for(queue, job['id'], (RUNNING,))
+
+        release.set()
+        job = wait_for(queue, job['id'], (COMPLETE,))
+        assert job['result'] == {'success': True, 'message': 'Imported @example_user'}
+        progress = progress_routes.get_progress(session_id)
+        assert progress['status'] == 'complete'
+        assert progress['message'] == 'Imported @example_user'
+    finally:
+        queue.stop(1)
+        progress_routes.active_sessions.pop(session_id, None)
+
+
+def test_per_username_and_per_site_caps(tmp_path):
+    queue = make_queue(tmp_path, workers=4, max_per_site=2, max_per_username=1)
+    release = threading.Event()
+    queue.register('import', lambda job: release.wait(5) and {'success': True})
+    queue.start()
+    try:
+        first = queue.submit('import', {}, site='a', username='alice')
+        same_user = queue.submit('import', {}, site='b', username='alice')
+        other_user = queue.submit('import', {}, site='a', username='bob')
+        site_full = queue.submit('import', {}, site='a', username='carol')
+
+        wait_for(queue, first['id'], (RUNNING,))
+        wait_for(queue, other_user['id'], (RUNNING,))
+        time.sleep(0.2)
+        assert queue.get(same_user['id'])['status'] == QUEUED
+        assert queue.get(site_full['id'])['status'] == QUEUED
+
+        release.set()
+        for job in (first, same_user, other_user, site_full):
+            wait_for(queue, job['id'], (COMPLETE,))
+    finally:
+        release.set()
+        queue.stop(1)
+
+
+def test_failures_cancel_and_restart(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.register('boom', lambda job: 1 / 0)
+    queue.register('unsuccessful', lambda job: {'success': False, 'error': 'No posts found'})
+    queue.register('never', lambda job: None)
+
+    cancelled = queue.submit('never', {})
+    assert queue.cancel(cancelled['id'])
+    assert queue.get(cancelled['id'])['status'] == CANCELLED
+
+    queue.start()
+    try:
+        boom = queue.submit('boom', {})
+        unsuccessful = queue.submit('unsuccessful', {})
+        assert 'division by zero' in wait_for(queue, boom['id'], (FAILED,))['error']
+        assert wait_for(queue, unsuccessful['id'], (FAILED,))['error'] == 'No posts found'
+        assert not queue.cancel(boom['id'])
+    finally:
+        queue.stop(1)
+
+    # A job left running by a dead process is reported as interrupted
+    stuck = queue.submit('never', {})
+    with queue._connect() as conn:
+        conn.execute('UPDATE jobs SET status = ? WHERE id = ?', (RUNNING, stuck['id']))
+    restarted = make_queue(tmp_path)
+    assert restarted.get(stuck['id'])['status'] == INTERRUPTED
+    assert restarted.get_stats()['jobs'][FAILED] == 2
+
+
+def test_results_are_paged_and_cleared_on_resume(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.register('import', lambda job: {'success': True})
+    job = queue.submit('import', {})
+    queue.add_results(job['id'], 'skipped', [{'shortcode': 'SC0', 'wordpress_post_id': 7}])
+    for n in range(1, 6):
+        queue.add_results(job['id'], 'imported', [{'shortcode': f'SC{n}', 'post_id': n}])
+    queue.add_results(job['id'], 'failed', [{'shortcode': 'SC6', 'error': 'Request timed out'}])
+
+    page = queue.get_results(job['id'], offset=2, limit=3)
+    assert [r['shortcode'] for r in page['results']] == ['SC2', 'SC3', 'SC4']
+    assert page['results'][0] == {'outcome': 'imported', 'shortcode': 'SC2', 'post_id': 2}
+    assert page['total'] == 7 and page['counts'] == {'imported': 5, 'skipped': 1, 'failed': 1}
+    assert queue.get_results(job['id'], outcome='failed')['total'] == 1
+
+    with queue._connect() as conn:
+        conn.execute('UPDATE jobs SET status = ? WHERE id = ?', (FAILED, job['id']))
+    queue.resume_job(job['id'])
+    assert queue.get_results(job['id'])['counts'] == {'skipped': 1}
+
+
+def test_queues_sharing_a_database_run_each_job_once(tmp_path):
+    # One queue per gunicorn worker, all on the same jobs.db
+    queues = [make_queue(tmp_path, workers=2) for _ in range(2)]
+    runs = []
+    runs_lock = threading.Lock()
+
+    def handler(job):
+        with runs_lock:
+            runs.append(job['id'])
+        return {'success': True}
+
+    for queue in queues:
+        queue.register('import', handler)
+    jobs = [queues[n % 2].submit('import', {}) for n in range(40)]
+    for queue in queues:
+        queue.start()
+    try:
+        for job in jobs:
+            wait_for(queues[0], job['id'], (COMPLETE,))
+    finally:
+        for queue in queues:
+            queue.stop(1)
+
+    assert sorted(runs) == sorted(job['id'] for job in jobs)
+
+
+def test_only_jobs_whose_owner_is_gone_are_interrupted(tmp_path):
+    queue = make_queue(tmp_path)
+    release = threading.Event()
+    queue.register('import', lambda job: release.wait(5) and {'success': True})
+    queue.start()
+    try:
+        live = queue.submit('import', {}, username='example_user')
+        wait_for(queue, live['id'], (RUNNING,))
+
+        # Another worker starting on the same database leaves the live job alone
+        other = make_queue(tmp_path)
+        assert other.get(live['id'])['status'] == RUNNING
+
+        # Jobs owned by an exited process, or whose heartbeat stopped, are orphans
+        dead = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'], capture_output=True)
+        dead_owner = f"{queue.owner.split(':')[0]}:{int(dead.stdout)}:gone"
+        stale = (datetime.now() - timedelta(hours=1)).isoformat()
+        # (queued behind the live job's username, so the running queue does not claim them first)
+        exited = queue.submit('import', {}, username='example_user')
+        silent = queue.submit('import', {}, username='example_user')
+        with other._connect() as conn:
+            conn.execute('UPDATE jobs SET status = ?, owner = ?, heartbeat_at = ? WHERE id = ?',
+                         (RUNNING, dead_owner, datetime.now().isoformat(), exited['id']))
+            conn.execute('UPDATE jobs SET status = ?, owner = ?, heartbeat_at = ? WHERE id = ?',
+                         (RUNNING, 'elsewhere:1:x', stale, silent['id']))
+        assert other._interrupt_orphans() == 2
+        assert other.get(exited['id'])['status'] == INTERRUPTED
+        assert other.get(silent['id'])['status'] == INTERRUPTED
+        assert other.get(live['id'])['status'] == RUNNING
+
+        release.set()
+        wait_for(queue, live['id'], (COMPLETE,))
+    finally:
+        release.set()
+        queue.stop(1)
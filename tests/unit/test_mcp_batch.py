@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test JSON-RPC batching in WordPressMCPClient.call_many
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.client import WordPressMCPClient
+from src.integrations.wordpress.response_decoder import loads
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = json.dumps(payload)
+        self.content = self.text.encode()
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Stands in for requests.Session; answers tools/call requests in memory"""
+
+    def __init__(self, accept_batches=True, batch_failures=()):
+        self.accept_batches = accept_batches
+        # Replies (status, payload) to answer the next batch requests with
+        self.batch_failures = list(batch_failures)
+        self.posts = []
+
+    def post(self, url, data=None, timeout=None):
+        json = loads(data)
+        self.posts.append(json)
+        if isinstance(json, list):
+            if not self.accept_batches:
+                return FakeResponse(400, {'error': {'code': -32600, 'message': 'Invalid Request'}})
+            if self.batch_failures:
+                return FakeResponse(*self.batch_failures.pop(0))
+            # Answer out of order to make sure results are matched by id
+            return FakeResponse(200, [self._answer(req) for req in reversed(json)])
+        return FakeResponse(200, self._answer(json))
+
+    def _answer(self, req):
+        name = req['params']['name']
+        if name == 'wp_fail':
+            return {'jsonrpc': '2.0', 'id': req['id'], 'error': {'code': -32000, 'message': 'boom'}}
+        if name == 'wp_create_post':
+            text = 'Post created ID 42'
+            return {'jsonrpc': '2.0', 'id': req['id'], 'result': {'content': [{'type': 'text', 'text': text}]}}
+        text = '{"tool": "%s", "n": %d}' % (name, req['params']['arguments'].get('n', 0))
+        return {'jsonrpc': '2.0', 'id': req['id'], 'result': {'content': [{'type': 'text', 'text': text}]}}
+
+
+def make_client(session):
+    client = WordPressMCPClient('http://wordpress.test/wp-json/mcp/v1/sse', 'token')
+    client.session = session
+    return client
+
+
+def test_call_many_sends_one_post_and_keeps_order():
+    session = FakeSession()
+    client = make_client(session)
+
+    results = client.call_many([('wp_get_post', {'n': i}) for i in range(5)])
+
+    assert len(session.posts) == 1
+    assert [r['n'] for r in results] == [0, 1, 2, 3, 4]
+    assert client.batch_supported is True
+
+
+def test_call_many_falls_back_when_batches_rejected():
+    session = FakeSession(accept_batches=False)
+    client = make_client(session)
+
+    results = client.call_many([('wp_get_post', {'n': i}) for i in range(3)])
+    assert [r['n'] for r in results] == [0, 1, 2]
+    assert client.batch_supported is False
+    # One rejected batch plus three single calls
+    assert len(session.posts) == 4
+
+    # Later calls skip the batch attempt entirely
+    client.call_many([('wp_get_post', {'n': 9}), ('wp_get_post', {'n': 10})])
+    assert len(session.posts) == 6
+
+
+def test_failed_batches_are_not_resent():
+    session = FakeSession(batch_failures=[(503, {'message': 'Service Unavailable'}), (200, None)])
+    client = make_client(session)
+    client.cache = None
+
+    for _ in range(2):
+        results = client.call_many([('wp_update_post_meta', {'n': i}) for i in range(3)], return_exceptions=True)
+        # The batch may have run: its writes are reported failed, not sent again one by one
+        assert all(isinstance(r, Exception) for r in results)
+        assert client.batch_supported is None
+    assert len(session.posts) == 2
+
+    # Batching is still tried next time
+    results = client.call_many([('wp_get_post', {'n': 9}), ('wp_get_post', {'n': 10})])
+    assert [r['n'] for r in results] == [9, 10]
+    assert client.batch_supported is True
+    assert len(session.posts) == 3
+
+
+def test_non_array_reply_to_a_batch_disables_batching():
+    session = FakeSession(batch_failures=[(200, {'jsonrpc': '2.0', 'result': {}})])
+    client = make_client(session)
+
+    results = client.call_many([('wp_get_post', {'n': i}) for i in range(2)])
+
+    assert [r['n'] for r in results] == [0, 1]
+    assert client.batch_supported is False
+
+
+def test_call_many_errors():
+    client = make_client(FakeSession())
+    calls = [('wp_get_post', {'n': 1}), ('wp_fail', {}), ('wp_get_post', {'n': 2})]
+
+    results = client.call_many(calls, return_exceptions=True)
+    assert results[0]['n'] == 1
+    assert isinstance(results[1], Exception)
+    assert results[2]['n'] == 2
+
+    try:
+        client.call_many(calls)
+    except Exception as e:
+        assert 'boom' in str(e)
+    else:
+        raise AssertionError("call_many should raise the failed call's error")
+
+
+def test_create_post_full_uses_two_round_trips():
+    session = FakeSession()
+    client = make_client(session)
+    meta = {'instagram_shortcode': 'ABC123', 'instagram_username': 'example_user', 'import_method': 'test'}
+
+    created = client.create_post_full('Title', 'Body', meta=meta, featured_media_id=7)
+
+    assert created['post_id'] == 42
+    assert created['mcp_calls'] == 3
+    assert created['round_trips'] == 2
+    assert len(session.posts) == 2
+    assert session.posts[0]['params']['arguments']['meta_input'] == meta
+    follow_up = {req['params']['name']: req['params']['arguments'] for req in session.posts[1]}
+    assert follow_up['wp_update_post_meta'] == {'ID': 42, 'meta': meta}
+    assert follow_up['wp_set_featured_image'] == {'post_id': 42, 'media_id': 7}
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test the MCP read-through cache and write invalidation
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.mcp_cache import MCPResponseCache
+from tests.unit.test_mcp_batch import FakeSession, make_client
+
+
+def test_reads_are_served_from_cache():
+    session = FakeSession()
+    client = make_client(session)
+
+    first = client.call_mcp_function('wp_get_posts', {'n': 1, 'post_status': 'publish'})
+    first['n'] = 'changed by caller'
+    second = client.call_mcp_function('wp_get_posts', {'post_status': 'publish', 'n': 1})
+
+    assert second['n'] == 1
+    assert len(session.posts) == 1
+    assert client.cache.get_stats()['hits'] == 1
+
+
+def test_writes_invalidate_affected_families():
+    session = FakeSession()
+    client = make_client(session)
+
+    client.call_mcp_function('wp_get_posts', {'n': 1})
+    client.call_mcp_function('wp_get_terms', {'n': 2})
+    client.call_mcp_function('wp_update_post', {'ID': 5})
+
+    client.call_mcp_function('wp_get_posts', {'n': 1})
+    client.call_mcp_function('wp_get_terms', {'n': 2})
+    # update_post refetches posts but leaves terms cached
+    assert [req['params']['name'] for req in session.posts] == [
+        'wp_get_posts', 'wp_get_terms', 'wp_update_post', 'wp_get_posts'
+    ]
+
+
+def test_call_many_only_sends_misses():
+    session = FakeSession()
+    client = make_client(session)
+    client.call_mcp_function('wp_get_post', {'n': 1})
+
+    results = client.call_many([('wp_get_post', {'n': 1}), ('wp_get_post', {'n': 2}), ('wp_get_post', {'n': 3})])
+
+    assert [r['n'] for r in results] == [1, 2, 3]
+    assert [req['params']['arguments']['n'] for req in session.posts[1]] == [2, 3]
+
+
+def test_ttl_and_lru_bounds(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('src.integrations.wordpress.mcp_cache.time.monotonic', lambda: now[0])
+    cache = MCPResponseCache(max_entries=2, tool_ttls={'wp_get_posts': 10})
+
+    cache.store('wp_get_posts', {'page': 1}, [1])
+    cache.store('wp_get_posts', {'page': 2}, [2])
+    cache.lookup('wp_get_posts', {'page': 1})
+    cache.store('wp_get_posts', {'page': 3}, [3])
+
+    assert cache.lookup('wp_get_posts', {'page': 2}) == (False, None)
+    assert cache.lookup('wp_get_posts', {'page': 1}) == (True, [1])
+
+    now[0] += 11
+    assert cache.lookup('wp_get_posts', {'page': 3}) == (False, None)
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['expired'] == 1
+    assert not cache.is_cacheable('mcp_ping')
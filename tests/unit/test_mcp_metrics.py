@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test per-tool MCP instrumentation
+"""
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.mcp_metrics import MCPMetrics
+from tests.unit.test_mcp_batch import FakeSession, make_client
+
+
+def test_percentiles_from_histogram():
+    metrics = MCPMetrics()
+    for ms in range(1, 101):
+        metrics.record('wp_get_posts', ms / 1000, request_bytes=100, response_bytes=1000)
+
+    stats = metrics.snapshot()['tools']['wp_get_posts']
+    assert stats['calls'] == 100
+    assert 25 <= stats['latency_ms']['p50'] <= 50
+    assert 50 <= stats['latency_ms']['p95'] <= 100
+    assert stats['latency_ms']['p99'] <= stats['latency_ms']['max'] == 100.0
+    assert stats['bytes'] == {'request_total': 10000, 'response_total': 100000, 'response_mean': 1000}
+
+
+def test_client_records_calls_errors_and_timeouts():
+    session = FakeSession()
+    client = make_client(session)
+    client.cache = None
+
+    client.call_mcp_function('wp_get_post', {'n': 1})
+    client.call_many([('wp_get_post', {'n': 2}), ('wp_fail', {})], return_exceptions=True)
+
+    def timeout(url, data=None, timeout=None):
+        raise requests.exceptions.Timeout()
+    session.post = timeout
+    try:
+        client.call_mcp_function('wp_get_post', {'n': 3})
+    except Exception as e:
+        assert str(e) == "Request timed out"
+
+    tools = client.metrics.snapshot()['tools']
+    assert tools['wp_get_post']['calls'] == 3
+    assert tools['wp_get_post']['errors'] == 1
+    assert tools['wp_get_post']['timeouts'] == 1
+    assert tools['wp_get_post']['bytes']['request_total'] > 0
+    assert tools['wp_fail']['errors'] == 1
+
+
+def test_prometheus_output():
+    metrics = MCPMetrics()
+    metrics.record('mcp_ping', 0.02, 80, 200)
+    metrics.record('mcp_ping', 31.0, 80, 0, timeout=True)
+
+    text = metrics.to_prometheus()
+    assert 'mcp_tool_latency_seconds_bucket{tool="mcp_ping",le="0.025"} 1' in text
+    assert 'mcp_tool_latency_seconds_bucket{tool="mcp_ping",le="+Inf"} 2' in text
+    assert 'mcp_tool_latency_seconds_count{tool="mcp_ping"} 2' in text
+    assert 'mcp_tool_timeouts_total{tool="mcp_ping"} 1' in text
+    assert '# TYPE mcp_tool_errors_total counter' in text
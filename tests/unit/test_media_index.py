@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test content-addressed media deduplication before WordPress uploads
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.media_index import MediaIndex
+
+
+def test_index_is_keyed_by_hash_and_site(tmp_path):
+    index = MediaIndex(str(tmp_path / 'media.db'))
+    image = tmp_path / 'a.jpg'
+    image.write_bytes(b'\xff\xd8' + b'x' * 200_000)
+
+    digest = index.hash_file(image)
+    assert digest == index.hash_bytes(image.read_bytes())
+    assert index.find_existing(digest, 'https://one.example') is None
+
+    index.record(digest, 'https://one.example', 42, 'https://one.example/a.jpg', 'a.jpg', 200_002)
+    assert index.find_existing(digest, 'https://one.example')['media_id'] == 42
+    assert index.find_existing(digest, 'https://two.example') is None
+
+    # A deleted attachment is dropped and the bytes get uploaded again
+    assert index.find_existing(digest, 'https://one.example', exists=lambda media_id: False) is None
+    assert index.lookup(digest, 'https://one.example') is None
+    assert index.get_stats() == {'entries': 0, 'hits': 1, 'misses': 3, 'stale': 1}
+
+
+def test_bulk_import_reuses_identical_images(fake_aiwu, fake_aiwu_client, fake_cdn, monkeypatch, tmp_path):
+    from src.integrations.instagram.apify_scraper import ApifyInstagramManager
+    monkeypatch.setenv('WORDPRESS_PASSWORD', 'secret')
+    monkeypatch.chdir(tmp_path)
+
+    # Four posts share one image, e.g. a repost or the same photo in a later post
+    posts = [{'shortcode': f'SC{i}', 'username': 'example_user', 'caption': f'Caption {i}',
+              'image_url': fake_aiwu.image_url('shared' if i < 4 else f'post_{i}')} for i in range(6)]
+    manager = ApifyInstagramManager('token', fake_aiwu_client, pipeline_workers={'upload': 4},
+                                    media_index=MediaIndex(str(tmp_path / 'media.db')))
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts', lambda username, limit: posts)
+
+    result = manager.import_user_posts_to_wordpress('example_user', limit=6)
+
+    assert result['imported_count'] == 6
+    assert fake_aiwu.stats['rest_uploads'] == 3
+    featured = [fake_aiwu.wordpress.posts[p['wordpress_id']]['featured_media'] for p in result['imported_posts']]
+    assert len(set(featured[:4])) == 1 and len(set(featured)) == 3
+
+    # Deleting the attachment in WordPress forces a fresh upload
+    del fake_aiwu.wordpress.media[featured[0]]
+    monkeypatch.setattr(manager.scraper, 'scrape_user_posts', lambda username, limit: posts[:1])
+    manager.import_user_posts_to_wordpress('example_user', limit=1)
+    assert fake_aiwu.stats['rest_uploads'] == 4
+
+
+def test_cached_image_uploader_reuses_attachment(fake_aiwu, tmp_path):
+    from src.utils.wordpress_media import WordPressMediaUploader
+
+    image = tmp_path / 'cached.jpg'
+    image.write_bytes(b'\xff\xd8' + b'y' * 50_000)
+    copy = tmp_path / 'copy.jpg'
+    copy.write_bytes(image.read_bytes())
+    uploader = WordPressMediaUploader(fake_aiwu.base_url, 'admin', 'secret',
+                                      media_index=MediaIndex(str(tmp_path / 'media.db')))
+
+    first = uploader.upload_cached_image(image)
+    second = uploader.upload_cached_image(copy)
+
+    assert first['success'] and second['success'] and second['reused']
+    assert second['media_id'] == first['media_id'] and second['url'] == first['url']
+    assert fake_aiwu.stats['rest_uploads'] == 1
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test streaming media downloads to disk and uploads from disk
+"""
+import hashlib
+import os
+import sys
+import tracemalloc
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.media_stream import stream_download, stream_download_ranges, stream_upload
+from tests.fixtures.fake_aiwu_server import MEDIA_REST_PATH
+
+
+def test_download_hashes_while_writing(fake_aiwu, tmp_path):
+    url = fake_aiwu.image_url('post_1')
+    result = stream_download(requests, url, tmp_path / 'post_1.jpg')
+
+    expected = requests.get(url, timeout=5).content
+    assert result['size'] == len(expected) == fake_aiwu.image_bytes
+    assert result['sha256'] == hashlib.sha256(expected).hexdigest()
+    assert (tmp_path / 'post_1.jpg').read_bytes() == expected
+
+
+def test_video_downloads_in_range_requests(fake_aiwu, tmp_path):
+    result = stream_download_ranges(requests, fake_aiwu.video_url('reel'), tmp_path / 'reel.mp4', range_size=300_000)
+
+    expected = fake_aiwu.video_data('reel')
+    assert result['size'] == len(expected)
+    assert result['sha256'] == hashlib.sha256(expected).hexdigest()
+    assert result['content_type'] == 'video/mp4'
+    assert fake_aiwu.stats['video_requests'] == 4
+
+
+def test_range_download_resumes_after_dropped_request(fake_aiwu, tmp_path):
+    session = requests.Session()
+    real_get = session.get
+    calls = []
+
+    def flaky_get(url, **kwargs):
+        calls.append(kwargs['headers']['Range'])
+        if len(calls) == 2:
+            raise requests.exceptions.ConnectionError('connection reset')
+        return real_get(url, **kwargs)
+
+    session.get = flaky_get
+    result = stream_download_ranges(session, fake_aiwu.video_url('reel'), tmp_path / 'reel.mp4', range_size=400_000)
+
+    assert result['sha256'] == hashlib.sha256(fake_aiwu.video_data('reel')).hexdigest()
+    assert calls == ['bytes=0-399999', 'bytes=400000-799999', 'bytes=400000-799999', 'bytes=800000-1199999']
+
+
+def test_range_download_accepts_full_response(fake_aiwu, tmp_path):
+    # The fake CDN ignores Range for images and answers 200 with the whole file
+    result = stream_download_ranges(requests, fake_aiwu.image_url('post_1'), tmp_path / 'post_1.jpg', range_size=1000)
+
+    assert result['size'] == fake_aiwu.image_bytes
+    assert fake_aiwu.stats['image_downloads'] == 1
+
+
+def test_upload_streams_from_disk(fake_aiwu, tmp_path):
+    video = tmp_path / 'clip.mp4'
+    with open(video, 'wb') as f:
+        for _ in range(80):
+            f.write(os.urandom(64 * 1024))
+
+    tracemalloc.start()
+    try:
+        response = stream_upload(requests, fake_aiwu.base_url + MEDIA_REST_PATH, video,
+                                 headers={'Authorization': 'Basic eDp5'})
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert response.status_code == 201
+    media = fake_aiwu.wordpress.media[response.json()['id']]
+    assert media['filename'] == 'clip.mp4' and media['filesize'] == 80 * 64 * 1024
+    # A 5 MB body sent with a buffer a fraction of its size
+    assert peak < 1024 * 1024
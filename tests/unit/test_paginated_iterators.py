@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test lazy paginated iterators on WordPressMCPClient
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.chat_handler import WordPressChatHandler
+from src.utils.post_tracker import PostTracker
+from tests.unit.test_mcp_batch import FakeResponse, make_client
+
+
+class PagingSession:
+    """Serves wp_get_posts pages from an in-memory post list using limit/offset"""
+
+    def __init__(self, posts, honour_offset=True):
+        self.posts = posts
+        self.honour_offset = honour_offset
+        self.calls = []
+
+    def post(self, url, data=None, timeout=None):
+        request = json.loads(data)
+        args = request['params']['arguments']
+        self.calls.append(args)
+        posts = self.posts
+        if 'include' in args:
+            posts = [p for p in posts if p['ID'] in args['include']]
+        offset = args.get('offset', 0) if self.honour_offset else 0
+        page = posts[offset:offset + args['limit']]
+        return FakeResponse(200, {'jsonrpc': '2.0', 'id': request['id'],
+                                  'result': {'content': [{'type': 'text', 'text': json.dumps(page)}]}})
+
+
+def make_posts(count):
+    return [{'ID': i, 'post_title': f'Post {i}', 'post_status': 'publish'} for i in range(1, count + 1)]
+
+
+def test_iter_posts_pages_through_everything():
+    session = PagingSession(make_posts(23))
+    client = make_client(session)
+
+    ids = [post['ID'] for post in client.iter_posts(page_size=10)]
+
+    assert ids == list(range(1, 24))
+    assert [(c['limit'], c.get('offset', 0)) for c in session.calls] == [(10, 0), (10, 10), (10, 20)]
+
+
+def test_pages_bypass_the_response_cache():
+    session = PagingSession(make_posts(23))
+    client = make_client(session)
+
+    list(client.iter_posts(page_size=10))
+    list(client.iter_posts(page_size=10))
+
+    assert client.cache.get_stats()['entries'] == 0
+    # Each listing is read from WordPress, not from cached pages
+    assert len(session.calls) == 6
+
+
+def test_max_items_limits_requests():
+    session = PagingSession(make_posts(23))
+    client = make_client(session)
+
+    posts = list(client.iter_posts(max_items=5))
+
+    assert len(posts) == 5
+    assert session.calls == [{'limit': 5}]
+
+
+def test_raises_when_server_ignores_offset():
+    session = PagingSession(make_posts(30), honour_offset=False)
+    client = make_client(session)
+    ids = []
+
+    with pytest.raises(Exception, match='ignored offset 10'):
+        for post in client.iter_posts(page_size=10):
+            ids.append(post['ID'])
+
+    assert ids == list(range(1, 11))
+    assert len(session.calls) == 2
+
+
+class ObjectReplySession:
+    """Answers every listing with a JSON object instead of a page"""
+
+    def post(self, url, data=None, timeout=None):
+        request = json.loads(data)
+        return FakeResponse(200, {'jsonrpc': '2.0', 'id': request['id'],
+                                  'result': {'content': [{'type': 'text', 'text': json.dumps({'code': 'oops'})}]}})
+
+
+def test_chat_reports_a_listing_that_is_not_a_list():
+    handler = WordPressChatHandler(make_client(ObjectReplySession()))
+
+    for response in (handler._list_posts_response(), handler._list_drafts_response()):
+        assert response['type'] == 'error'
+        assert response['message'].startswith('❌ Unexpected response format from WordPress: wp_get_posts returned dict')
+        assert response['suggestions'] == ["Check WordPress connection", "Try 'site health'"]
+
+
+def test_sync_with_wordpress_uses_one_listing(tmp_path):
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    for wp_id in (2, 5, 9):
+        tracker.add_instagram_post({'shortcode': f'SC{wp_id}', 'username': 'example_user'})
+        tracker.add_wordpress_post(wp_id, f'Old title {wp_id}', 'draft')
+        tracker.create_mapping(f'SC{wp_id}', wp_id)
+
+    # Post 9 was deleted in WordPress
+    session = PagingSession(make_posts(6))
+    client = make_client(session)
+    result = tracker.sync_with_wordpress(client)
+
+    assert result == {'removed_mappings': 1, 'updated_posts': 2}
+    assert len(session.calls) == 1
+    assert session.calls[0]['include'] == [2, 5, 9]
+
+
+def test_sync_keeps_mappings_when_the_listing_is_incomplete(tmp_path):
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    for wp_id in range(1, 61):
+        tracker.add_instagram_post({'shortcode': f'SC{wp_id}', 'username': 'example_user'})
+        tracker.add_wordpress_post(wp_id, f'Old title {wp_id}', 'draft')
+        tracker.create_mapping(f'SC{wp_id}', wp_id)
+
+    # Every post still exists, but the server answers every page with the first one
+    client = make_client(PagingSession(make_posts(60), honour_offset=False))
+    result = tracker.sync_with_wordpress(client)
+
+    assert result == {'removed_mappings': 0, 'updated_posts': 50}
+    assert tracker.get_stats()['mappings'] == 60
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test PostTracker import bookkeeping
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.post_tracker import PostTracker
+
+
+def test_filter_new_posts_and_record_import(tmp_path):
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    assert tracker.record_import({'shortcode': 'OLD1', 'username': 'example_user'}, 101, 'Old', 'draft')
+    assert tracker.record_import({'shortcode': 'OLD2'}, 102, 'Old', 'publish', import_method='apify_scraper')
+    assert not tracker.record_import({'caption': 'no shortcode'}, 103, 'Untracked', 'draft')
+
+    posts = [{'shortcode': 'NEW1'}, {'shortcode': 'OLD1'}, {'caption': 'manual'}, {'shortcode': 'NEW1'},
+             {'shortcode': 'OLD2'}]
+    new_posts, skipped = tracker.filter_new_posts(posts)
+
+    assert new_posts == [{'shortcode': 'NEW1'}, {'caption': 'manual'}]
+    assert skipped == [{'shortcode': 'OLD1', 'wordpress_post_id': 101},
+                       {'shortcode': 'NEW1', 'wordpress_post_id': None},
+                       {'shortcode': 'OLD2', 'wordpress_post_id': 102}]
+    assert tracker.is_instagram_post_imported('OLD2')['import_method'] == 'apify_scraper'
+
+
+def test_imported_shortcode_lookup_is_chunked(tmp_path):
+    tracker = PostTracker(str(tmp_path / 'tracker.db'))
+    for i in range(3):
+        tracker.record_import({'shortcode': f'SC{i}', 'username': 'example_user'}, 200 + i, 'Title', 'draft')
+
+    shortcodes = [f'MISSING{i}' for i in range(1200)] + ['SC0', 'SC2']
+    assert tracker.get_imported_shortcodes(shortcodes) == {'SC0': 200, 'SC2': 202}
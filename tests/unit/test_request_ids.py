@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test request id allocation and response routing across threads
+"""
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.client import RequestIdAllocator
+from tests.unit.test_mcp_batch import FakeSession, make_client
+
+
+def test_allocator_is_unique_across_threads():
+    allocator = RequestIdAllocator(start=1)
+    ids = []
+
+    def worker():
+        ids.extend(allocator.next_id() for _ in range(1000))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ids) == list(range(1, 8001))
+
+
+def test_one_client_shared_by_many_threads():
+    session = FakeSession()
+    client = make_client(session)
+    client.cache = None
+    results = {}
+
+    def worker(t):
+        for i in range(25):
+            n = t * 100 + i
+            results[n] = client.call_mcp_function('wp_get_post', {'n': n})['n']
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(n == value for n, value in results.items())
+    assert len(results) == 200
+    assert len({req['id'] for req in session.posts}) == 200
+
+
+def test_mismatched_response_id_is_rejected():
+    session = FakeSession()
+    client = make_client(session)
+    answer = session._answer
+    session._answer = lambda req: dict(answer(req), id=req['id'] + 1)
+
+    try:
+        client.call_mcp_function('wp_get_post', {'n': 1})
+    except Exception as e:
+        assert 'does not match request id' in str(e)
+    else:
+        raise AssertionError("a response for another request must not be accepted")
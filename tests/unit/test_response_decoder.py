@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test AIWU MCP response decoding on recorded payloads
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.integrations.wordpress.response_decoder import (
+    decode_text, extract_json_object, extract_post_id, loads, unwrap_result
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'aiwu_responses.json')
+
+
+def load_fixture(name):
+    with open(FIXTURES, encoding='utf-8') as f:
+        return json.load(f)[name]
+
+
+def test_prefixed_ping_text():
+    site = unwrap_result(load_fixture('mcp_ping')['result'])
+    assert site['name'] == 'Example Travel Blog'
+    assert site['time'] == '2024-01-15 14:30:00'
+
+
+def test_json_listing_and_plain_text():
+    posts = unwrap_result(loads(json.dumps(load_fixture('wp_get_posts')).encode())['result'])
+    assert [post['ID'] for post in posts] == [101, 102, 103]
+
+    created = unwrap_result(load_fixture('wp_create_post')['result'])
+    assert created == 'Post created ID 104'
+    assert extract_post_id(created) == 104
+    assert extract_post_id({'ID': 7}) == 7
+
+
+def test_extractor_stops_at_the_first_complete_object():
+    assert extract_json_object('Done: {"a": {"b": 1}} and {"c": 2}') == {'a': {'b': 1}}
+    assert extract_json_object('Saved {draft} as {"id": 3}') == {'id': 3}
+    assert extract_json_object('No JSON here') is None
+    assert decode_text('12 posts deleted') == '12 posts deleted'
+    assert decode_text(' [1, 2]') == [1, 2]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test single-flight coalescing of identical concurrent MCP reads
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from tests.unit.test_mcp_batch import FakeSession, make_client
+
+
+class SlowSession(FakeSession):
+    """Holds every request until release is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def post(self, url, data=None, timeout=None):
+        self.release.wait(5)
+        return super().post(url, data=data, timeout=timeout)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+def run_concurrently(client, method, params, count):
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = client.call_mcp_function(method, params)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: client.single_flight.get_stats()['coalesced'] == count - 1)
+    client.session.release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_identical_reads_share_one_request():
+    session = SlowSession()
+    client = make_client(session)
+    client.cache = None
+
+    results = run_concurrently(client, 'mcp_ping', {}, 5)
+
+    assert len(session.posts) == 1
+    assert all(r == {'tool': 'mcp_ping', 'n': 0} for r in results)
+    # Followers get their own copy of the result
+    assert len({id(r) for r in results}) == 5
+    assert client.single_flight.get_stats() == {'executed': 1, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_followers_see_the_leaders_error():
+    session = SlowSession()
+    client = make_client(session)
+    client.session._answer = lambda req: {'jsonrpc': '2.0', 'id': req['id'],
+                                          'error': {'code': -32000, 'message': 'boom'}}
+
+    results = run_concurrently(client, 'wp_get_posts', {'limit': 5}, 3)
+
+    assert len(session.posts) == 1
+    assert all(isinstance(r, Exception) and 'boom' in str(r) for r in results)
+
+
+def test_writes_are_not_coalesced():
+    session = FakeSession()
+    client = make_client(session)
+
+    client.call_mcp_function('wp_update_post', {'ID': 1})
+    client.call_mcp_function('wp_update_post', {'ID': 1})
+
+    assert len(session.posts) == 2
+    assert client.single_flight.get_stats()['executed'] == 0